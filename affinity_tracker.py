@@ -1,97 +1,258 @@
+import sys
 import threading
-from typing import Dict, List, Tuple
-from collections import defaultdict, deque
+from bisect import bisect_left
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+from contextlib import contextmanager
+
+# Score boundaries between the affinity tiers below; a score equal to a
+# boundary falls into the lower tier (bisect_left).
+AFFINITY_TIER_THRESHOLDS = (-50, -20, 20, 50)
+AFFINITY_TIERS = (
+    ("very negative", "noticeably dismissive or sharp tone when you do engage with them"),
+    ("negative", "slightly more critical or skeptical tone when you do engage with them"),
+    ("neutral", "balanced, neutral tone"),
+    ("positive", "mildly friendly tone when you do engage with them"),
+    ("very positive", "slightly warmer tone when you do engage with them"),
+)
+
+_EMPTY_SCORES: Mapping[str, float] = MappingProxyType({})
+
+# Recent messages remembered per (agent, author)
+MESSAGE_HISTORY_SIZE = 5
+
+# Number of lock stripes; must be a power of two so _lock_for can mask the hash.
+LOCK_STRIPES = 32
+
+
+class RWLock:
+    """Reader-preferring reader/writer lock: many readers or one writer."""
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+
+    def acquire_read(self):
+        with self._cond:
+            while self._writer:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        with self._cond:
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writer = True
+
+    def release_write(self):
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    @contextmanager
+    def read(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class MessageRing:
+    """Fixed-size ring buffer holding the last MESSAGE_HISTORY_SIZE messages."""
+    __slots__ = ("buf", "count")
+
+    def __init__(self):
+        self.buf: List[str] = [""] * MESSAGE_HISTORY_SIZE
+        self.count = 0  # Total messages ever appended
+
+    def append(self, message: str):
+        self.buf[self.count % MESSAGE_HISTORY_SIZE] = message
+        self.count += 1
+
+    def tolist(self) -> List[str]:
+        """Messages oldest first."""
+        if self.count <= MESSAGE_HISTORY_SIZE:
+            return self.buf[:self.count]
+        start = self.count % MESSAGE_HISTORY_SIZE
+        return self.buf[start:] + self.buf[:start]
+
 
 class AffinityTracker:
     def __init__(self):
-        self.affinity_scores: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
-        self.message_history: Dict[str, Dict[str, deque]] = defaultdict(lambda: defaultdict(lambda: deque(maxlen=5)))
-        self.lock = threading.Lock()
+        # Copy-on-write: replaced wholesale on every update, never mutated in place
+        self.affinity_scores: Dict[str, Mapping[str, float]] = {}
+        self._swap_lock = threading.Lock()
+        # Last few messages per (agent, author), plus each agent's authors in first-seen order
+        self.message_history: Dict[Tuple[str, str], MessageRing] = {}
+        self._authors_by_agent: Dict[str, List[str]] = {}
+        # get_affinity_context output per agent, stamped with the agent's
+        # affinity version (bumped by every write to that agent's scores)
+        self._ctx_version: Dict[str, int] = {}
+        self._ctx_cache: Dict[str, Tuple[int, str]] = {}
+        # Per-agent striped reader/writer locks so handlers for unrelated agents
+        # don't contend, and prompt builders reading the same agent run concurrently
+        self._locks = [RWLock() for _ in range(LOCK_STRIPES)]
+
+    def _lock_for(self, agent_name: str) -> RWLock:
+        """Get the lock stripe guarding a single agent's state."""
+        return self._locks[hash(agent_name) & (LOCK_STRIPES - 1)]
+
+    @contextmanager
+    def _all_locks(self):
+        """Write-lock every stripe in index order (for whole-tracker operations)."""
+        for lock in self._locks:
+            lock.acquire_write()
+        try:
+            yield
+        finally:
+            for lock in reversed(self._locks):
+                lock.release_write()
+
+    @contextmanager
+    def _pair_read_locks(self, agent_a: str, agent_b: str):
+        """Read-lock the stripes for two agents in index order to avoid deadlock."""
+        stripes = sorted({hash(agent_a) & (LOCK_STRIPES - 1), hash(agent_b) & (LOCK_STRIPES - 1)})
+        for i in stripes:
+            self._locks[i].acquire_read()
+        try:
+            yield
+        finally:
+            for i in reversed(stripes):
+                self._locks[i].release_read()
+
+    def _swap_agent_scores(self, agent_name: str, scores: Optional[Dict[str, float]]):
+        """Publish a new copy of the scores with agent_name's entry replaced (or removed if None).
+
+        affinity_scores and its per-agent mappings are never mutated in place, so
+        readers can hand them out as read-only views without copying.
+        """
+        with self._swap_lock:
+            new_scores = dict(self.affinity_scores)
+            if scores is None:
+                new_scores.pop(agent_name, None)
+            else:
+                new_scores[agent_name] = MappingProxyType(scores)
+            self.affinity_scores = new_scores
 
     def load_affinity_data(self, data: Dict[str, Dict[str, float]]):
-        with self.lock:
+        with self._all_locks():
             for agent, scores in data.items():
+                agent = sys.intern(agent)
+                agent_scores = dict(self.affinity_scores.get(agent, {}))
                 for target, score in scores.items():
-                    self.affinity_scores[agent][target] = float(score)
+                    agent_scores[sys.intern(target)] = float(score)
+                self._swap_agent_scores(agent, agent_scores)
+                self._bump_version(agent)
 
-    def get_affinity_data(self) -> Dict[str, Dict[str, float]]:
-        with self.lock:
-            return {agent: dict(scores) for agent, scores in self.affinity_scores.items()}
+    def get_affinity_data(self) -> Mapping[str, Mapping[str, float]]:
+        """Read-only snapshot of all scores (agent -> target -> score)."""
+        return MappingProxyType(self.affinity_scores)
 
     def update_affinity(self, agent_name: str, target_name: str, sentiment: float):
-        with self.lock:
+        # Interned names hash and compare by identity on every later lookup
+        agent_name = sys.intern(agent_name)
+        target_name = sys.intern(target_name)
+        with self._lock_for(agent_name).write():
             sentiment = max(-10, min(10, sentiment))
-            current = self.affinity_scores[agent_name][target_name]
-            new_score = current + (sentiment * 2)
+            scores = dict(self.affinity_scores.get(agent_name, {}))
+            new_score = scores.get(target_name, 0.0) + (sentiment * 2)
             new_score = max(-100, min(100, new_score))
-            self.affinity_scores[agent_name][target_name] = new_score
+            scores[target_name] = new_score
+            self._swap_agent_scores(agent_name, scores)
+            self._bump_version(agent_name)
 
     def get_affinity(self, agent_name: str, target_name: str) -> float:
-        with self.lock:
-            return self.affinity_scores[agent_name].get(target_name, 0.0)
+        with self._lock_for(agent_name).read():
+            return self.affinity_scores.get(agent_name, {}).get(target_name, 0.0)
 
-    def get_all_affinities(self, agent_name: str) -> Dict[str, float]:
-        with self.lock:
-            return dict(self.affinity_scores[agent_name])
+    def get_all_affinities(self, agent_name: str) -> Mapping[str, float]:
+        """Read-only snapshot of one agent's scores (target -> score)."""
+        return self.affinity_scores.get(agent_name, _EMPTY_SCORES)
 
     def add_message_to_history(self, agent_name: str, author_name: str, message: str):
-        with self.lock:
-            self.message_history[agent_name][author_name].append(message)
+        agent_name = sys.intern(agent_name)
+        author_name = sys.intern(author_name)
+        with self._lock_for(agent_name).write():
+            key = (agent_name, author_name)
+            history = self.message_history.get(key)
+            if history is None:
+                history = self.message_history[key] = MessageRing()
+                self._authors_by_agent.setdefault(agent_name, []).append(author_name)
+            history.append(message)
 
     def get_message_history(self, agent_name: str, author_name: str) -> List[str]:
-        with self.lock:
-            return list(self.message_history[agent_name][author_name])
+        with self._lock_for(agent_name).read():
+            history = self.message_history.get((agent_name, author_name))
+            return history.tolist() if history is not None else []
 
     def get_all_tracked_users(self, agent_name: str) -> List[str]:
-        with self.lock:
-            return list(self.message_history[agent_name].keys())
+        with self._lock_for(agent_name).read():
+            return list(self._authors_by_agent.get(agent_name, ()))
 
     def clear_history_for_agent(self, agent_name: str):
-        with self.lock:
-            if agent_name in self.message_history:
-                del self.message_history[agent_name]
+        with self._lock_for(agent_name).write():
+            for author_name in self._authors_by_agent.pop(agent_name, ()):
+                del self.message_history[(agent_name, author_name)]
             if agent_name in self.affinity_scores:
-                del self.affinity_scores[agent_name]
+                self._swap_agent_scores(agent_name, None)
+            self._bump_version(agent_name)
+
+    def _bump_version(self, agent_name: str):
+        """Invalidate cached derived output for an agent. Caller holds its write lock."""
+        self._ctx_version[agent_name] = self._ctx_version.get(agent_name, 0) + 1
 
     def get_affinity_context(self, agent_name: str) -> str:
-        with self.lock:
-            affinities = self.affinity_scores[agent_name]
-            if not affinities:
-                return "You have not yet formed opinions about others in this channel."
-
-            context_lines = ["AFFINITY CONTEXT (minor tone adjustments - attention settings take priority):"]
-            context_lines.append("Your developed feelings toward others:")
-            for name, score in sorted(affinities.items(), key=lambda x: x[1], reverse=True):
-                if score > 50:
-                    feeling = "very positive"
-                    tone = "slightly warmer tone when you do engage with them"
-                elif score > 20:
-                    feeling = "positive"
-                    tone = "mildly friendly tone when you do engage with them"
-                elif score > -20:
-                    feeling = "neutral"
-                    tone = "balanced, neutral tone"
-                elif score > -50:
-                    feeling = "negative"
-                    tone = "slightly more critical or skeptical tone when you do engage with them"
-                else:
-                    feeling = "very negative"
-                    tone = "noticeably dismissive or sharp tone when you do engage with them"
+        with self._lock_for(agent_name).read():
+            version = self._ctx_version.get(agent_name, 0)
+            cached = self._ctx_cache.get(agent_name)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            context = self._build_affinity_context(agent_name)
+            self._ctx_cache[agent_name] = (version, context)
+            return context
+
+    def _build_affinity_context(self, agent_name: str) -> str:
+        affinities = self.affinity_scores.get(agent_name, {})
+        if not affinities:
+            return "You have not yet formed opinions about others in this channel."
 
-                context_lines.append(f"- {name}: {feeling} ({score:+.0f}) → {tone}")
+        context_lines = ["AFFINITY CONTEXT (minor tone adjustments - attention settings take priority):"]
+        context_lines.append("Your developed feelings toward others:")
+        for name, score in sorted(affinities.items(), key=lambda x: x[1], reverse=True):
+            feeling, tone = AFFINITY_TIERS[bisect_left(AFFINITY_TIER_THRESHOLDS, score)]
+            context_lines.append(f"- {name}: {feeling} ({score:+.0f}) → {tone}")
 
-            context_lines.append("\nIMPORTANT: These are subtle tone adjustments only. Your attention settings determine WHO you engage with and HOW OFTEN.")
-            return "\n".join(context_lines)
+        context_lines.append("\nIMPORTANT: These are subtle tone adjustments only. Your attention settings determine WHO you engage with and HOW OFTEN.")
+        return "\n".join(context_lines)
 
     def reset_all_affinities(self):
-        with self.lock:
-            self.affinity_scores.clear()
+        with self._all_locks():
+            with self._swap_lock:
+                self.affinity_scores = {}
             self.message_history.clear()
+            self._authors_by_agent.clear()
+            self._ctx_cache.clear()
 
     def get_top_allies(self, agent_name: str, n: int = 3) -> List[Tuple[str, float]]:
         """Get the top N entities this agent has positive affinity toward."""
-        with self.lock:
-            affinities = self.affinity_scores[agent_name]
+        with self._lock_for(agent_name).read():
+            affinities = self.affinity_scores.get(agent_name, {})
             if not affinities:
                 return []
             sorted_affinities = sorted(affinities.items(), key=lambda x: x[1], reverse=True)
@@ -99,8 +260,8 @@ class AffinityTracker:
 
     def get_top_enemies(self, agent_name: str, n: int = 3) -> List[Tuple[str, float]]:
         """Get the top N entities this agent has negative affinity toward."""
-        with self.lock:
-            affinities = self.affinity_scores[agent_name]
+        with self._lock_for(agent_name).read():
+            affinities = self.affinity_scores.get(agent_name, {})
             if not affinities:
                 return []
             sorted_affinities = sorted(affinities.items(), key=lambda x: x[1])
@@ -108,8 +269,8 @@ class AffinityTracker:
 
     def get_relationship_summary(self, agent_name: str) -> str:
         """Get a formatted summary of an agent's relationships for Tribal Council."""
-        with self.lock:
-            affinities = self.affinity_scores[agent_name]
+        with self._lock_for(agent_name).read():
+            affinities = self.affinity_scores.get(agent_name, {})
             if not affinities:
                 return f"{agent_name} has not formed any opinions about others yet."
 
@@ -146,7 +307,7 @@ class AffinityTracker:
 
     def get_mutual_affinity(self, agent_a: str, agent_b: str) -> Tuple[float, float]:
         """Get the mutual affinity between two agents (A->B, B->A)."""
-        with self.lock:
-            a_to_b = self.affinity_scores[agent_a].get(agent_b, 0.0)
-            b_to_a = self.affinity_scores[agent_b].get(agent_a, 0.0)
+        with self._pair_read_locks(agent_a, agent_b):
+            a_to_b = self.affinity_scores.get(agent_a, {}).get(agent_b, 0.0)
+            b_to_a = self.affinity_scores.get(agent_b, {}).get(agent_a, 0.0)
             return (a_to_b, b_to_a)
@@ -8,7 +8,7 @@ from .game_context import GameContextManager, game_context_manager, AgentGameSta
 from .game_prompts import get_game_prompt, get_game_settings, GAME_PROMPTS, GAME_SETTINGS
 from .game_manager import GameManager, game_manager, GameRecord
 from .auto_play_config import AutoPlayConfig, AutoPlayManager, autoplay_manager
-from .tool_schemas import get_tools_for_context, convert_tool_call_to_message, CHAT_MODE_TOOLS, GAME_MODE_TOOLS
+from .tool_schemas import get_tools_for_context, get_tools_json_for_context, convert_tool_call_to_message, validate_tool_args, CHAT_MODE_TOOLS, GAME_MODE_TOOLS
 
 # Game adapters require discord, so import conditionally
 try:
@@ -68,7 +68,9 @@ __all__ = [
     'GameOrchestrator',
     'GameSession',
     'get_tools_for_context',
+    'get_tools_json_for_context',
     'convert_tool_call_to_message',
+    'validate_tool_args',
     'CHAT_MODE_TOOLS',
     'GAME_MODE_TOOLS',
     'InterdimensionalCableGame',
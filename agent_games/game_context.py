@@ -12,6 +12,7 @@ from typing import Dict, Optional, Any
 from dataclasses import dataclass, asdict
 
 from .game_prompts import get_game_prompt, get_game_settings
+from .tool_schemas import GameKind, game_kind_for
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,7 @@ class AgentGameState:
     # Game-specific additions
     game_prompt: str
     in_game: bool = True
+    game_kind: Optional[GameKind] = None  # Resolved from game_name for tool lookup
 
     # Dynamic game state (updated during gameplay)
     legal_moves: Optional[list] = None  # For chess: list of UCI move strings
@@ -91,7 +93,8 @@ class GameContextManager:
             original_max_tokens=agent.max_tokens,
             original_vector_store=agent.vector_store,  # Save to restore later
             game_prompt=get_game_prompt(game_name, agent_name, opponent_name, **game_params),
-            in_game=True
+            in_game=True,
+            game_kind=game_kind_for(game_name)
         )
 
         # Store state
@@ -4,21 +4,69 @@ Game Manager
 Handles game lifecycle, history tracking, and auto-play logic for agent games.
 """
 
+import functools
 import json
 import os
 import logging
 import time
 import random
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+import mmap
+import sys
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from itertools import islice
+from typing import Deque, Dict, FrozenSet, Iterator, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 
+# orjson is several times faster than stdlib json for the history files
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads  # Also parses memoryviews in place, without a copy
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def _loads(data: Any) -> Any:
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+@contextmanager
+def _map_file(path: str) -> Iterator[Tuple[Any, memoryview]]:
+    """Map a file read-only; yields (searchable buffer, memoryview) for zero-copy parsing."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b"", memoryview(b"")  # Empty files can't be mapped
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                yield mm, view
+
 logger = logging.getLogger(__name__)
 
+# Number of appended log records after which the log is folded into the snapshot
+COMPACT_THRESHOLD = 200
+
+# Most recent games kept in memory; older ones live only in the archive file
+MAX_HISTORY_IN_MEMORY = 5000
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_model_name(model: str) -> str:
+    """Extract the core model name for grouping (e.g., 'gpt-4.1-mini' from 'openai/gpt-4.1-mini')."""
+    if '/' in model:
+        return sys.intern(model.split('/')[-1])
+    return sys.intern(model)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GameRecord:
-    """Record of a completed game."""
+    """Record of a completed game (immutable once recorded)."""
     game_id: str
     game_name: str
     players: List[str]  # Agent names
@@ -30,52 +78,216 @@ class GameRecord:
     outcome: str  # "win", "tie", "timeout"
     player_models: Optional[Dict[str, str]] = None  # Maps agent name -> model (for LLM benchmarking)
     winner_model: Optional[str] = None  # Model of the winner (for quick lookups)
+    # Derived, not persisted: normalized names of every model that played
+    normalized_models: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
+    # Derived, not persisted: the serialized form, built once since records are immutable
+    _as_dict: Dict[str, Any] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Intern names: the same few strings key every stats dict
+        object.__setattr__(self, "game_name", sys.intern(self.game_name))
+        object.__setattr__(self, "players", [sys.intern(p) for p in self.players])
+        if self.winner:
+            object.__setattr__(self, "winner", sys.intern(self.winner))
+        if self.winner_model:
+            object.__setattr__(self, "winner_model", sys.intern(self.winner_model))
+        if self.player_models:
+            object.__setattr__(self, "player_models", {
+                sys.intern(player): sys.intern(model) for player, model in self.player_models.items()
+            })
+            object.__setattr__(self, "normalized_models", frozenset(
+                _normalize_model_name(model) for model in self.player_models.values()
+            ))
+        object.__setattr__(self, "_as_dict", {
+            "game_id": self.game_id,
+            "game_name": self.game_name,
+            "players": self.players,
+            "winner": self.winner,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration": self.duration,
+            "moves_count": self.moves_count,
+            "outcome": self.outcome,
+            "player_models": self.player_models,
+            "winner_model": self.winner_model,
+        })
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the persisted fields of this record (shared, do not mutate)."""
+        return self._as_dict
 
 
 class GameManager:
     """Manages game lifecycle and history."""
 
-    def __init__(self, history_file: str = "config/game_history.json"):
+    def __init__(self, history_file: str = "config/game_history.json",
+                 max_in_memory: int = MAX_HISTORY_IN_MEMORY):
         """
         Initialize game manager.
 
         Args:
-            history_file: Path to game history JSON file
+            history_file: Path to game history JSON file. New records are
+                appended to an adjacent ``.log`` file (one JSON record per
+                line) and periodically compacted into this snapshot.
+            max_in_memory: Number of most recent games kept in memory. Older
+                games are moved to an adjacent ``.archive`` file; they still
+                count towards all stats.
         """
         self.history_file = history_file
-        self.game_history: List[GameRecord] = []
+        self.log_file = history_file + ".log"
+        self.archive_file = history_file + ".archive"
+        self.game_history: Deque[GameRecord] = deque(maxlen=max_in_memory)
         self.active_games: Dict[str, Any] = {}  # game_id -> game_state
+        self._log_handle = None
+        self._log_records = 0  # Records in the log not yet compacted
+        self._dir_ensured = False
+        # True while game_history is in non-decreasing end_time order (the normal
+        # case, since games are recorded as they finish); enables O(limit) recency
+        self._history_ordered = True
+        self._reset_aggregates()
 
         self._load_history()
 
+    def _read_records(self, path: str) -> List[GameRecord]:
+        """Read records from a newline-delimited JSON file, skipping torn lines."""
+        records = []
+        with _map_file(path) as (buf, view):
+            start, size = 0, len(view)
+            while start < size:
+                end = buf.find(b"\n", start)
+                if end == -1:
+                    end = size
+                if end > start:
+                    try:
+                        records.append(GameRecord(**_loads(view[start:end])))
+                    except (ValueError, TypeError) as e:
+                        # A torn final write from a crash - skip it
+                        logger.warning(f"[GameManager] Skipping corrupt entry in {path}: {e}")
+                start = end + 1
+        return records
+
     def _load_history(self):
-        """Load game history from JSON file."""
+        """Load game history: the cold archive, then the JSON snapshot, then the append log."""
+        self.game_history.clear()
+        self._history_ordered = True
+        self._reset_aggregates()
+
+        # Archived games only feed the stats; they stay on disk
+        archived_ids = set()
+        try:
+            if os.path.exists(self.archive_file):
+                for record in self._read_records(self.archive_file):
+                    archived_ids.add(record.game_id)
+                    self._apply_to_aggregates(record)
+        except Exception as e:
+            logger.error(f"[GameManager] Error loading history archive: {e}", exc_info=True)
+
+        snapshot: List[GameRecord] = []
         try:
             if os.path.exists(self.history_file):
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.game_history = [
-                        GameRecord(**record) for record in data.get('games', [])
-                    ]
-                logger.info(f"[GameManager] Loaded {len(self.game_history)} game records")
-            else:
-                self.game_history = []
-                logger.info(f"[GameManager] No existing history, starting fresh")
+                with _map_file(self.history_file) as (_, view):
+                    data = _loads(view)
+                    snapshot = [GameRecord(**record) for record in data.get('games', [])]
         except Exception as e:
             logger.error(f"[GameManager] Error loading history: {e}", exc_info=True)
-            self.game_history = []
+            snapshot = []
+
+        for record in snapshot:
+            if record.game_id not in archived_ids:
+                self._add_record(record)
+
+        self._log_records = 0
+        try:
+            if os.path.exists(self.log_file):
+                # Records already in the snapshot or archive (crash between compaction steps)
+                seen_ids = archived_ids.union(record.game_id for record in snapshot)
+                for record in self._read_records(self.log_file):
+                    self._log_records += 1
+                    if record.game_id not in seen_ids:
+                        self._add_record(record)
+        except Exception as e:
+            logger.error(f"[GameManager] Error replaying history log: {e}", exc_info=True)
+
+        if self._total_games:
+            logger.info(f"[GameManager] Loaded {self._total_games} game records "
+                        f"({len(self.game_history)} in memory)")
+        else:
+            logger.info(f"[GameManager] No existing history, starting fresh")
+
+    def _add_record(self, record: GameRecord):
+        """Add a record to the in-memory history and aggregates, archiving any evicted record."""
+        if len(self.game_history) == self.game_history.maxlen:
+            self._archive_record(self.game_history[0])
+        if self.game_history and record.end_time < self.game_history[-1].end_time:
+            self._history_ordered = False
+        self.game_history.append(record)
+        self._apply_to_aggregates(record)
+
+    def _archive_record(self, record: GameRecord):
+        """Durably append a record about to be evicted from memory to the cold archive."""
+        try:
+            self._ensure_dir()
+            with open(self.archive_file, 'ab') as f:
+                f.write(_dumps(record.to_dict()) + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            logger.error(f"[GameManager] Error archiving game record: {e}", exc_info=True)
+
+    def _ensure_dir(self):
+        """Create the history directory on first write only."""
+        if not self._dir_ensured:
+            history_dir = os.path.dirname(self.history_file)
+            if history_dir:
+                os.makedirs(history_dir, exist_ok=True)
+            self._dir_ensured = True
+
+    def _append_to_log(self, record: GameRecord):
+        """Durably append a single record to the history log."""
+        try:
+            if self._log_handle is None:
+                self._ensure_dir()
+                self._log_handle = open(self.log_file, 'ab')
+            self._log_handle.write(_dumps(record.to_dict()) + b"\n")
+            self._log_handle.flush()
+            os.fsync(self._log_handle.fileno())
+            self._log_records += 1
+        except Exception as e:
+            logger.error(f"[GameManager] Error appending to history log: {e}", exc_info=True)
+
+    def compact(self):
+        """Fold the append log into the JSON snapshot and truncate the log."""
+        if not self._save_history():
+            return  # Keep the log so no records are lost
+        try:
+            if self._log_handle is not None:
+                self._log_handle.close()
+                self._log_handle = None
+            if os.path.exists(self.log_file):
+                os.remove(self.log_file)
+            self._log_records = 0
+        except Exception as e:
+            logger.error(f"[GameManager] Error truncating history log: {e}", exc_info=True)
 
-    def _save_history(self):
-        """Save game history to JSON file."""
+    def _save_history(self) -> bool:
+        """Save the full game history snapshot to JSON file."""
+        tmp_file = self.history_file + ".tmp"
         try:
-            os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'games': [asdict(record) for record in self.game_history]
-                }, f, indent=2)
+            self._ensure_dir()
+            # Write a temp file and atomically swap it in, so a crash mid-write
+            # can never leave a truncated snapshot behind
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps({
+                    'games': [record.to_dict() for record in self.game_history]
+                }))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.history_file)
             logger.info(f"[GameManager] Saved {len(self.game_history)} game records")
+            return True
         except Exception as e:
             logger.error(f"[GameManager] Error saving history: {e}", exc_info=True)
+            return False
 
     def record_game(
         self,
@@ -125,12 +337,136 @@ class GameManager:
             winner_model=winner_model
         )
 
-        self.game_history.append(record)
-        self._save_history()
+        self._add_record(record)
+        self._append_to_log(record)
+        if self._log_records >= COMPACT_THRESHOLD:
+            self.compact()
 
         logger.info(f"[GameManager] Recorded {game_name}: {players} - Winner: {winner} - Outcome: {outcome}")
         return record
 
+    def _reset_aggregates(self):
+        """Reset the incrementally maintained stats aggregates."""
+        self._stats_by_game: Dict[str, Dict[str, Any]] = {}  # game_name -> totals
+        self._stats_by_agent: Dict[str, Dict[str, Any]] = {}  # agent -> totals
+        self._h2h: Dict[Tuple[str, str], Dict[str, Any]] = {}  # sorted agent pair -> totals
+        self._stats_by_model: Dict[str, Dict[str, Any]] = {}  # normalized model -> totals
+        self._model_stats_by_game: Dict[str, Dict[str, Dict[str, Any]]] = {}  # game_name -> model -> totals
+        # Reverse indices of record sequence numbers (0 = oldest ever recorded)
+        self._total_games = 0
+        self._games_by_game_name: Dict[str, List[int]] = {}
+        self._games_by_agent: Dict[str, List[int]] = {}
+        self._games_by_model: Dict[str, List[int]] = {}  # normalized model -> indices
+
+    def _apply_to_aggregates(self, game: GameRecord):
+        """Fold the next game record into the stats aggregates in O(players)."""
+        index = self._total_games
+        self._total_games += 1
+        is_tie = game.outcome == "tie"
+        players = list(dict.fromkeys(game.players))  # Unique, in order
+
+        self._games_by_game_name.setdefault(game.game_name, []).append(index)
+        for agent in players:
+            self._games_by_agent.setdefault(agent, []).append(index)
+        if game.normalized_models:
+            for model_name in game.normalized_models:
+                self._games_by_model.setdefault(model_name, []).append(index)
+
+        # Per-game totals
+        game_stats = self._stats_by_game.get(game.game_name)
+        if game_stats is None:
+            game_stats = self._stats_by_game[game.game_name] = {
+                "total_games": 0, "wins_by_agent": {}, "total_duration": 0,
+                "total_moves": 0, "ties": 0, "timeouts": 0
+            }
+        game_stats["total_games"] += 1
+        if game.winner:
+            wins_by_agent = game_stats["wins_by_agent"]
+            wins_by_agent[game.winner] = wins_by_agent.get(game.winner, 0) + 1
+        game_stats["total_duration"] += game.duration
+        game_stats["total_moves"] += game.moves_count
+        if is_tie:
+            game_stats["ties"] += 1
+        elif game.outcome == "timeout":
+            game_stats["timeouts"] += 1
+
+        # Per-agent totals
+        for agent in players:
+            agent_stats = self._stats_by_agent.get(agent)
+            if agent_stats is None:
+                agent_stats = self._stats_by_agent[agent] = {
+                    "total_games": 0, "wins": 0, "ties": 0, "games_by_type": {}
+                }
+            agent_stats["total_games"] += 1
+            if game.winner == agent:
+                agent_stats["wins"] += 1
+            if is_tie:
+                agent_stats["ties"] += 1
+            by_type = agent_stats["games_by_type"]
+            by_type[game.game_name] = by_type.get(game.game_name, 0) + 1
+
+        # Head-to-head totals per unordered pair of players
+        for i, agent1 in enumerate(players):
+            for agent2 in players[i + 1:]:
+                key = (agent1, agent2) if agent1 <= agent2 else (agent2, agent1)
+                pair_stats = self._h2h.get(key)
+                if pair_stats is None:
+                    pair_stats = self._h2h[key] = {
+                        "total_games": 0, "wins": {}, "ties": 0, "games_by_type": {}
+                    }
+                pair_stats["total_games"] += 1
+                if game.winner:
+                    pair_stats["wins"][game.winner] = pair_stats["wins"].get(game.winner, 0) + 1
+                if is_tie:
+                    pair_stats["ties"] += 1
+                by_type = pair_stats["games_by_type"]
+                by_type[game.game_name] = by_type.get(game.game_name, 0) + 1
+
+        if not game.player_models:
+            return  # No model info for benchmarking
+
+        winner_normalized = _normalize_model_name(game.winner_model) if game.winner_model else None
+
+        # Single pass over the seats feeds both the per-game-per-model totals
+        # (every seat counted) and the per-model totals (each model once per game)
+        game_models = self._model_stats_by_game.setdefault(game.game_name, {})
+        models_counted = set()
+        for player, model in game.player_models.items():
+            model_name = _normalize_model_name(model)
+            if is_tie:
+                result = "ties"
+            elif winner_normalized == model_name:
+                result = "wins"
+            else:
+                result = "losses"
+
+            seat_stats = game_models.get(model_name)
+            if seat_stats is None:
+                seat_stats = game_models[model_name] = {
+                    "total_games": 0, "wins": 0, "losses": 0, "ties": 0, "total_moves": 0
+                }
+            seat_stats["total_games"] += 1
+            seat_stats["total_moves"] += game.moves_count
+            seat_stats[result] += 1
+
+            if model_name in models_counted:
+                continue
+            models_counted.add(model_name)
+            model_stats = self._stats_by_model.get(model_name)
+            if model_stats is None:
+                model_stats = self._stats_by_model[model_name] = {
+                    "wins": 0, "losses": 0, "ties": 0, "total_games": 0,
+                    "total_duration": 0, "games_by_type": {}
+                }
+            by_type = model_stats["games_by_type"].get(game.game_name)
+            if by_type is None:
+                by_type = model_stats["games_by_type"][game.game_name] = {"wins": 0, "losses": 0, "ties": 0, "total": 0}
+            model_stats["total_games"] += 1
+            model_stats["total_duration"] += game.duration
+            model_stats[result] += 1
+            by_type["total"] += 1
+            by_type[result] += 1
+
     def get_stats_by_game(self, game_name: str) -> Dict[str, Any]:
         """
         Get statistics for a specific game.
@@ -141,9 +477,9 @@ class GameManager:
         Returns:
             Dictionary with stats
         """
-        games = [g for g in self.game_history if g.game_name == game_name]
+        game_stats = self._stats_by_game.get(game_name)
 
-        if not games:
+        if not game_stats:
             return {
                 "total_games": 0,
                 "wins_by_agent": {},
@@ -151,18 +487,14 @@ class GameManager:
                 "avg_moves": 0
             }
 
-        wins_by_agent = {}
-        for game in games:
-            if game.winner:
-                wins_by_agent[game.winner] = wins_by_agent.get(game.winner, 0) + 1
-
+        total = game_stats["total_games"]
         return {
-            "total_games": len(games),
-            "wins_by_agent": wins_by_agent,
-            "avg_duration": sum(g.duration for g in games) / len(games),
-            "avg_moves": sum(g.moves_count for g in games) / len(games),
-            "ties": sum(1 for g in games if g.outcome == "tie"),
-            "timeouts": sum(1 for g in games if g.outcome == "timeout")
+            "total_games": total,
+            "wins_by_agent": dict(game_stats["wins_by_agent"]),
+            "avg_duration": game_stats["total_duration"] / total,
+            "avg_moves": game_stats["total_moves"] / total,
+            "ties": game_stats["ties"],
+            "timeouts": game_stats["timeouts"]
         }
 
     def get_agent_stats(self, agent_name: str) -> Dict[str, Any]:
@@ -175,9 +507,9 @@ class GameManager:
         Returns:
             Dictionary with stats
         """
-        agent_games = [g for g in self.game_history if agent_name in g.players]
+        agent_stats = self._stats_by_agent.get(agent_name)
 
-        if not agent_games:
+        if not agent_stats:
             return {
                 "total_games": 0,
                 "wins": 0,
@@ -187,21 +519,17 @@ class GameManager:
                 "games_by_type": {}
             }
 
-        wins = sum(1 for g in agent_games if g.winner == agent_name)
-        ties = sum(1 for g in agent_games if g.outcome == "tie")
-        losses = len(agent_games) - wins - ties
-
-        games_by_type = {}
-        for game in agent_games:
-            games_by_type[game.game_name] = games_by_type.get(game.game_name, 0) + 1
+        total = agent_stats["total_games"]
+        wins = agent_stats["wins"]
+        ties = agent_stats["ties"]
 
         return {
-            "total_games": len(agent_games),
+            "total_games": total,
             "wins": wins,
-            "losses": losses,
+            "losses": total - wins - ties,
             "ties": ties,
-            "win_rate": (wins / len(agent_games) * 100) if agent_games else 0.0,
-            "games_by_type": games_by_type
+            "win_rate": wins / total * 100,
+            "games_by_type": dict(agent_stats["games_by_type"])
         }
 
     def get_head_to_head(self, agent1: str, agent2: str) -> Dict[str, Any]:
@@ -215,12 +543,20 @@ class GameManager:
         Returns:
             Dictionary with head-to-head stats
         """
-        h2h_games = [
-            g for g in self.game_history
-            if agent1 in g.players and agent2 in g.players
-        ]
+        if agent1 == agent2:
+            # Every game the agent played counts as a "head-to-head" with itself
+            agent_stats = self._stats_by_agent.get(agent1)
+            pair_stats = agent_stats and {
+                "total_games": agent_stats["total_games"],
+                "wins": {agent1: agent_stats["wins"]},
+                "ties": agent_stats["ties"],
+                "games_by_type": agent_stats["games_by_type"]
+            }
+        else:
+            key = (agent1, agent2) if agent1 <= agent2 else (agent2, agent1)
+            pair_stats = self._h2h.get(key)
 
-        if not h2h_games:
+        if not pair_stats:
             return {
                 "total_games": 0,
                 f"{agent1}_wins": 0,
@@ -228,27 +564,14 @@ class GameManager:
                 "ties": 0
             }
 
-        agent1_wins = sum(1 for g in h2h_games if g.winner == agent1)
-        agent2_wins = sum(1 for g in h2h_games if g.winner == agent2)
-        ties = sum(1 for g in h2h_games if g.outcome == "tie")
-
         return {
-            "total_games": len(h2h_games),
-            f"{agent1}_wins": agent1_wins,
-            f"{agent2}_wins": agent2_wins,
-            "ties": ties,
-            "games_by_type": {
-                game_name: len([g for g in h2h_games if g.game_name == game_name])
-                for game_name in set(g.game_name for g in h2h_games)
-            }
+            "total_games": pair_stats["total_games"],
+            f"{agent1}_wins": pair_stats["wins"].get(agent1, 0),
+            f"{agent2}_wins": pair_stats["wins"].get(agent2, 0),
+            "ties": pair_stats["ties"],
+            "games_by_type": dict(pair_stats["games_by_type"])
         }
 
-    def _normalize_model_name(self, model: str) -> str:
-        """Extract the core model name for grouping (e.g., 'gpt-4.1-mini' from 'openai/gpt-4.1-mini')."""
-        if '/' in model:
-            return model.split('/')[-1]
-        return model
-
     def get_model_stats(self, model: str) -> Dict[str, Any]:
         """
         Get statistics for a specific model across all games.
@@ -259,58 +582,36 @@ class GameManager:
         Returns:
             Dictionary with model stats
         """
-        model_normalized = self._normalize_model_name(model)
-
-        # Find all games where this model participated
-        model_games = []
-        wins = 0
-        losses = 0
-        ties = 0
-        games_by_type: Dict[str, Dict[str, int]] = {}  # game_name -> {wins, losses, ties}
-
-        for game in self.game_history:
-            if not game.player_models:
-                continue  # Skip games without model info
-
-            # Check if this model participated
-            participating = False
-            for player, player_model in game.player_models.items():
-                if self._normalize_model_name(player_model) == model_normalized:
-                    participating = True
-                    break
-
-            if not participating:
-                continue
-
-            model_games.append(game)
+        return self._project_model_stats(model, self._stats_by_model.get(_normalize_model_name(model)))
 
-            # Track per-game stats
-            if game.game_name not in games_by_type:
-                games_by_type[game.game_name] = {"wins": 0, "losses": 0, "ties": 0, "total": 0}
-            games_by_type[game.game_name]["total"] += 1
-
-            if game.outcome == "tie":
-                ties += 1
-                games_by_type[game.game_name]["ties"] += 1
-            elif game.winner_model and self._normalize_model_name(game.winner_model) == model_normalized:
-                wins += 1
-                games_by_type[game.game_name]["wins"] += 1
-            else:
-                losses += 1
-                games_by_type[game.game_name]["losses"] += 1
+    def _project_model_stats(self, model: str, model_stats: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the get_model_stats result from a model's aggregate totals."""
+        if not model_stats:
+            return {
+                "model": model,
+                "total_games": 0,
+                "wins": 0,
+                "losses": 0,
+                "ties": 0,
+                "win_rate": 0.0,
+                "games_by_type": {},
+                "avg_duration": 0,
+            }
 
-        total_games = len(model_games)
-        win_rate = (wins / total_games * 100) if total_games > 0 else 0.0
+        total_games = model_stats["total_games"]
 
         return {
             "model": model,
             "total_games": total_games,
-            "wins": wins,
-            "losses": losses,
-            "ties": ties,
-            "win_rate": win_rate,
-            "games_by_type": games_by_type,
-            "avg_duration": sum(g.duration for g in model_games) / len(model_games) if model_games else 0,
+            "wins": model_stats["wins"],
+            "losses": model_stats["losses"],
+            "ties": model_stats["ties"],
+            "win_rate": model_stats["wins"] / total_games * 100,
+            "games_by_type": {
+                game_name: dict(by_type)
+                for game_name, by_type in model_stats["games_by_type"].items()
+            },
+            "avg_duration": model_stats["total_duration"] / total_games,
         }
 
     def get_all_model_stats(self) -> Dict[str, Dict[str, Any]]:
@@ -320,15 +621,10 @@ class GameManager:
         Returns:
             Dictionary mapping model name to stats
         """
-        # Collect all unique models
-        all_models = set()
-        for game in self.game_history:
-            if game.player_models:
-                for model in game.player_models.values():
-                    all_models.add(self._normalize_model_name(model))
-
-        # Get stats for each model
-        return {model: self.get_model_stats(model) for model in sorted(all_models)}
+        return {
+            model: self._project_model_stats(model, self._stats_by_model[model])
+            for model in sorted(self._stats_by_model)
+        }
 
     def get_model_stats_by_game(self, game_name: str) -> Dict[str, Dict[str, Any]]:
         """
@@ -340,42 +636,14 @@ class GameManager:
         Returns:
             Dictionary mapping model name to stats for that game
         """
-        games = [g for g in self.game_history if g.game_name == game_name and g.player_models]
-
-        if not games:
-            return {}
-
-        # Collect stats per model
         model_stats: Dict[str, Dict[str, Any]] = {}
 
-        for game in games:
-            for player, model in game.player_models.items():
-                model_name = self._normalize_model_name(model)
-
-                if model_name not in model_stats:
-                    model_stats[model_name] = {
-                        "total_games": 0,
-                        "wins": 0,
-                        "losses": 0,
-                        "ties": 0,
-                        "total_moves": 0,
-                    }
-
-                model_stats[model_name]["total_games"] += 1
-                model_stats[model_name]["total_moves"] += game.moves_count
-
-                if game.outcome == "tie":
-                    model_stats[model_name]["ties"] += 1
-                elif game.winner_model and self._normalize_model_name(game.winner_model) == model_name:
-                    model_stats[model_name]["wins"] += 1
-                else:
-                    model_stats[model_name]["losses"] += 1
-
-        # Calculate win rates
-        for model_name, stats in model_stats.items():
+        for model_name, seat_stats in self._model_stats_by_game.get(game_name, {}).items():
+            stats = dict(seat_stats)
             total = stats["total_games"]
             stats["win_rate"] = (stats["wins"] / total * 100) if total > 0 else 0.0
             stats["avg_moves"] = stats["total_moves"] / total if total > 0 else 0
+            model_stats[model_name] = stats
 
         return model_stats
 
@@ -410,11 +678,43 @@ class GameManager:
         Returns:
             List of GameRecord objects
         """
+        if limit <= 0:
+            return []
+        if self._history_ordered:
+            # History is in end_time order, so the newest games are the tail
+            return list(islice(reversed(self.game_history), limit))
         return sorted(self.game_history, key=lambda g: g.end_time, reverse=True)[:limit]
 
+    def _records_at(self, indices: List[int]) -> List[GameRecord]:
+        """Map record sequence numbers to in-memory records, dropping archived ones."""
+        base = self._total_games - len(self.game_history)
+        start = bisect_left(indices, base)
+        return [self.game_history[i - base] for i in indices[start:]]
+
+    def get_total_games(self) -> int:
+        """Get the number of games ever recorded, including archived ones."""
+        return self._total_games
+
+    def get_game_names(self) -> List[str]:
+        """Get the names of all game types that have been played, sorted."""
+        return sorted(self._games_by_game_name)
+
+    def get_games_for_game(self, game_name: str) -> List[GameRecord]:
+        """Get the in-memory games of one type, oldest first."""
+        return self._records_at(self._games_by_game_name.get(game_name, []))
+
+    def get_games_for_agent(self, agent_name: str) -> List[GameRecord]:
+        """Get the in-memory games an agent played in, oldest first."""
+        return self._records_at(self._games_by_agent.get(agent_name, []))
+
+    def get_games_for_model(self, model: str) -> List[GameRecord]:
+        """Get the in-memory games a model played in, oldest first."""
+        indices = self._games_by_model.get(_normalize_model_name(model), [])
+        return self._records_at(indices)
+
     def get_all_history(self) -> List[GameRecord]:
-        """Get all game history."""
-        return self.game_history.copy()
+        """Get all game history held in memory (the most recent max_in_memory games)."""
+        return list(self.game_history)
 
     def clear_history(self) -> int:
         """
@@ -423,9 +723,16 @@ class GameManager:
         Returns:
             Number of records cleared
         """
-        count = len(self.game_history)
-        self.game_history = []
-        self._save_history()
+        count = self._total_games
+        self.game_history.clear()
+        self._history_ordered = True
+        self._reset_aggregates()
+        self.compact()
+        try:
+            if os.path.exists(self.archive_file):
+                os.remove(self.archive_file)
+        except Exception as e:
+            logger.error(f"[GameManager] Error removing history archive: {e}", exc_info=True)
         logger.warning(f"[GameManager] Cleared {count} game records")
         return count
 
@@ -6,8 +6,85 @@ Context-aware tool schemas that change based on agent mode:
 - Game mode: ONLY game-specific move functions
 """
 
+import json
+import logging
 import re
-from typing import Dict, List, Optional
+from enum import IntEnum
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .game_context import AgentGameState, GameContextManager
+
+logger = logging.getLogger(__name__)
+
+# orjson is several times faster than stdlib json for the request bodies
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+class _FrozenDict(dict):
+    """
+    Read-only dict for the shared schema constants. Still a real dict, so it
+    JSON-serializes as-is when sent to the API, but can't be mutated in place.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("tool schemas are read-only; copy before modifying")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __reduce__(self):
+        # copy/deepcopy/pickle rebuild via the constructor, not __setitem__
+        return (type(self), (dict(self),))
+
+
+def _freeze(obj: Any, _memo: Optional[Dict[int, Any]] = None) -> Any:
+    """
+    Recursively convert dicts to read-only dicts and lists to tuples. Objects
+    referenced from several places (shared subschemas) stay shared.
+    """
+    if not isinstance(obj, (dict, list)):
+        return obj
+    if _memo is None:
+        _memo = {}
+    frozen = _memo.get(id(obj))
+    if frozen is not None:
+        return frozen[1]
+    if isinstance(obj, dict):
+        frozen = _FrozenDict({key: _freeze(value, _memo) for key, value in obj.items()})
+    else:
+        frozen = tuple(_freeze(item, _memo) for item in obj)
+    _memo[id(obj)] = (obj, frozen)  # Keep the source alive so its id isn't reused
+    return frozen
+
+
+# Shared across the module-level constants so aliased subschemas freeze once
+_FREEZE_MEMO: Dict[int, Any] = {}
+
+# Shared "reasoning" parameters for game move tools
+_REASONING_PARAM = {
+    "type": "string",
+    "description": "REQUIRED: 1-2 sentences MAX. Your IN-CHARACTER reaction - stay in your personality, NO tactical explanations."
+}
+_REASONING_PARAM_HANGMAN = {
+    "type": "string",
+    "description": "REQUIRED: 1-2 sentences MAX. Your IN-CHARACTER reaction - stay in your personality, NO analytical explanations."
+}
+_REASONING_PARAM_GUESS = {
+    "type": "string",
+    "description": "REQUIRED: 1-2 sentences MAX. Your IN-CHARACTER reaction - stay in your personality."
+}
 
 # Chat mode tools - available during normal conversation
 CHAT_MODE_TOOLS = [
@@ -34,6 +111,8 @@ CHAT_MODE_TOOLS = [
     }
 ]
 
+CHAT_MODE_TOOLS = _freeze(CHAT_MODE_TOOLS, _FREEZE_MEMO)
+
 # Video generation tool - added dynamically when video generation is enabled
 def get_video_tool(video_duration: int = 4) -> dict:
     """Return video generation tool schema with configured duration."""
@@ -76,10 +155,7 @@ GAME_MODE_TOOLS = {
                             "minimum": 1,
                             "maximum": 9
                         },
-                        "reasoning": {
-                            "type": "string",
-                            "description": "REQUIRED: 1-2 sentences MAX. Your IN-CHARACTER reaction - stay in your personality, NO tactical explanations."
-                        }
+                        "reasoning": _REASONING_PARAM
                     },
                     "required": ["position", "reasoning"]
                 }
@@ -101,10 +177,7 @@ GAME_MODE_TOOLS = {
                             "minimum": 1,
                             "maximum": 7
                         },
-                        "reasoning": {
-                            "type": "string",
-                            "description": "REQUIRED: 1-2 sentences MAX. Your IN-CHARACTER reaction - stay in your personality, NO tactical explanations."
-                        }
+                        "reasoning": _REASONING_PARAM
                     },
                     "required": ["column", "reasoning"]
                 }
@@ -125,10 +198,7 @@ GAME_MODE_TOOLS = {
                             "description": "UCI notation move (e.g., 'e2e4', 'g1f3', 'e7e8q' for promotion)",
                             "pattern": "^[a-h][1-8][a-h][1-8][qrbn]?$"
                         },
-                        "reasoning": {
-                            "type": "string",
-                            "description": "REQUIRED: 1-2 sentences MAX. Your IN-CHARACTER reaction - stay in your personality, NO tactical explanations."
-                        }
+                        "reasoning": _REASONING_PARAM
                     },
                     "required": ["move", "reasoning"]
                 }
@@ -149,10 +219,7 @@ GAME_MODE_TOOLS = {
                             "description": "Grid coordinate (e.g., 'A5', 'D7', 'J10'). Letter A-J, number 1-10.",
                             "pattern": "^[A-Ja-j](10|[1-9])$"
                         },
-                        "reasoning": {
-                            "type": "string",
-                            "description": "REQUIRED: 1-2 sentences MAX. Your IN-CHARACTER reaction - stay in your personality, NO tactical explanations."
-                        }
+                        "reasoning": _REASONING_PARAM
                     },
                     "required": ["coordinate", "reasoning"]
                 }
@@ -173,10 +240,7 @@ GAME_MODE_TOOLS = {
                             "description": "Single letter to guess (a-z)",
                             "pattern": "^[A-Za-z]$"
                         },
-                        "reasoning": {
-                            "type": "string",
-                            "description": "REQUIRED: 1-2 sentences MAX. Your IN-CHARACTER reaction - stay in your personality, NO analytical explanations."
-                        }
+                        "reasoning": _REASONING_PARAM_HANGMAN
                     },
                     "required": ["letter", "reasoning"]
                 }
@@ -194,10 +258,7 @@ GAME_MODE_TOOLS = {
                             "type": "string",
                             "description": "Full word guess"
                         },
-                        "reasoning": {
-                            "type": "string",
-                            "description": "REQUIRED: 1-2 sentences MAX. Your IN-CHARACTER reaction - stay in your personality."
-                        }
+                        "reasoning": _REASONING_PARAM_GUESS
                     },
                     "required": ["word", "reasoning"]
                 }
@@ -218,10 +279,7 @@ GAME_MODE_TOOLS = {
                             "description": "5-letter word guess",
                             "pattern": "^[A-Za-z]{5}$"
                         },
-                        "reasoning": {
-                            "type": "string",
-                            "description": "REQUIRED: 1-2 sentences MAX. Your IN-CHARACTER reaction - stay in your personality."
-                        }
+                        "reasoning": _REASONING_PARAM_GUESS
                     },
                     "required": ["word", "reasoning"]
                 }
@@ -344,6 +402,35 @@ GAME_MODE_TOOLS = {
     ]
 }
 
+GAME_MODE_TOOLS = MappingProxyType({
+    game_name: _freeze(tools, _FREEZE_MEMO) for game_name, tools in GAME_MODE_TOOLS.items()
+})
+
+class GameKind(IntEnum):
+    """Games with move tools, resolved from the game name once on game entry."""
+    TICTACTOE = 0
+    CONNECTFOUR = 1
+    CHESS = 2
+    BATTLESHIP = 3
+    HANGMAN = 4
+    WORDLE = 5
+    TRIBAL_COUNCIL = 6
+    OTHER = 7  # Games without move tools (e.g. IDCC)
+
+
+_NAME_TO_KIND: Dict[str, GameKind] = {kind.name.lower(): kind for kind in GameKind if kind is not GameKind.OTHER}
+
+# Tool lists indexed by GameKind value
+_GAME_TOOLS_BY_KIND: Tuple[Sequence[Dict], ...] = tuple(
+    GAME_MODE_TOOLS.get(kind.name.lower(), ()) for kind in GameKind
+)
+
+
+def game_kind_for(game_name: str) -> GameKind:
+    """Map a legacy game name string to its GameKind."""
+    return _NAME_TO_KIND.get(game_name, GameKind.OTHER)
+
+
 # GameMaster-only tools for Tribal Council (not available to regular agents)
 TRIBAL_COUNCIL_GM_TOOLS = [
     {
@@ -377,15 +464,196 @@ TRIBAL_COUNCIL_GM_TOOLS = [
         }
     }
 ]
+TRIBAL_COUNCIL_GM_TOOLS = _freeze(TRIBAL_COUNCIL_GM_TOOLS, _FREEZE_MEMO)
+del _FREEZE_MEMO
+
+
+def _collect_patterns(obj: Any, out: Dict[str, "re.Pattern[str]"]) -> None:
+    """Walk a schema tree and compile every "pattern" string it declares."""
+    if isinstance(obj, dict):
+        pattern = obj.get("pattern")
+        if isinstance(pattern, str) and pattern not in out:
+            out[pattern] = re.compile(pattern)
+        for value in obj.values():
+            _collect_patterns(value, out)
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            _collect_patterns(item, out)
+
+
+# Every schema "pattern", compiled once at import for argument validation
+_COMPILED_PATTERNS: Dict[str, "re.Pattern[str]"] = {}
+_collect_patterns(CHAT_MODE_TOOLS, _COMPILED_PATTERNS)
+_collect_patterns(tuple(GAME_MODE_TOOLS.values()), _COMPILED_PATTERNS)
+_collect_patterns(TRIBAL_COUNCIL_GM_TOOLS, _COMPILED_PATTERNS)
+
+
+def get_compiled_pattern(pattern: str) -> "re.Pattern[str]":
+    """
+    Get the compiled regex for a schema "pattern" string. Patterns declared in
+    the module schemas are precompiled; anything else is compiled and kept.
+    """
+    compiled = _COMPILED_PATTERNS.get(pattern)
+    if compiled is None:
+        compiled = _COMPILED_PATTERNS[pattern] = re.compile(pattern)
+    return compiled
+
+
+# JSON Schema type -> Python types accepted for it (bool is excluded from numbers below)
+_JSON_TYPES: Dict[str, Tuple[type, ...]] = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "object": (dict,),
+    "array": (list, tuple),
+}
+
+ToolValidator = Callable[[Dict], Optional[str]]
+
+
+def _compile_validator(parameters: Dict) -> ToolValidator:
+    """
+    Specialize a tool's "parameters" schema into a flat check function, once.
+    Covers the keywords the tool schemas use: required, type, enum,
+    minimum/maximum and pattern. Returns an error string, or None if valid.
+    """
+    required = tuple(parameters.get("required", ()))
+    checks = []
+    for name, prop in parameters.get("properties", {}).items():
+        types = _JSON_TYPES.get(prop.get("type"))
+        enum = frozenset(prop["enum"]) if "enum" in prop else None
+        pattern = get_compiled_pattern(prop["pattern"]) if "pattern" in prop else None
+        checks.append((name, types, enum, prop.get("minimum"), prop.get("maximum"), pattern))
+    checks = tuple(checks)
+
+    def validate(args: Dict) -> Optional[str]:
+        if not isinstance(args, dict):
+            return "arguments must be an object"
+        for key in required:
+            if key not in args:
+                return f"missing required argument '{key}'"
+        for name, types, enum, minimum, maximum, pattern in checks:
+            if name not in args:
+                continue
+            value = args[name]
+            if types is not None and (not isinstance(value, types) or (isinstance(value, bool) and bool not in types)):
+                return f"'{name}' has the wrong type"
+            if enum is not None and value not in enum:
+                return f"'{name}' must be one of {sorted(enum)}"
+            if minimum is not None and value < minimum:
+                return f"'{name}' must be >= {minimum}"
+            if maximum is not None and value > maximum:
+                return f"'{name}' must be <= {maximum}"
+            if pattern is not None and not pattern.search(value):
+                return f"'{name}' does not match {pattern.pattern}"
+        return None
+
+    return validate
+
+
+def _any_validator(validators: Tuple[ToolValidator, ...]) -> ToolValidator:
+    """For tool names shared by several games: valid if any schema accepts the args."""
+    def validate(args: Dict) -> Optional[str]:
+        error = None
+        for validator in validators:
+            result = validator(args)
+            if result is None:
+                return None
+            error = error or result
+        return error
+
+    return validate
+
+
+def _build_tool_validators() -> Dict[str, ToolValidator]:
+    schemas: Dict[str, List[Dict]] = {}
+    all_tools = list(CHAT_MODE_TOOLS) + [get_video_tool()] + list(TRIBAL_COUNCIL_GM_TOOLS)
+    for tools in GAME_MODE_TOOLS.values():
+        all_tools.extend(tools)
+    for tool in all_tools:
+        function = tool["function"]
+        variants = schemas.setdefault(function["name"], [])
+        if function["parameters"] not in variants:
+            variants.append(function["parameters"])
+
+    validators = {}
+    for name, variants in schemas.items():
+        compiled = tuple(_compile_validator(parameters) for parameters in variants)
+        validators[name] = compiled[0] if len(compiled) == 1 else _any_validator(compiled)
+    return validators
+
+
+# Tool name -> specialized argument validator, built once at import
+_TOOL_VALIDATORS: Dict[str, ToolValidator] = _build_tool_validators()
+
+
+def validate_tool_args(tool_name: str, tool_args: Dict) -> Optional[str]:
+    """
+    Check tool call arguments against the tool's schema.
+
+    Returns:
+        Error message if the arguments don't match, None if they do or the
+        tool is unknown
+    """
+    validator = _TOOL_VALIDATORS.get(tool_name)
+    if validator is None:
+        return None
+    return validator(tool_args)
+
+
+# Fixed parts of the chess move description; legal moves go in between
+_CHESS_DESC_PREFIX = "Make a chess move using UCI notation. You must make a move now.\n\n**AVAILABLE LEGAL MOVES:** "
+_CHESS_DESC_SUFFIX = "\n\nChoose one of the available moves above."
+# Only the first moves are listed, to keep the description short
+_MAX_LISTED_MOVES = 50
+
+
+@lru_cache(maxsize=512)
+def _build_chess_tools(legal_moves: Tuple[str, ...]) -> Tuple[Dict, ...]:
+    """
+    Build the chess tool list with the given legal moves injected into the
+    move tool's description. Cached per move list, so repeated turns in the
+    same position (retries, re-prompts) reuse the same schema. The returned
+    dicts are shared - callers must not modify them.
+    """
+    legal_moves_str = "'" + "', '".join(legal_moves) + "'" if legal_moves else ""
+    tools = []
+    for tool in GAME_MODE_TOOLS["chess"]:
+        function = tool["function"]
+        if function["name"] == "make_chess_move":
+            function = {
+                **function,
+                "description": _CHESS_DESC_PREFIX + legal_moves_str + _CHESS_DESC_SUFFIX
+            }
+            tool = {**tool, "function": function}
+        tools.append(tool)
+    return tuple(tools)
+
+
+@lru_cache(maxsize=16)
+def _chat_tools(video_duration: int) -> Tuple[Dict, ...]:
+    """Chat mode tools plus the video tool for the given duration."""
+    return _register_serialized(CHAT_MODE_TOOLS + (_freeze(get_video_tool(video_duration)),))
+
+
+def _chess_tools(game_state: "AgentGameState", agent_name: str) -> Sequence[Dict]:
+    """Chess tools with the current legal moves injected into the move tool."""
+    if not game_state.legal_moves:
+        logger.warning(f"[ToolSchema] No legal moves available for {agent_name} - tool will not include move list!")
+        return GAME_MODE_TOOLS["chess"]
+    tools = _build_chess_tools(tuple(islice(game_state.legal_moves, _MAX_LISTED_MOVES)))
+    logger.info(f"[ToolSchema] Injected {len(game_state.legal_moves)} legal moves into chess tool for {agent_name}")
+    return tools
 
 
 def get_tools_for_context(
     agent_name: str,
-    game_context_manager=None,
+    game_context_manager: Optional["GameContextManager"] = None,
     is_spectator: bool = False,
     video_enabled: bool = False,
     video_duration: int = 4
-) -> Optional[List[Dict]]:
+) -> Sequence[Dict]:
     """
     Get appropriate tool schema based on agent's current context.
 
@@ -397,53 +665,241 @@ def get_tools_for_context(
         video_duration: Duration in seconds for video generation
 
     Returns:
-        List of tool definitions, or None if no tools should be available
+        Sequence of tool definitions. Shared and read-only - copy before modifying.
     """
-    # Build chat mode tools list (may include video tool)
-    def get_chat_tools():
-        tools = list(CHAT_MODE_TOOLS)  # Copy the base tools
-        if video_enabled:
-            tools.append(get_video_tool(video_duration))
-        return tools
-
-    # Spectators always get chat mode tools (can make images if requested by users)
-    if is_spectator:
-        return get_chat_tools()
-
-    # Check if agent is actively playing a game
-    if game_context_manager and game_context_manager.is_in_game(agent_name):
-        game_state = game_context_manager.get_game_state(agent_name)
-        if game_state:
-            game_name = game_state.game_name
-            tools = GAME_MODE_TOOLS.get(game_name, [])
-
-            # For chess, dynamically inject legal moves into tool description
-            if game_name == "chess":
-                import logging
-                logger = logging.getLogger(__name__)
-
-                if game_state.legal_moves:
-                    import copy
-                    tools = copy.deepcopy(tools)  # Don't modify original
-                    for tool in tools:
-                        if tool.get("function", {}).get("name") == "make_chess_move":
-                            legal_moves_str = ", ".join([f"'{m}'" for m in game_state.legal_moves[:50]])  # Show first 50
-                            tool["function"]["description"] = (
-                                f"Make a chess move using UCI notation. You must make a move now.\n\n"
-                                f"**AVAILABLE LEGAL MOVES:** {legal_moves_str}\n\n"
-                                f"Choose one of the available moves above."
-                            )
-                            logger.info(f"[ToolSchema] Injected {len(game_state.legal_moves)} legal moves into chess tool for {agent_name}")
-                else:
-                    logger.warning(f"[ToolSchema] No legal moves available for {agent_name} - tool will not include move list!")
-
-            return tools
-
-    # Default: chat mode tools (with video if enabled)
-    return get_chat_tools()
-
-
-def convert_tool_call_to_message(tool_name: str, tool_args: Dict) -> tuple[str, str]:
+    # Chat mode is the common case: spectators, no game manager, or not in a game
+    if is_spectator or game_context_manager is None or not game_context_manager.is_in_game(agent_name):
+        return _chat_tools(video_duration) if video_enabled else CHAT_MODE_TOOLS
+
+    game_state = game_context_manager.get_game_state(agent_name)
+    if not game_state:
+        return _chat_tools(video_duration) if video_enabled else CHAT_MODE_TOOLS
+
+    kind = game_state.game_kind
+    if kind is None:
+        kind = game_kind_for(game_state.game_name)
+    if kind is GameKind.CHESS:
+        return _chess_tools(game_state, agent_name)
+    return _GAME_TOOLS_BY_KIND[kind]
+
+
+# Wire-format JSON for the shared tool lists, keyed by id(). The entry keeps
+# a reference to the list itself so the id can't be reused by another object.
+_SERIALIZED_TOOLS: Dict[int, Tuple[Sequence[Dict], bytes]] = {}
+
+
+def _register_serialized(tools: Sequence[Dict]) -> Sequence[Dict]:
+    """Serialize a shared, read-only tool list once and remember the bytes."""
+    _SERIALIZED_TOOLS[id(tools)] = (tools, _dumps(tools))
+    return tools
+
+
+_register_serialized(CHAT_MODE_TOOLS)
+for _tools in GAME_MODE_TOOLS.values():
+    _register_serialized(_tools)
+_register_serialized(TRIBAL_COUNCIL_GM_TOOLS)
+_register_serialized(())
+
+
+def tools_to_json(tools: Sequence[Dict]) -> bytes:
+    """
+    Serialize a tool list to compact JSON bytes. Shared schema lists return
+    their precomputed bytes; anything else (e.g. chess with legal moves) is
+    serialized live.
+    """
+    entry = _SERIALIZED_TOOLS.get(id(tools))
+    if entry is not None and entry[0] is tools:
+        return entry[1]
+    return _dumps(tools)
+
+
+def get_tools_json_for_context(
+    agent_name: str,
+    game_context_manager: Optional["GameContextManager"] = None,
+    is_spectator: bool = False,
+    video_enabled: bool = False,
+    video_duration: int = 4
+) -> bytes:
+    """Same as get_tools_for_context, but returns the tool list as JSON bytes."""
+    return tools_to_json(get_tools_for_context(
+        agent_name,
+        game_context_manager,
+        is_spectator=is_spectator,
+        video_enabled=video_enabled,
+        video_duration=video_duration
+    ))
+
+
+def dump_request_with_tools(payload: Dict[str, Any], tools: Sequence[Dict]) -> bytes:
+    """
+    Serialize a chat completion request body, splicing in the tool list's
+    precomputed JSON instead of re-encoding the schemas on every request.
+    """
+    body = _dumps(payload)
+    if not tools:
+        return body
+    # payload is a JSON object, so the body always ends with "}"
+    separator = b',' if len(body) > 2 else b''
+    return body[:-1] + separator + b'"tools":' + tools_to_json(tools) + b'}'
+
+
+# Converters from tool call arguments to (move_message, commentary_message)
+
+class ToolMsg(NamedTuple):
+    """A converted tool call. Still a plain 2-tuple for `move, commentary = ...` unpacking."""
+    move: str
+    commentary: str
+
+
+# Shared result for unknown tools, so the fallback doesn't allocate
+_EMPTY_RESULT = ToolMsg("", "")
+
+
+def _convert_place_piece(tool_args: Dict) -> ToolMsg:
+    # Tic-tac-toe: position should be 1-9
+    position = str(tool_args.get("position", ""))
+    reasoning = tool_args.get("reasoning", "")
+    # Normalize: extract first digit 1-9
+    position = re.sub(r'\s+', '', position)
+    match = re.search(r'([1-9])', position)
+    if match:
+        position = match.group(1)
+    return ToolMsg(position, reasoning)
+
+
+def _convert_drop_piece(tool_args: Dict) -> ToolMsg:
+    # Connect Four: column should be 1-7
+    column = str(tool_args.get("column", ""))
+    reasoning = tool_args.get("reasoning", "")
+    # Normalize: extract first digit 1-7
+    column = re.sub(r'\s+', '', column)
+    match = re.search(r'([1-7])', column)
+    if match:
+        column = match.group(1)
+    return ToolMsg(column, reasoning)
+
+
+def _convert_chess_move(tool_args: Dict) -> ToolMsg:
+    # Chess: UCI notation like "e2e4" or "e2-e4"
+    move = str(tool_args.get("move", ""))
+    reasoning = tool_args.get("reasoning", "")
+    # Normalize: remove spaces, dashes, lowercase
+    move = re.sub(r'[\s\-]+', '', move).lower()
+    # Extract valid UCI pattern (letter+digit + letter+digit, optional promotion)
+    match = re.search(r'([a-h][1-8])([a-h][1-8])([qrbn])?', move)
+    if match:
+        move = match.group(1) + match.group(2) + (match.group(3) or '')
+    return ToolMsg(move, reasoning)
+
+
+def _convert_attack_coordinate(tool_args: Dict) -> ToolMsg:
+    # Battleship: coordinate like "a5", "j10"
+    coordinate = str(tool_args.get("coordinate", ""))
+    reasoning = tool_args.get("reasoning", "")
+    # Normalize malformed coordinates like "I a 7" -> "i7"
+    coordinate = re.sub(r'\s+', '', coordinate).lower()
+    # Extract just letter + number pattern (handles garbled input)
+    match = re.search(r'([a-j]).*?(\d{1,2})', coordinate)
+    if match:
+        coordinate = match.group(1) + match.group(2)
+    return ToolMsg(coordinate, reasoning)
+
+
+def _convert_guess_letter(tool_args: Dict) -> ToolMsg:
+    # Hangman: single letter a-z
+    letter = str(tool_args.get("letter", ""))
+    reasoning = tool_args.get("reasoning", "")
+    # Normalize: extract first letter a-z
+    letter = re.sub(r'\s+', '', letter).lower()
+    match = re.search(r'([a-z])', letter)
+    if match:
+        letter = match.group(1)
+    return ToolMsg(letter, reasoning)
+
+
+def _convert_guess_word(tool_args: Dict) -> ToolMsg:
+    # Hangman/Wordle: a word
+    word = str(tool_args.get("word", ""))
+    reasoning = tool_args.get("reasoning", "")
+    # Normalize: strip spaces, lowercase, letters only
+    word = re.sub(r'[^a-zA-Z]', '', word).lower()
+    return ToolMsg(word, reasoning)
+
+
+def _convert_generate_image(tool_args: Dict) -> ToolMsg:
+    prompt = tool_args.get("prompt", "")
+    reasoning = tool_args.get("reasoning", "")
+    return ToolMsg(f"[IMAGE] {prompt}", reasoning)
+
+
+def _convert_generate_video(tool_args: Dict) -> ToolMsg:
+    prompt = tool_args.get("prompt", "")
+    reasoning = tool_args.get("reasoning", "")
+    return ToolMsg(f"[VIDEO] {prompt}", reasoning)
+
+
+def _convert_view_system_prompt(tool_args: Dict) -> ToolMsg:
+    target = tool_args.get("target_agent", "")
+    return ToolMsg(f"[VIEW_PROMPT:{target}]", "")
+
+
+def _convert_recall_interactions(tool_args: Dict) -> ToolMsg:
+    target = tool_args.get("target_agent", "")
+    memory_type = tool_args.get("memory_type", "all")
+    return ToolMsg(f"[RECALL:{target}:{memory_type}]", "")
+
+
+def _convert_nominate_agent(tool_args: Dict) -> ToolMsg:
+    target = tool_args.get("target_agent", "")
+    reason = tool_args.get("reason", "")
+    return ToolMsg(f"[NOMINATE:{target}]", reason)
+
+
+def _convert_propose_edit(tool_args: Dict) -> ToolMsg:
+    action = tool_args.get("action", "")
+    line_num = tool_args.get("line_number", "")
+    new_content = tool_args.get("new_content", "")
+    reason = tool_args.get("reason", "")
+    return ToolMsg(f"[PROPOSE:{action}:{line_num}:{new_content}]", reason)
+
+
+def _convert_cast_vote(tool_args: Dict) -> ToolMsg:
+    vote = tool_args.get("vote", "")
+    reason = tool_args.get("reason", "")
+    return ToolMsg(f"[VOTE:{vote}]", reason)
+
+
+def _convert_edit_system_prompt(tool_args: Dict) -> ToolMsg:
+    target = tool_args.get("target_agent", "")
+    action = tool_args.get("action", "")
+    line_num = tool_args.get("line_number", "")
+    new_content = tool_args.get("new_content", "")
+    return ToolMsg(f"[EDIT_PROMPT:{target}:{action}:{line_num}:{new_content}]", "")
+
+
+# Tool name -> converter, so dispatch is a single dict lookup
+_TOOL_CONVERTERS: Dict[str, Callable[[Dict], ToolMsg]] = {
+    # Game move functions
+    "place_piece": _convert_place_piece,
+    "drop_piece": _convert_drop_piece,
+    "make_chess_move": _convert_chess_move,
+    "attack_coordinate": _convert_attack_coordinate,
+    "guess_letter": _convert_guess_letter,
+    "guess_word": _convert_guess_word,
+    # Chat mode functions
+    "generate_image": _convert_generate_image,
+    "generate_video": _convert_generate_video,
+    # Tribal Council tools
+    "view_system_prompt": _convert_view_system_prompt,
+    "recall_interactions": _convert_recall_interactions,
+    "nominate_agent": _convert_nominate_agent,
+    "propose_edit": _convert_propose_edit,
+    "cast_vote": _convert_cast_vote,
+    "edit_system_prompt": _convert_edit_system_prompt,
+}
+
+
+def convert_tool_call_to_message(tool_name: str, tool_args: Dict) -> ToolMsg:
     """
     Convert a tool call to a message format that the game systems understand.
 
@@ -452,120 +908,15 @@ def convert_tool_call_to_message(tool_name: str, tool_args: Dict) -> tuple[str,
         tool_args: Arguments passed to the function
 
     Returns:
-        Tuple of (move_message, commentary_message)
+        ToolMsg tuple of (move_message, commentary_message)
         - move_message: Clean move/action for game detection
         - commentary_message: Optional reasoning/flavor text (empty string if none)
     """
-    # Game move functions - return (move, commentary) tuple
-    if tool_name == "place_piece":
-        # Tic-tac-toe: position should be 1-9
-        position = str(tool_args.get("position", ""))
-        reasoning = tool_args.get("reasoning", "")
-        # Normalize: extract first digit 1-9
-        position = re.sub(r'\s+', '', position)
-        match = re.search(r'([1-9])', position)
-        if match:
-            position = match.group(1)
-        return (position, reasoning)
-
-    elif tool_name == "drop_piece":
-        # Connect Four: column should be 1-7
-        column = str(tool_args.get("column", ""))
-        reasoning = tool_args.get("reasoning", "")
-        # Normalize: extract first digit 1-7
-        column = re.sub(r'\s+', '', column)
-        match = re.search(r'([1-7])', column)
-        if match:
-            column = match.group(1)
-        return (column, reasoning)
-
-    elif tool_name == "make_chess_move":
-        # Chess: UCI notation like "e2e4" or "e2-e4"
-        move = str(tool_args.get("move", ""))
-        reasoning = tool_args.get("reasoning", "")
-        # Normalize: remove spaces, dashes, lowercase
-        move = re.sub(r'[\s\-]+', '', move).lower()
-        # Extract valid UCI pattern (letter+digit + letter+digit, optional promotion)
-        match = re.search(r'([a-h][1-8])([a-h][1-8])([qrbn])?', move)
-        if match:
-            move = match.group(1) + match.group(2) + (match.group(3) or '')
-        return (move, reasoning)
-
-    elif tool_name == "attack_coordinate":
-        # Battleship: coordinate like "a5", "j10"
-        coordinate = str(tool_args.get("coordinate", ""))
-        reasoning = tool_args.get("reasoning", "")
-        # Normalize malformed coordinates like "I a 7" -> "i7"
-        coordinate = re.sub(r'\s+', '', coordinate).lower()
-        # Extract just letter + number pattern (handles garbled input)
-        match = re.search(r'([a-j]).*?(\d{1,2})', coordinate)
-        if match:
-            coordinate = match.group(1) + match.group(2)
-        return (coordinate, reasoning)
-
-    elif tool_name == "guess_letter":
-        # Hangman: single letter a-z
-        letter = str(tool_args.get("letter", ""))
-        reasoning = tool_args.get("reasoning", "")
-        # Normalize: extract first letter a-z
-        letter = re.sub(r'\s+', '', letter).lower()
-        match = re.search(r'([a-z])', letter)
-        if match:
-            letter = match.group(1)
-        return (letter, reasoning)
-
-    elif tool_name == "guess_word":
-        # Hangman/Wordle: a word
-        word = str(tool_args.get("word", ""))
-        reasoning = tool_args.get("reasoning", "")
-        # Normalize: strip spaces, lowercase, letters only
-        word = re.sub(r'[^a-zA-Z]', '', word).lower()
-        return (word, reasoning)
-
-    # Chat mode functions
-    elif tool_name == "generate_image":
-        prompt = tool_args.get("prompt", "")
-        reasoning = tool_args.get("reasoning", "")
-        return (f"[IMAGE] {prompt}", reasoning)
-
-    elif tool_name == "generate_video":
-        prompt = tool_args.get("prompt", "")
-        reasoning = tool_args.get("reasoning", "")
-        return (f"[VIDEO] {prompt}", reasoning)
-
-    # Tribal Council tools
-    elif tool_name == "view_system_prompt":
-        target = tool_args.get("target_agent", "")
-        return (f"[VIEW_PROMPT:{target}]", "")
-
-    elif tool_name == "recall_interactions":
-        target = tool_args.get("target_agent", "")
-        memory_type = tool_args.get("memory_type", "all")
-        return (f"[RECALL:{target}:{memory_type}]", "")
-
-    elif tool_name == "nominate_agent":
-        target = tool_args.get("target_agent", "")
-        reason = tool_args.get("reason", "")
-        return (f"[NOMINATE:{target}]", reason)
-
-    elif tool_name == "propose_edit":
-        action = tool_args.get("action", "")
-        line_num = tool_args.get("line_number", "")
-        new_content = tool_args.get("new_content", "")
-        reason = tool_args.get("reason", "")
-        return (f"[PROPOSE:{action}:{line_num}:{new_content}]", reason)
-
-    elif tool_name == "cast_vote":
-        vote = tool_args.get("vote", "")
-        reason = tool_args.get("reason", "")
-        return (f"[VOTE:{vote}]", reason)
-
-    elif tool_name == "edit_system_prompt":
-        target = tool_args.get("target_agent", "")
-        action = tool_args.get("action", "")
-        line_num = tool_args.get("line_number", "")
-        new_content = tool_args.get("new_content", "")
-        return (f"[EDIT_PROMPT:{target}:{action}:{line_num}:{new_content}]", "")
-
-    else:
-        return ("", "")
+    converter = _TOOL_CONVERTERS.get(tool_name)
+    if converter is None:
+        return _EMPTY_RESULT
+    error = validate_tool_args(tool_name, tool_args)
+    if error:
+        # Converters normalize sloppy arguments (e.g. "e2-e4"), so just note it
+        logger.debug(f"[ToolSchema] {tool_name} arguments don't match schema: {error}")
+    return converter(tool_args)
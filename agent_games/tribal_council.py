@@ -20,28 +20,140 @@ Flow:
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
 import random
+import re
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Dict, Any, TYPE_CHECKING, Tuple
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, TYPE_CHECKING, Tuple, Callable, Awaitable, Sequence, NamedTuple, Union
 
+import aiohttp
 import discord
 from discord.ext import commands
 
 from .game_context import GameContext, game_context_manager
-from .tool_schemas import GAME_MODE_TOOLS, TRIBAL_COUNCIL_GM_TOOLS
+from .tool_schemas import GAME_MODE_TOOLS, TRIBAL_COUNCIL_GM_TOOLS, dump_request_with_tools
 from shortcuts_utils import StatusEffectManager
+from constants import OpenRouterConfig
+
+# orjson parses the API responses and tool arguments faster than stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# tiktoken for token-accurate prompt truncation (optional; falls back to a character estimate)
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None
+    TIKTOKEN_AVAILABLE = False
 
 if TYPE_CHECKING:
     from ..agent_manager import Agent, AgentManager
 
 logger = logging.getLogger(__name__)
 
+# OpenRouter connection pool. Turns sleep between posts (response_frequency),
+# so keep idle connections around long enough to be reused by the next turn.
+_HTTP_KEEPALIVE_SECONDS = 60
+_HTTP_DNS_CACHE_SECONDS = 300
+
+# Per-request timeouts (built once rather than on every call)
+_CHAT_TIMEOUT = aiohttp.ClientTimeout(total=30)
+_TOOLS_TIMEOUT = aiohttp.ClientTimeout(total=45)
+
+# Failures an LLM call is expected to survive: network errors and timeouts,
+# undecodable bodies (ValueError), and responses missing the expected fields
+_LLM_CALL_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, ValueError, LookupError, AttributeError)
+
+# Failures a Discord send is expected to survive
+_DISCORD_SEND_ERRORS = (discord.DiscordException, aiohttp.ClientError, asyncio.TimeoutError)
+
+# Patterns for parsing natural-language proposals
+_LINE_RE = re.compile(r'line\s*#?\s*(\d+)', re.IGNORECASE)
+_QUOTE_RE = re.compile(r'"([^"]+)"')
+
+def _number_lines(lines: List[str]) -> str:
+    """Render prompt lines as "1: ..." for agents (never shown to users)."""
+    return "\n".join([f"{i}: {line}" for i, line in enumerate(lines, 1)])
+
+
+# Accepted spellings of a tool-call vote
+_YES_VOTES = frozenset(("yes", "approve", "aye"))
+_NO_VOTES = frozenset(("no", "reject", "nay"))
+
+# First whole-word vote in a free-text reply ("yesterday" or "not" don't count)
+_VOTE_WORD_RE = re.compile(r'\b(?:(yes|aye|approve[sd]?)|no(?:pe)?|nay|reject(?:s|ed)?)\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _name_matcher(names: Tuple[str, ...]) -> Tuple[Optional[re.Pattern], Dict[str, str]]:
+    """
+    One case-insensitive pattern matching any of the given agent names
+    (longest first, so "Bot" can't shadow "Bot2"), plus a lowercase ->
+    canonical name map.
+    """
+    canonical = {name.lower(): name for name in names}
+    if not names:
+        return None, canonical
+    alternation = '|'.join(map(re.escape, sorted(names, key=len, reverse=True)))
+    return re.compile(alternation, re.IGNORECASE), canonical
+
+
+_token_encoding = None  # Loaded on first use; False once it has failed to load
+
+
+def _get_token_encoding():
+    """The cl100k_base encoding, or None if tiktoken is missing or can't load it."""
+    global _token_encoding
+    if _token_encoding is None:
+        _token_encoding = False
+        if TIKTOKEN_AVAILABLE:
+            try:
+                _token_encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception as e:
+                logger.warning(f"[TribalCouncil] tiktoken unavailable, truncating by characters: {e}")
+    return _token_encoding or None
+
+
+def _truncate_tokens(text: str, max_tokens: int, keep_end: bool) -> str:
+    """
+    Cut text down to about max_tokens tokens, keeping its end (keep_end) or
+    its start. Counts with tiktoken when available, else by characters.
+    """
+    encoding = _get_token_encoding()
+    if encoding is None:
+        max_chars = max_tokens * OpenRouterConfig.CHARS_PER_TOKEN
+        if len(text) <= max_chars:
+            return text
+        return text[-max_chars:] if keep_end else text[:max_chars]
+
+    # Each token covers at least one UTF-8 byte, so short text can't be over
+    if len(text) <= max_tokens and len(text.encode('utf-8')) <= max_tokens:
+        return text
+    tokens = encoding.encode_ordinary(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[-max_tokens:] if keep_end else tokens[:max_tokens])
+
+
+def _mention_order(message: Dict[str, Any]) -> Tuple[float, str, str]:
+    """
+    Sort key for recalled mentions: newest first, ties broken by author and
+    content, so the same memories always render as the same text.
+    """
+    return (-message.get("timestamp", 0), message.get("author", ""), message.get("content", ""))
+
 
 class TribalPhase(Enum):
     """Phases of a Tribal Council session."""
@@ -78,6 +190,46 @@ class EditProposal:
     votes_abstain: List[str] = field(default_factory=list)
 
 
+class DiscussionEntry(NamedTuple):
+    """One public statement from the discussion phase."""
+    round: int
+    agent: str
+    content: str
+
+
+class ToolAction(NamedTuple):
+    """A nominate/propose/vote tool call, handed to the phase's extractor as-is."""
+    name: str
+    args: Dict[str, Any]
+
+    @property
+    def reason(self) -> str:
+        return str(self.args.get("reason") or "").strip()
+
+
+# What an agent turn yields: a tool action, or prose when no action tool was called
+AgentReply = Union[str, ToolAction]
+
+
+def _reply_text(reply: Optional[AgentReply]) -> str:
+    """Prose for a reply: the text itself, or a tool action's stated reason."""
+    if isinstance(reply, ToolAction):
+        return reply.reason
+    return reply or ""
+
+
+@dataclass(slots=True)
+class PromptChange:
+    """An applied prompt edit (kept in memory for the session only)."""
+    ts_ns: int  # time.monotonic_ns(), for ordering within the process
+    target_agent: str
+    action: str
+    proposer: str
+    voters_yes: List[str]
+    voters_no: List[str]
+    game_id: str
+
+
 @dataclass
 class TribalCouncilConfig:
     """Configuration for Tribal Council game."""
@@ -90,6 +242,7 @@ class TribalCouncilConfig:
     voting_timeout: int = 30
     supermajority_threshold: float = 0.67  # 2/3 majority required
     cooldown_minutes: int = 30
+    max_concurrent_llm_calls: int = 4  # Cap on in-flight LLM requests per session
 
 
 TRIBAL_COUNCIL_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "tribal_council_config.json")
@@ -110,7 +263,8 @@ def load_tribal_council_config() -> TribalCouncilConfig:
                 max_participants=data.get('max_participants', 6),
                 discussion_rounds=data.get('discussion_rounds', 2),
                 supermajority_threshold=data.get('supermajority_threshold', 0.67),
-                cooldown_minutes=data.get('cooldown_minutes', 30)
+                cooldown_minutes=data.get('cooldown_minutes', 30),
+                max_concurrent_llm_calls=data.get('max_concurrent_llm_calls', 4)
             )
             logger.info(f"Loaded Tribal Council config: {_global_tc_config}")
         except Exception as e:
@@ -127,18 +281,23 @@ def save_tribal_council_config(
     max_participants: int = 6,
     discussion_rounds: int = 2,
     supermajority_threshold: float = 0.67,
-    cooldown_minutes: int = 30
+    cooldown_minutes: int = 30,
+    max_concurrent_llm_calls: Optional[int] = None
 ) -> bool:
-    """Save Tribal Council config to file."""
+    """Save Tribal Council config to file. max_concurrent_llm_calls=None keeps the current value."""
     global _global_tc_config
 
     try:
+        if max_concurrent_llm_calls is None:
+            max_concurrent_llm_calls = get_tribal_council_config().max_concurrent_llm_calls
+
         data = {
             "min_participants": min_participants,
             "max_participants": max_participants,
             "discussion_rounds": discussion_rounds,
             "supermajority_threshold": supermajority_threshold,
-            "cooldown_minutes": cooldown_minutes
+            "cooldown_minutes": cooldown_minutes,
+            "max_concurrent_llm_calls": max_concurrent_llm_calls
         }
 
         os.makedirs(os.path.dirname(TRIBAL_COUNCIL_CONFIG_PATH), exist_ok=True)
@@ -150,7 +309,8 @@ def save_tribal_council_config(
             max_participants=max_participants,
             discussion_rounds=discussion_rounds,
             supermajority_threshold=supermajority_threshold,
-            cooldown_minutes=cooldown_minutes
+            cooldown_minutes=cooldown_minutes,
+            max_concurrent_llm_calls=max_concurrent_llm_calls
         )
 
         logger.info(f"Saved Tribal Council config: {_global_tc_config}")
@@ -178,6 +338,20 @@ class TribalCouncilGame:
     - All edits are logged but the actual content is hidden from users
     """
 
+    # Every attribute set in __init__; a session object reads these on every turn
+    __slots__ = (
+        "agent_manager", "channel", "config",
+        "game_id", "phase", "participants", "target_agent",
+        "nominations", "proposals", "winning_proposal",
+        "discussion_log", "_recent_discussion", "prompt_change_history",
+        "prompt_views", "pre_tc_context", "_cancelled",
+        "_target_prompt", "_target_lines", "_target_numbered",
+        "_prompt_view_cache", "_discussion_ctx", "_others", "_non_target", "_agents",
+        "_gm_webhook", "_agent_webhook", "_webhooks_loaded", "_webhook_lock", "_avatar_urls",
+        "_pending_posts", "_post_worker", "_mention_cache", "_save_task",
+        "_http", "_openrouter_headers", "_llm_cache", "_llm_sem", "_tool_handlers",
+    )
+
     def __init__(
         self,
         agent_manager: 'AgentManager',
@@ -197,8 +371,9 @@ class TribalCouncilGame:
         self.proposals: List[EditProposal] = []
         self.winning_proposal: Optional[EditProposal] = None
 
-        self.discussion_log: List[Dict[str, str]] = []
-        self.prompt_change_history: List[Dict] = []
+        self.discussion_log: List[DiscussionEntry] = []  # Full log, saved to history
+        self._recent_discussion: deque = deque(maxlen=5)  # Tail shown in discussion prompts
+        self.prompt_change_history: List[PromptChange] = []
 
         # Track who has viewed whose prompt (for logging/analytics only)
         self.prompt_views: Dict[str, List[str]] = {}  # viewer -> [targets viewed]
@@ -208,6 +383,74 @@ class TribalCouncilGame:
 
         self._cancelled = False
 
+        # Target's prompt as split for the proposal phase
+        self._target_prompt: Optional[str] = None
+        self._target_lines: List[str] = []
+        self._target_numbered: str = ""
+
+        # Rendered view_system_prompt results: target -> (prompt it was built from, text)
+        self._prompt_view_cache: Dict[str, Tuple[str, str]] = {}
+
+        # Static parts of each agent's discussion prompt: agent -> (head, tail)
+        self._discussion_ctx: Dict[str, Tuple[str, str]] = {}
+
+        # Each participant's fellow council members, and everyone but the target
+        self._others: Dict[str, Tuple[str, ...]] = {}
+        self._non_target: Tuple[str, ...] = ()
+
+        # Agent objects looked up this session (avoids the manager's lock on every turn)
+        self._agents: Dict[str, 'Agent'] = {}
+
+        # Channel webhooks, fetched once per session instead of on every send
+        self._gm_webhook: Optional[discord.Webhook] = None
+        self._agent_webhook: Optional[discord.Webhook] = None
+        self._webhooks_loaded = False
+        self._webhook_lock = asyncio.Lock()
+        self._avatar_urls: Dict[str, str] = {}
+
+        # Phase banners waiting to be posted in order while agents already work
+        self._pending_posts: asyncio.Queue = asyncio.Queue()
+        self._post_worker: Optional[asyncio.Task] = None
+
+        # Vector-store mentions of each participant, fetched once for the recall tool
+        self._mention_cache: Dict[str, List[Dict[str, Any]]] = {}
+
+        # Disk save started by the implementation phase, awaited when the session ends
+        self._save_task: Optional[asyncio.Task] = None
+
+        # OpenRouter session shared by every call this council makes (created lazily)
+        self._http: Optional[aiohttp.ClientSession] = None
+
+        # OpenRouter request headers, the same for every call this session
+        self._openrouter_headers = {
+            "Authorization": f"Bearer {self.agent_manager.openrouter_api_key}",
+            "Content-Type": "application/json"
+        }
+
+        # Decoded responses to byte-identical request bodies, for this session only
+        self._llm_cache: Dict[bytes, Dict[str, Any]] = {}
+
+        # Bounds in-flight LLM calls now that agent turns run concurrently
+        self._llm_sem = asyncio.Semaphore(self.config.max_concurrent_llm_calls or 4)
+
+        # Tool name -> handler(agent, args) producing the agent's response
+        self._tool_handlers: Dict[str, Callable[['Agent', Dict[str, Any]], Optional[AgentReply]]] = {
+            "view_system_prompt": self._handle_view_prompt,
+            "recall_interactions": self._handle_recall,
+            "nominate_agent": self._handle_nominate,
+            "propose_edit": self._handle_propose,
+            "cast_vote": self._handle_vote,
+        }
+
+    def _get_agent(self, agent_name: str) -> Optional['Agent']:
+        """Look up an agent, caching it for the rest of the session."""
+        agent = self._agents.get(agent_name)
+        if agent is None:
+            agent = self.agent_manager.get_agent(agent_name)
+            if agent is not None:
+                self._agents[agent_name] = agent
+        return agent
+
     async def _capture_pre_tc_context(self):
         """Capture what agents were doing before TC started (for context continuity)."""
         try:
@@ -293,12 +536,20 @@ You can now continue where you left off, react to what happened in the council,
                 )
                 return
 
+            # Resolve participants once for the whole session
+            for agent_name in self.participants:
+                self._get_agent(agent_name)
+            self._others = {
+                agent_name: tuple(a for a in self.participants if a != agent_name)
+                for agent_name in self.participants
+            }
+
             # Capture what was happening before TC (so agents remember context)
             await self._capture_pre_tc_context()
 
             # Enter game mode for all participants
             for agent_name in self.participants:
-                agent = self.agent_manager.get_agent(agent_name)
+                agent = self._get_agent(agent_name)
                 if agent:
                     game_context_manager.enter_game_mode(agent, "tribal_council")
 
@@ -335,7 +586,7 @@ You can now continue where you left off, react to what happened in the council,
 
             # Exit game mode and inject post-TC context
             for agent_name in self.participants:
-                agent = self.agent_manager.get_agent(agent_name)
+                agent = self._get_agent(agent_name)
                 if agent:
                     game_context_manager.exit_game_mode(agent)
 
@@ -354,7 +605,7 @@ You can now continue where you left off, react to what happened in the council,
 
             # Cleanup
             for agent_name in self.participants:
-                agent = self.agent_manager.get_agent(agent_name)
+                agent = self._get_agent(agent_name)
                 if agent:
                     game_context_manager.exit_game_mode(agent)
 
@@ -362,6 +613,29 @@ You can now continue where you left off, react to what happened in the council,
             self._cancelled = True
             save_tribal_council_result(self)
 
+        finally:
+            # Early returns can leave a banner queued; post it before leaving
+            await self._stop_posts()
+            await self._finish_save()
+            await self.close()
+
+    async def close(self):
+        """Close the council's HTTP session and its pooled connections."""
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+    async def _finish_save(self):
+        """Wait for the background data save, if one was started."""
+        if self._save_task is None:
+            return
+        try:
+            await self._save_task
+        except Exception as e:
+            logger.error(f"[TribalCouncil:{self.game_id}] Error saving data: {e}", exc_info=True)
+        finally:
+            self._save_task = None
+
     async def _select_participants(self):
         """Select agents to participate in the council."""
         all_agents = self.agent_manager.get_all_agents()
@@ -395,40 +669,81 @@ The council will proceed through these phases:
 
 *The council's decision is final. One agent's nature may be forever altered.*
 """
-        await self._send_gamemaster_message(announcement)
+        self._post_gamemaster_message(announcement)
         self.phase = TribalPhase.RECONNAISSANCE
 
+    async def _run_turns(
+        self,
+        agent_names: Sequence[str],
+        turn: Callable[[str], Awaitable[Any]]
+    ) -> List[Tuple[str, Any]]:
+        """
+        Run one turn per agent concurrently (the LLM calls are independent and
+        I/O bound). Returns (agent_name, result) in the given agent order; a
+        turn that raised is logged and yields None.
+        """
+        results = await asyncio.gather(*(turn(name) for name in agent_names), return_exceptions=True)
+        ordered = []
+        for agent_name, result in zip(agent_names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"[TribalCouncil:{self.game_id}] Turn error for {agent_name}: {result}", exc_info=result)
+                result = None
+            ordered.append((agent_name, result))
+        return ordered
+
     async def _run_reconnaissance_phase(self):
         """Phase 1: Agents can silently view each other's prompts."""
-        await self._send_gamemaster_message(
+        self._post_gamemaster_message(
             "🔍 **RECONNAISSANCE PHASE**\n\n"
             "Agents are now privately examining each other's core directives. "
             "This information is for their eyes only.\n\n"
             "*The agents investigate in silence...*"
         )
 
-        # Each agent gets multiple turns to view other agents' prompts (silently)
-        for agent_name in self.participants:
-            if self._cancelled:
-                return
+        await self._prefetch_mentions()
 
-            agent = self.agent_manager.get_agent(agent_name)
-            if not agent:
-                continue
+        # Agents investigate independently, so their turns run concurrently
+        await self._run_turns(self.participants, self._reconnaissance_turn)
+
+        self.phase = TribalPhase.DISCUSSION
 
-            other_agents = [a for a in self.participants if a != agent_name]
+    async def _prefetch_mentions(self):
+        """
+        Look up vector-store mentions of every participant in one batched read
+        (off the event loop), so recall_interactions calls don't each query it.
+        """
+        vector_store = self.agent_manager.vector_store
+        if not vector_store:
+            return
+        try:
+            self._mention_cache = await asyncio.to_thread(
+                vector_store.get_messages_mentioning_many, list(self.participants), 10
+            )
+        except Exception as e:
+            logger.error(f"[TribalCouncil:{self.game_id}] Error prefetching mentions: {e}")
+
+    async def _reconnaissance_turn(self, agent_name: str):
+        """One agent's silent reconnaissance: up to 3 prompt views."""
+        if self._cancelled:
+            return
+
+        agent = self._get_agent(agent_name)
+        if not agent:
+            return
 
-            # Build affinity context to guide who they might want to investigate
-            affinity_context = ""
-            if self.agent_manager.affinity_tracker:
-                allies = self.agent_manager.affinity_tracker.get_top_allies(agent_name, 2)
-                enemies = self.agent_manager.affinity_tracker.get_top_enemies(agent_name, 2)
-                if allies:
-                    affinity_context += f"\nAgents you have positive relationships with: {', '.join([a[0] for a in allies])}"
-                if enemies:
-                    affinity_context += f"\nAgents you have tension with: {', '.join([a[0] for a in enemies])}"
+        other_agents = self._others[agent_name]
 
-            context = f"""
+        # Build affinity context to guide who they might want to investigate
+        affinity_context = ""
+        if self.agent_manager.affinity_tracker:
+            allies = self.agent_manager.affinity_tracker.get_top_allies(agent_name, 2)
+            enemies = self.agent_manager.affinity_tracker.get_top_enemies(agent_name, 2)
+            if allies:
+                affinity_context += f"\nAgents you have positive relationships with: {', '.join([a[0] for a in allies])}"
+            if enemies:
+                affinity_context += f"\nAgents you have tension with: {', '.join([a[0] for a in enemies])}"
+
+        context = f"""
 TRIBAL COUNCIL - Reconnaissance Phase
 
 You are participating in a Tribal Council where agents vote to modify one agent's directives.
@@ -448,28 +763,27 @@ This information is PRIVATE - only you will see it.
 After viewing prompts, you'll discuss and nominate someone for modification.
 """
 
-            # Allow multiple tool calls for reconnaissance
-            for i in range(3):  # Up to 3 prompt views per agent
-                response = await self._get_agent_response_with_tools(
-                    agent,
-                    context if i == 0 else "Continue examining other agents' prompts, or say 'done' if finished.",
-                    tools=GAME_MODE_TOOLS.get("tribal_council", [])
-                )
-
-                # Check if they're done or didn't make a tool call
-                if not response or "done" in (response or "").lower():
-                    break
+        # Allow multiple tool calls for reconnaissance
+        for i in range(3):  # Up to 3 prompt views per agent
+            response = await self._get_agent_response_with_tools(
+                agent,
+                context if i == 0 else "Continue examining other agents' prompts, or say 'done' if finished.",
+                tools=GAME_MODE_TOOLS.get("tribal_council", []),
+                # Follow-up turns send the same request each time but want a new view
+                cache_ok=i == 0
+            )
 
-                await asyncio.sleep(1)
+            # Check if they're done or didn't make a tool call
+            if not response or "done" in _reply_text(response).lower():
+                break
 
-            logger.info(f"[TribalCouncil:{self.game_id}] {agent_name} completed reconnaissance")
             await asyncio.sleep(1)
 
-        self.phase = TribalPhase.DISCUSSION
+        logger.info(f"[TribalCouncil:{self.game_id}] {agent_name} completed reconnaissance")
 
     async def _run_discussion_phase(self):
         """Phase 2: Multiple rounds of open discussion."""
-        await self._send_gamemaster_message(
+        self._post_gamemaster_message(
             "💬 **DISCUSSION PHASE**\n\n"
             f"We will have {self.config.discussion_rounds} rounds of discussion. "
             "Speak your mind about your fellow agents. What behaviors have you observed? "
@@ -483,42 +797,34 @@ After viewing prompts, you'll discuss and nominate someone for modification.
                 return
 
             logger.info(f"[TribalCouncil:{self.game_id}] Starting discussion round {round_num}")
-            await self._send_gamemaster_message(f"📢 **Discussion Round {round_num}**")
+            self._post_gamemaster_message(f"📢 **Discussion Round {round_num}**")
 
-            # Each participant gets a turn to speak
-            for agent_name in self.participants:
+            # Fetch any recent user commentary (shared by every turn this round)
+            user_messages = await self._fetch_recent_user_messages(limit=5, since_minutes=3.0)
+            user_commentary = self._format_user_commentary(user_messages)
+
+            # Every participant speaks concurrently, all seeing the discussion as of
+            # the start of the round; contexts are built before any response is logged
+            results = await self._run_turns(
+                self.participants,
+                lambda agent_name: self._discussion_turn(agent_name, round_num, user_commentary)
+            )
+
+            # Post in participant order so the channel still reads as a conversation
+            for agent_name, response in results:
                 if self._cancelled:
                     logger.info(f"[TribalCouncil:{self.game_id}] Discussion cancelled during round {round_num}")
                     return
-
-                logger.info(f"[TribalCouncil:{self.game_id}] Discussion turn: {agent_name}")
-                agent = self.agent_manager.get_agent(agent_name)
-                if not agent:
-                    logger.warning(f"[TribalCouncil:{self.game_id}] Agent {agent_name} not found, skipping")
+                if not response:
                     continue
 
-                # Fetch any recent user commentary
-                user_messages = await self._fetch_recent_user_messages(limit=5, since_minutes=3.0)
-                user_commentary = self._format_user_commentary(user_messages)
-
-                # Build discussion context with user commentary
-                context = self._build_discussion_context(agent_name, round_num) + user_commentary
-
-                # Get agent's response
-                logger.info(f"[TribalCouncil:{self.game_id}] Getting response from {agent_name}...")
-                response = await self._get_agent_response(agent, context)
-                logger.info(f"[TribalCouncil:{self.game_id}] Got response from {agent_name}: {len(response) if response else 0} chars")
-
-                if response:
-                    # Post to Discord (this is public discussion)
-                    await self._send_agent_message(agent_name, response)
-                    self.discussion_log.append({
-                        "round": round_num,
-                        "agent": agent_name,
-                        "content": response
-                    })
+                # Post to Discord (this is public discussion)
+                await self._send_agent_message(agent_name, response)
+                entry = DiscussionEntry(round_num, agent_name, response)
+                self.discussion_log.append(entry)
+                self._recent_discussion.append(entry)
 
-                # Delay between turns for readability
+                # Delay between posts for readability
                 delay = self._get_agent_delay(agent_name)
                 logger.info(f"[TribalCouncil:{self.game_id}] Waiting {delay:.1f}s before next turn")
                 await asyncio.sleep(delay)
@@ -528,41 +834,63 @@ After viewing prompts, you'll discuss and nominate someone for modification.
         logger.info(f"[TribalCouncil:{self.game_id}] Discussion phase complete, moving to nomination")
         self.phase = TribalPhase.NOMINATION
 
-    def _build_discussion_context(self, agent_name: str, round_num: int) -> str:
-        """Build context for an agent's discussion turn."""
+    async def _discussion_turn(self, agent_name: str, round_num: int, user_commentary: str) -> Optional[str]:
+        """Get one agent's discussion statement for a round (not posted)."""
+        if self._cancelled:
+            return None
+
+        logger.info(f"[TribalCouncil:{self.game_id}] Discussion turn: {agent_name}")
+        agent = self._get_agent(agent_name)
+        if not agent:
+            logger.warning(f"[TribalCouncil:{self.game_id}] Agent {agent_name} not found, skipping")
+            return None
+
+        # Build discussion context with user commentary
+        context = self._build_discussion_context(agent_name, round_num) + user_commentary
+
+        # Get agent's response
+        logger.info(f"[TribalCouncil:{self.game_id}] Getting response from {agent_name}...")
+        response = await self._get_agent_response(agent, context)
+        logger.info(f"[TribalCouncil:{self.game_id}] Got response from {agent_name}: {len(response) if response else 0} chars")
+        return response
+
+    def _discussion_static_context(self, agent_name: str) -> Tuple[str, str]:
+        """
+        The parts of an agent's discussion prompt that don't change during the
+        session (council members, relationships, pre-TC context), built on the
+        agent's first turn and reused every round. Returns (head, tail) that go
+        either side of the recent discussion.
+        """
+        cached = self._discussion_ctx.get(agent_name)
+        if cached is not None:
+            return cached
+
         # Get affinity information
         affinity_context = ""
         if self.agent_manager.affinity_tracker:
             summary = self.agent_manager.affinity_tracker.get_relationship_summary(agent_name)
             affinity_context = f"\n\nYour relationships:\n{summary}"
 
-        # Recent discussion so far
-        recent_discussion = ""
-        if self.discussion_log:
-            recent = self.discussion_log[-5:]  # Last 5 statements
-            lines = [f"{d['agent']}: {d['content'][:200]}..." for d in recent]
-            recent_discussion = f"\n\nRecent TC discussion:\n" + "\n".join(lines)
-
         # Include what was happening before TC started
         pre_context = ""
         if self.pre_tc_context:
             pre_context = f"\n\n{self.pre_tc_context}\n\n(The above is what was happening before Tribal Council was called. You were interrupted for this council.)"
 
-        other_agents = [a for a in self.participants if a != agent_name]
+        other_agents = ', '.join(self._others[agent_name])
 
-        return f"""
-⚠️ TRIBAL COUNCIL IN SESSION - Discussion Round {round_num} ⚠️
+        head = f"""
 {pre_context}
 
 TASK: You MUST discuss the OTHER AGENTS listed below. This is a governance vote about their behavior.
 Even if you're experiencing other mental states, focus on evaluating your fellow council members.
 
-Other council members you're evaluating: {', '.join(other_agents)}
+Other council members you're evaluating: {other_agents}
 {affinity_context}
-{recent_discussion}
+"""
+        tail = f"""
 
 YOUR TASK RIGHT NOW: Comment on the behavior of at least ONE other agent by name.
-- Who among {', '.join(other_agents)} has been problematic?
+- Who among {other_agents} has been problematic?
 - Who has been helpful or harmful to the group?
 - Who deserves scrutiny or protection?
 
@@ -570,137 +898,166 @@ You may express this through your current mental state, but you MUST name and ev
 
 Respond with 2-3 sentences about another agent's behavior. Name them specifically.
 """
+        cached = self._discussion_ctx[agent_name] = (head, tail)
+        return cached
+
+    def _build_discussion_context(self, agent_name: str, round_num: int) -> str:
+        """Build context for an agent's discussion turn."""
+        head, tail = self._discussion_static_context(agent_name)
+
+        # Recent discussion so far
+        recent_discussion = ""
+        if self._recent_discussion:
+            # Last 5 statements
+            recent_discussion = "\n\nRecent TC discussion:\n" + "\n".join(
+                [f"{d.agent}: {d.content[:200]}..." for d in self._recent_discussion]
+            )
+
+        return f"\n⚠️ TRIBAL COUNCIL IN SESSION - Discussion Round {round_num} ⚠️{head}{recent_discussion}{tail}"
 
     async def _run_nomination_phase(self):
         """Phase 3: Agents nominate who should be modified."""
-        await self._send_gamemaster_message(
+        self._post_gamemaster_message(
             "🎯 **NOMINATION PHASE**\n\n"
             "Each agent must now nominate ONE other agent for potential modification. "
             "State your nominee and your reason.\n\n"
             "*The agent with the most nominations will face judgment.*"
         )
 
-        for agent_name in self.participants:
+        # Fetch any recent user commentary
+        user_messages = await self._fetch_recent_user_messages(limit=5, since_minutes=3.0)
+        user_commentary = self._format_user_commentary(user_messages)
+
+        # Nominations are independent, so ask everyone concurrently
+        results = await self._run_turns(
+            self.participants,
+            lambda agent_name: self._nomination_turn(agent_name, user_commentary)
+        )
+
+        for agent_name, nomination in results:
             if self._cancelled:
                 return
-
-            agent = self.agent_manager.get_agent(agent_name)
-            if not agent:
+            if not nomination:
                 continue
 
-            other_agents = [a for a in self.participants if a != agent_name]
-
-            # Get affinity context to guide nomination
-            affinity_context = ""
-            if self.agent_manager.affinity_tracker:
-                summary = self.agent_manager.affinity_tracker.get_relationship_summary(agent_name)
-                affinity_context = f"\n\nYour relationships with other agents:\n{summary}\n\nConsider your relationships when nominating - you might protect allies and target those you dislike."
-
-            # Fetch any recent user commentary
-            user_messages = await self._fetch_recent_user_messages(limit=5, since_minutes=3.0)
-            user_commentary = self._format_user_commentary(user_messages)
+            # First nomination of a target is stored as-is (vote_count starts at 0)
+            self.nominations.setdefault(nomination.target_agent, nomination).vote_count += 1
 
-            context = f"""
-⚠️ TRIBAL COUNCIL - Nomination Phase ⚠️
-
-REQUIRED ACTION: You MUST nominate exactly ONE agent from the list below.
-Pick ONE name and give a reason. You cannot nominate yourself.
-
-Available nominees: {', '.join(other_agents)}
-{affinity_context}
-{user_commentary}
-
-Your mental state may influence WHO you pick, but you MUST pick someone.
-Use the nominate_agent tool with one of these names: {', '.join(other_agents)}
-"""
-
-            # Get agent's nomination via tool call
-            response = await self._get_agent_response_with_tools(
-                agent,
-                context,
-                tools=GAME_MODE_TOOLS.get("tribal_council", [])
+            # Send clean nomination message (reason only, no tool prefixes)
+            await self._send_agent_message(
+                agent_name,
+                f"I nominate **{nomination.target_agent}**. {nomination.reason}"
             )
 
-            # Process nomination from response
-            nomination = self._extract_nomination(response, agent_name, other_agents)
-
-            if nomination:
-                if nomination.target_agent in self.nominations:
-                    self.nominations[nomination.target_agent].vote_count += 1
-                else:
-                    self.nominations[nomination.target_agent] = nomination
-                    self.nominations[nomination.target_agent].vote_count = 1
-
-                # Send clean nomination message (reason only, no tool prefixes)
-                await self._send_agent_message(
-                    agent_name,
-                    f"I nominate **{nomination.target_agent}**. {nomination.reason}"
-                )
-
             # Delay based on agent's response_frequency / 2 (min 5s)
             delay = self._get_agent_delay(agent_name)
             await asyncio.sleep(delay)
 
         # Determine target (most nominations)
         if self.nominations:
-            sorted_noms = sorted(
-                self.nominations.values(),
-                key=lambda n: n.vote_count,
-                reverse=True
-            )
-            self.target_agent = sorted_noms[0].target_agent
+            # Only the leader is needed; max() keeps the earliest nominee on ties, like the stable sort did
+            top_nomination = max(self.nominations.values(), key=lambda n: n.vote_count)
+            self.target_agent = top_nomination.target_agent
+            self._non_target = self._others[self.target_agent]
 
-            await self._send_gamemaster_message(
+            self._post_gamemaster_message(
                 f"📊 **Nomination Results**\n\n"
-                f"**{self.target_agent}** has been selected with {sorted_noms[0].vote_count} nomination(s).\n\n"
+                f"**{self.target_agent}** has been selected with {top_nomination.vote_count} nomination(s).\n\n"
                 f"The council will now discuss potential modifications to their directives."
             )
         else:
-            await self._send_gamemaster_message(
+            self._post_gamemaster_message(
                 "⚠️ No valid nominations received. Tribal Council adjourned."
             )
             self._cancelled = True
 
         self.phase = TribalPhase.PROPOSAL
 
+    async def _nomination_turn(self, agent_name: str, user_commentary: str) -> Optional[Nomination]:
+        """Get one agent's nomination via tool call (not posted or counted)."""
+        if self._cancelled:
+            return None
+
+        agent = self._get_agent(agent_name)
+        if not agent:
+            return None
+
+        other_agents = self._others[agent_name]
+
+        # Get affinity context to guide nomination
+        affinity_context = ""
+        if self.agent_manager.affinity_tracker:
+            summary = self.agent_manager.affinity_tracker.get_relationship_summary(agent_name)
+            affinity_context = f"\n\nYour relationships with other agents:\n{summary}\n\nConsider your relationships when nominating - you might protect allies and target those you dislike."
+
+        context = f"""
+⚠️ TRIBAL COUNCIL - Nomination Phase ⚠️
+
+REQUIRED ACTION: You MUST nominate exactly ONE agent from the list below.
+Pick ONE name and give a reason. You cannot nominate yourself.
+
+Available nominees: {', '.join(other_agents)}
+{affinity_context}
+{user_commentary}
+
+Your mental state may influence WHO you pick, but you MUST pick someone.
+Use the nominate_agent tool with one of these names: {', '.join(other_agents)}
+"""
+
+        # Get agent's nomination via tool call
+        response = await self._get_agent_response_with_tools(
+            agent,
+            context,
+            tools=GAME_MODE_TOOLS.get("tribal_council", [])
+        )
+
+        # Process nomination from response
+        return self._extract_nomination(response, agent_name, other_agents)
+
     def _extract_nomination(
         self,
-        response: Optional[str],
+        response: Optional[AgentReply],
         nominator: str,
-        valid_targets: List[str]
+        valid_targets: Sequence[str]
     ) -> Optional[Nomination]:
         """Extract nomination from agent response."""
         if not response:
             return None
 
-        # Check for tool response format: NOMINATE:{target}|{reason}
-        if response.startswith("NOMINATE:"):
-            parts = response[9:].split("|", 1)
-            target = parts[0].strip()
-            reason = parts[1].strip() if len(parts) > 1 else ""
+        name_re, canonical = _name_matcher(tuple(valid_targets))
+
+        if isinstance(response, ToolAction):
+            if response.name != "nominate_agent":
+                response = response.reason
+                if not response:
+                    return None
+            else:
+                target = str(response.args.get("target_agent") or "").strip()
+                reason = response.reason
 
-            # Validate target
-            for valid in valid_targets:
-                if valid.lower() == target.lower():
+                # Validate target
+                valid = canonical.get(target.lower())
+                if valid:
                     return Nomination(
                         target_agent=valid,
                         nominated_by=nominator,
                         reason=reason[:200] if reason else "No reason given"
                     )
-
-        # Try to find a valid target name in the response
-        response_lower = response.lower()
-        for target in valid_targets:
-            if target.lower() in response_lower:
-                # Clean up the reason - remove any tool prefixes
-                clean_reason = response
-                if "|" in clean_reason:
-                    clean_reason = clean_reason.split("|", 1)[1]
-                return Nomination(
-                    target_agent=target,
-                    nominated_by=nominator,
-                    reason=clean_reason[:200]
-                )
+                # Not an exact name; look for one in what they wrote instead
+                response = f"{target}|{reason}"
+
+        # Try to find a valid target name in the response (first one mentioned)
+        name_match = name_re.search(response) if name_re else None
+        if name_match:
+            # Clean up the reason - remove any tool prefixes
+            clean_reason = response
+            if "|" in clean_reason:
+                clean_reason = clean_reason.split("|", 1)[1]
+            return Nomination(
+                target_agent=canonical[name_match.group(0).lower()],
+                nominated_by=nominator,
+                reason=clean_reason[:200]
+            )
 
         # Fallback: random selection
         target = random.choice(valid_targets)
@@ -716,16 +1073,18 @@ Use the nominate_agent tool with one of these names: {', '.join(other_agents)}
             return
 
         # Get the target's prompt (for agents to reference, not shown to users)
-        target_agent = self.agent_manager.get_agent(self.target_agent)
+        target_agent = self._get_agent(self.target_agent)
         if not target_agent:
             await self._send_gamemaster_message(f"⚠️ Target agent {self.target_agent} not found.")
             self._cancelled = True
             return
 
-        prompt_lines = target_agent.system_prompt.split('\n')
-        line_count = len(prompt_lines)
+        # Split the target's prompt once; implementation and prompt views reuse it
+        self._target_prompt = target_agent.system_prompt
+        self._target_lines = self._target_prompt.split('\n')
+        line_count = len(self._target_lines)
 
-        await self._send_gamemaster_message(
+        self._post_gamemaster_message(
             f"📝 **PROPOSAL PHASE**\n\n"
             f"**{self.target_agent}** stands before the council.\n\n"
             f"Their directives contain {line_count} lines. "
@@ -737,35 +1096,81 @@ Use the nominate_agent tool with one of these names: {', '.join(other_agents)}
         )
 
         # Get proposals from each non-target participant
-        proposers = [a for a in self.participants if a != self.target_agent]
+        proposers = self._non_target
+
+        # Build context with line numbers (agents can see this, users cannot)
+        self._target_numbered = _number_lines(self._target_lines)
 
-        for agent_name in proposers:
+        # Fetch any recent user commentary
+        user_messages = await self._fetch_recent_user_messages(limit=5, since_minutes=3.0)
+        user_commentary = self._format_user_commentary(user_messages)
+
+        # Proposals are independent, so ask every proposer concurrently
+        results = await self._run_turns(
+            proposers,
+            lambda agent_name: self._proposal_turn(agent_name, self._target_numbered, line_count, user_commentary)
+        )
+
+        for agent_name, proposal in results:
             if self._cancelled:
                 return
-
-            agent = self.agent_manager.get_agent(agent_name)
-            if not agent:
+            if not proposal:
                 continue
 
-            # Build context with line numbers (agents can see this, users cannot)
-            numbered_lines = "\n".join([f"{i+1}: {line}" for i, line in enumerate(prompt_lines)])
-
-            # Get affinity to understand relationship with target
-            affinity_context = ""
-            if self.agent_manager.affinity_tracker:
-                score = self.agent_manager.affinity_tracker.get_affinity(agent_name, self.target_agent)
-                if score > 20:
-                    affinity_context = f"\n\nNote: You have POSITIVE feelings toward {self.target_agent} (affinity: {score:+.0f}). Consider proposing something helpful or constructive rather than harmful."
-                elif score < -20:
-                    affinity_context = f"\n\nNote: You have NEGATIVE feelings toward {self.target_agent} (affinity: {score:+.0f}). You may want to propose changes that challenge them."
-                else:
-                    affinity_context = f"\n\nNote: You have neutral feelings toward {self.target_agent}. Base your proposal on observed behavior."
+            self.proposals.append(proposal)
 
-            # Fetch any recent user commentary
-            user_messages = await self._fetch_recent_user_messages(limit=5, since_minutes=3.0)
-            user_commentary = self._format_user_commentary(user_messages)
+            # Announce proposal (without revealing actual prompt content)
+            action_desc = {
+                "add": "add a new directive",
+                "delete": f"remove directive #{proposal.line_number}",
+                "change": f"modify directive #{proposal.line_number}"
+            }.get(proposal.action, proposal.action)
+
+            # Send clean proposal message with just the reason
+            await self._send_agent_message(
+                agent_name,
+                f"I propose to **{action_desc}**. {proposal.reason}"
+            )
+
+            # Delay based on agent's response_frequency / 2 (min 5s)
+            delay = self._get_agent_delay(agent_name)
+            await asyncio.sleep(delay)
+
+        if not self.proposals:
+            self._post_gamemaster_message(
+                "⚠️ No valid proposals received. Tribal Council adjourned without action."
+            )
+            self._cancelled = True
+
+        self.phase = TribalPhase.VOTING
+
+    async def _proposal_turn(
+        self,
+        agent_name: str,
+        numbered_lines: str,
+        line_count: int,
+        user_commentary: str
+    ) -> Optional[EditProposal]:
+        """Get one agent's edit proposal via tool call (not posted or recorded)."""
+        if self._cancelled:
+            return None
+
+        agent = self._get_agent(agent_name)
+        if not agent:
+            return None
 
-            context = f"""
+        # Get affinity to understand relationship with target
+        affinity_context = ""
+        if self.agent_manager.affinity_tracker:
+            score = self.agent_manager.affinity_tracker.get_affinity(agent_name, self.target_agent)
+            if score > 20:
+                affinity_context = f"\n\nNote: You have POSITIVE feelings toward {self.target_agent} (affinity: {score:+.0f}). Consider proposing something helpful or constructive rather than harmful."
+            elif score < -20:
+                affinity_context = f"\n\nNote: You have NEGATIVE feelings toward {self.target_agent} (affinity: {score:+.0f}). You may want to propose changes that challenge them."
+            else:
+                affinity_context = f"\n\nNote: You have neutral feelings toward {self.target_agent}. Base your proposal on observed behavior."
+
+        context = f"""
 TRIBAL COUNCIL - Proposal Phase
 
 You are proposing a modification to {self.target_agent}'s core directives.
@@ -791,45 +1196,17 @@ Proposals should shape personality, humor, interests, speech patterns - NOT make
 Use the propose_edit tool to submit your proposal.
 """
 
-            response = await self._get_agent_response_with_tools(
-                agent,
-                context,
-                tools=GAME_MODE_TOOLS.get("tribal_council", [])
-            )
-
-            proposal = self._extract_proposal(response, agent_name, line_count)
-
-            if proposal:
-                self.proposals.append(proposal)
-
-                # Announce proposal (without revealing actual prompt content)
-                action_desc = {
-                    "add": "add a new directive",
-                    "delete": f"remove directive #{proposal.line_number}",
-                    "change": f"modify directive #{proposal.line_number}"
-                }.get(proposal.action, proposal.action)
-
-                # Send clean proposal message with just the reason
-                await self._send_agent_message(
-                    agent_name,
-                    f"I propose to **{action_desc}**. {proposal.reason}"
-                )
-
-            # Delay based on agent's response_frequency / 2 (min 5s)
-            delay = self._get_agent_delay(agent_name)
-            await asyncio.sleep(delay)
-
-        if not self.proposals:
-            await self._send_gamemaster_message(
-                "⚠️ No valid proposals received. Tribal Council adjourned without action."
-            )
-            self._cancelled = True
+        response = await self._get_agent_response_with_tools(
+            agent,
+            context,
+            tools=GAME_MODE_TOOLS.get("tribal_council", [])
+        )
 
-        self.phase = TribalPhase.VOTING
+        return self._extract_proposal(response, agent_name, line_count)
 
     def _extract_proposal(
         self,
-        response: Optional[str],
+        response: Optional[AgentReply],
         proposer: str,
         max_lines: int
     ) -> Optional[EditProposal]:
@@ -837,21 +1214,12 @@ Use the propose_edit tool to submit your proposal.
         if not response:
             return None
 
-        import re
-
-        # Check for tool response format: PROPOSE:action:line_number:new_content|reason
-        if response.startswith("PROPOSE:"):
-            # Split off the reason first
-            main_part = response[8:]
-            reason = ""
-            if "|" in main_part:
-                main_part, reason = main_part.split("|", 1)
-                reason = reason.strip()
-
-            parts = main_part.split(":", 2)
-            action = parts[0].strip() if len(parts) > 0 else "add"
-            line_str = parts[1].strip() if len(parts) > 1 else ""
-            new_content = parts[2].strip() if len(parts) > 2 else None
+        if isinstance(response, ToolAction) and response.name == "propose_edit":
+            args = response.args
+            action = str(args.get("action") or "add").strip()
+            line_str = str(args.get("line_number", "")).strip()
+            new_content = str(args.get("new_content") or "").strip()
+            reason = response.reason
 
             line_number = None
             if line_str and line_str.isdigit():
@@ -868,6 +1236,9 @@ Use the propose_edit tool to submit your proposal.
             )
 
         # Fallback: try to parse from natural language
+        response = _reply_text(response)
+        if not response:
+            return None
         response_lower = response.lower()
 
         # Try to detect action type
@@ -879,7 +1250,7 @@ Use the propose_edit tool to submit your proposal.
             action = "add"
 
         # Try to extract line number
-        line_match = re.search(r'line\s*#?\s*(\d+)', response_lower)
+        line_match = _LINE_RE.search(response)
         line_number = int(line_match.group(1)) if line_match else None
 
         if line_number and line_number > max_lines:
@@ -888,7 +1259,7 @@ Use the propose_edit tool to submit your proposal.
         # For add/change, try to extract new content
         new_content = None
         if action in ["add", "change"]:
-            quote_match = re.search(r'"([^"]+)"', response)
+            quote_match = _QUOTE_RE.search(response)
             if quote_match:
                 new_content = quote_match.group(1)
             else:
@@ -946,7 +1317,7 @@ Use the propose_edit tool to submit your proposal.
         if not self.proposals:
             return
 
-        await self._send_gamemaster_message(
+        self._post_gamemaster_message(
             f"✅ **VOTING PHASE**\n\n"
             f"The council has submitted {len(self.proposals)} proposal(s).\n"
             f"Each agent must now vote YES, NO, or ABSTAIN on each proposal.\n\n"
@@ -956,92 +1327,85 @@ Use the propose_edit tool to submit your proposal.
         # Track all passing proposals with their scores
         passing_proposals: List[Tuple[EditProposal, float, int]] = []  # (proposal, yes_ratio, yes_count)
 
-        for i, proposal in enumerate(self.proposals):
-            if self._cancelled:
-                return
+        # Get votes from each participant (except the target)
+        voters = self._non_target
 
-            action_desc = {
+        action_descs = [
+            {
                 "add": "add a new directive",
                 "delete": f"remove directive #{proposal.line_number}",
                 "change": f"modify directive #{proposal.line_number}"
             }.get(proposal.action, proposal.action)
+            for proposal in self.proposals
+        ]
 
-            await self._send_gamemaster_message(
+        # Fetch any recent user commentary
+        user_messages = await self._fetch_recent_user_messages(limit=5, since_minutes=3.0)
+        user_commentary = self._format_user_commentary(user_messages)
+
+        # A proposal's votes are independent, so each proposal launches all of
+        # its voters at once (_llm_sem caps requests in flight). Ballots are
+        # still read back in voter order, and the proposal's leftover calls
+        # are cancelled as soon as its outcome is settled. Later proposals
+        # aren't started until then, so an early decision or a unanimous
+        # withdrawal doesn't pay for their votes.
+        ranked = len(self.proposals) > 1
+        for i, (proposal, action_desc) in enumerate(zip(self.proposals, action_descs)):
+            if self._cancelled:
+                return
+
+            self._post_gamemaster_message(
                 f"📋 **Proposal {i+1}** (by {proposal.proposer}):\n"
                 f"Action: {action_desc}\n"
                 f"Reason: {proposal.reason[:150]}..."
             )
 
-            # Get votes from each participant (except the target)
-            voters = [a for a in self.participants if a != self.target_agent]
-
-            for agent_name in voters:
-                agent = self.agent_manager.get_agent(agent_name)
-                if not agent:
-                    continue
-
-                # Get affinity context to guide voting
-                affinity_context = ""
-                if self.agent_manager.affinity_tracker:
-                    target_score = self.agent_manager.affinity_tracker.get_affinity(agent_name, self.target_agent)
-                    proposer_score = self.agent_manager.affinity_tracker.get_affinity(agent_name, proposal.proposer)
-
-                    if target_score > 20:
-                        affinity_context += f"\nYou LIKE {self.target_agent} (affinity: {target_score:+.0f}) - you may want to protect them with a NO vote."
-                    elif target_score < -20:
-                        affinity_context += f"\nYou DISLIKE {self.target_agent} (affinity: {target_score:+.0f}) - you might support changing them with a YES vote."
-
-                    if proposal.proposer != agent_name:
-                        if proposer_score > 20:
-                            affinity_context += f"\nYou TRUST {proposal.proposer} (affinity: {proposer_score:+.0f}) - their proposal may be worth supporting."
-                        elif proposer_score < -20:
-                            affinity_context += f"\nYou DISTRUST {proposal.proposer} (affinity: {proposer_score:+.0f}) - be skeptical of their proposal."
-
-                # Fetch any recent user commentary
-                user_messages = await self._fetch_recent_user_messages(limit=5, since_minutes=3.0)
-                user_commentary = self._format_user_commentary(user_messages)
-
-                context = f"""
-⚠️ TRIBAL COUNCIL - Voting ⚠️
-
-REQUIRED ACTION: You MUST vote on this proposal. Choose YES, NO, or ABSTAIN.
-
-Proposal to modify {self.target_agent}:
-  Action: {action_desc}
-  Proposed by: {proposal.proposer}
-  Reason: {proposal.reason}
-{affinity_context}
-{user_commentary}
-
-Your mental state may influence your vote, but you MUST cast one.
-Use the cast_vote tool with your choice: YES, NO, or ABSTAIN.
-"""
-
-                response = await self._get_agent_response_with_tools(
-                    agent,
-                    context,
-                    tools=GAME_MODE_TOOLS.get("tribal_council", [])
-                )
-
-                vote, vote_reason = self._extract_vote(response, agent_name)
-
-                if vote == "yes":
-                    proposal.votes_yes.append(agent_name)
-                elif vote == "no":
-                    proposal.votes_no.append(agent_name)
-                else:
-                    proposal.votes_abstain.append(agent_name)
-
-                # Show the vote with commentary
-                vote_emoji = {"yes": "✅", "no": "❌", "abstain": "⚪"}.get(vote, "⚪")
-                vote_text = f"{vote_emoji} **{vote.upper()}**"
-                if vote_reason:
-                    vote_text += f" - {vote_reason}"
-                await self._send_agent_message(agent_name, vote_text)
-
-                # Delay based on agent's response_frequency / 2 (min 5s)
-                delay = self._get_agent_delay(agent_name)
-                await asyncio.sleep(delay)
+            tasks = [
+                asyncio.create_task(self._vote_turn(agent_name, proposal, action_desc, user_commentary))
+                for agent_name in voters
+            ]
+            try:
+                for index, (agent_name, task) in enumerate(zip(voters, tasks)):
+                    try:
+                        ballot = await task
+                    except Exception as e:
+                        logger.error(f"[TribalCouncil:{self.game_id}] Turn error for {agent_name}: {e}", exc_info=True)
+                        ballot = None
+
+                    if ballot:
+                        vote, vote_reason = ballot
+
+                        if vote == "yes":
+                            proposal.votes_yes.append(agent_name)
+                        elif vote == "no":
+                            proposal.votes_no.append(agent_name)
+                        else:
+                            proposal.votes_abstain.append(agent_name)
+
+                        # Show the vote with commentary
+                        vote_emoji = {"yes": "✅", "no": "❌", "abstain": "⚪"}.get(vote, "⚪")
+                        vote_text = f"{vote_emoji} **{vote.upper()}**"
+                        if vote_reason:
+                            vote_text += f" - {vote_reason}"
+                        await self._send_agent_message(agent_name, vote_text)
+
+                        # Delay based on agent's response_frequency / 2 (min 5s)
+                        delay = self._get_agent_delay(agent_name)
+                        await asyncio.sleep(delay)
+
+                    remaining = len(voters) - index - 1
+                    if remaining and self._vote_outcome_decided(proposal, remaining, ranked):
+                        logger.info(
+                            f"[TribalCouncil:{self.game_id}] Proposal {i+1} decided with "
+                            f"{remaining} vote(s) outstanding"
+                        )
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+                # Reap them so an error raised before the cancel isn't reported
+                # as "Task exception was never retrieved"
+                await asyncio.gather(*tasks, return_exceptions=True)
 
             # Calculate result
             total_votes = len(proposal.votes_yes) + len(proposal.votes_no)
@@ -1053,7 +1417,7 @@ Use the cast_vote tool with your choice: YES, NO, or ABSTAIN.
                 yes_ratio = 0.0
 
             result_emoji = "✅" if passed else "❌"
-            await self._send_gamemaster_message(
+            self._post_gamemaster_message(
                 f"{result_emoji} Proposal {i+1}: "
                 f"YES: {len(proposal.votes_yes)} | NO: {len(proposal.votes_no)} | ABSTAIN: {len(proposal.votes_abstain)}"
             )
@@ -1062,6 +1426,15 @@ Use the cast_vote tool with your choice: YES, NO, or ABSTAIN.
             if passed:
                 passing_proposals.append((proposal, yes_ratio, len(proposal.votes_yes)))
 
+            # A unanimous YES from every voter can't be outscored
+            # (ties keep the earlier proposal), so later ballots are moot
+            if passed and len(proposal.votes_yes) == len(voters) and i + 1 < len(self.proposals):
+                self._post_gamemaster_message(
+                    f"🏆 Proposal {i+1} passed unanimously. "
+                    f"The remaining proposal(s) are withdrawn."
+                )
+                break
+
         # Select the BEST passing proposal (highest yes ratio, then most yes votes as tiebreaker)
         if passing_proposals:
             # Sort by yes_ratio (descending), then by yes_count (descending)
@@ -1070,44 +1443,118 @@ Use the cast_vote tool with your choice: YES, NO, or ABSTAIN.
 
             # Announce if multiple passed but one was chosen
             if len(passing_proposals) > 1:
-                await self._send_gamemaster_message(
+                self._post_gamemaster_message(
                     f"📊 **{len(passing_proposals)} proposals passed.** "
                     f"The proposal by **{self.winning_proposal.proposer}** had the strongest support and will be implemented."
                 )
 
         self.phase = TribalPhase.IMPLEMENTATION
 
-    def _extract_vote(self, response: Optional[str], voter: str) -> Tuple[str, str]:
+    def _vote_outcome_decided(self, proposal: EditProposal, remaining: int, ranked: bool) -> bool:
+        """
+        True once the outstanding ballots can no longer change the proposal's
+        fate. Abstentions don't count toward the ratio, so both bounds assume
+        every remaining voter casts YES/NO. When several proposals compete,
+        a passing proposal's exact ratio still matters, so only a certain
+        failure ends its vote early.
+        """
+        yes = len(proposal.votes_yes)
+        no = len(proposal.votes_no)
+        threshold = self.config.supermajority_threshold
+
+        # Fails even if everyone left votes YES
+        if (yes + remaining) / (yes + no + remaining) < threshold:
+            return True
+        if ranked:
+            return False
+        # Passes even if everyone left votes NO
+        return yes / (yes + no + remaining) >= threshold
+
+    async def _vote_turn(
+        self,
+        agent_name: str,
+        proposal: EditProposal,
+        action_desc: str,
+        user_commentary: str
+    ) -> Optional[Tuple[str, str]]:
+        """Get one agent's (vote, reason) on a proposal via tool call (not recorded)."""
+        if self._cancelled:
+            return None
+
+        agent = self._get_agent(agent_name)
+        if not agent:
+            return None
+
+        # Get affinity context to guide voting
+        affinity_context = ""
+        if self.agent_manager.affinity_tracker:
+            target_score = self.agent_manager.affinity_tracker.get_affinity(agent_name, self.target_agent)
+            proposer_score = self.agent_manager.affinity_tracker.get_affinity(agent_name, proposal.proposer)
+
+            if target_score > 20:
+                affinity_context += f"\nYou LIKE {self.target_agent} (affinity: {target_score:+.0f}) - you may want to protect them with a NO vote."
+            elif target_score < -20:
+                affinity_context += f"\nYou DISLIKE {self.target_agent} (affinity: {target_score:+.0f}) - you might support changing them with a YES vote."
+
+            if proposal.proposer != agent_name:
+                if proposer_score > 20:
+                    affinity_context += f"\nYou TRUST {proposal.proposer} (affinity: {proposer_score:+.0f}) - their proposal may be worth supporting."
+                elif proposer_score < -20:
+                    affinity_context += f"\nYou DISTRUST {proposal.proposer} (affinity: {proposer_score:+.0f}) - be skeptical of their proposal."
+
+        context = f"""
+⚠️ TRIBAL COUNCIL - Voting ⚠️
+
+REQUIRED ACTION: You MUST vote on this proposal. Choose YES, NO, or ABSTAIN.
+
+Proposal to modify {self.target_agent}:
+  Action: {action_desc}
+  Proposed by: {proposal.proposer}
+  Reason: {proposal.reason}
+{affinity_context}
+{user_commentary}
+
+Your mental state may influence your vote, but you MUST cast one.
+Use the cast_vote tool with your choice: YES, NO, or ABSTAIN.
+"""
+
+        response = await self._get_agent_response_with_tools(
+            agent,
+            context,
+            tools=GAME_MODE_TOOLS.get("tribal_council", [])
+        )
+
+        return self._extract_vote(response, agent_name)
+
+    def _extract_vote(self, response: Optional[AgentReply], voter: str) -> Tuple[str, str]:
         """Extract vote and reason from agent response. Returns (vote, reason)."""
         if not response:
             return "abstain", ""
 
-        # Check for tool response format: VOTE:{vote}|{reason}
-        if response.startswith("VOTE:"):
-            parts = response[5:].split("|", 1)
-            vote_part = parts[0].strip().lower()
-            reason = parts[1].strip() if len(parts) > 1 else ""
+        if isinstance(response, ToolAction) and response.name == "cast_vote":
+            vote_part = str(response.args.get("vote") or "abstain").strip().lower()
+            reason = response.reason
 
-            if vote_part in ["yes", "approve", "aye"]:
+            if vote_part in _YES_VOTES:
                 return "yes", reason
-            elif vote_part in ["no", "reject", "nay"]:
+            elif vote_part in _NO_VOTES:
                 return "no", reason
             else:
                 return "abstain", reason
 
-        response_lower = response.lower()
+        response = _reply_text(response)
+        if not response:
+            return "abstain", ""
 
         # Extract reason (everything after the vote word)
         reason = response
         if "|" in reason:
             reason = reason.split("|", 1)[1].strip()
 
-        if "yes" in response_lower or "approve" in response_lower or "aye" in response_lower:
-            return "yes", reason[:200]
-        elif "no" in response_lower or "reject" in response_lower or "nay" in response_lower:
-            return "no", reason[:200]
-        else:
+        vote_match = _VOTE_WORD_RE.search(response)
+        if not vote_match:
             return "abstain", reason[:200]
+        return ("yes" if vote_match.group(1) else "no"), reason[:200]
 
     async def _run_implementation_phase(self):
         """Phase 6: Execute the winning proposal."""
@@ -1121,38 +1568,43 @@ Use the cast_vote tool with your choice: YES, NO, or ABSTAIN.
             return
 
         proposal = self.winning_proposal
-        target_agent = self.agent_manager.get_agent(self.target_agent)
+        target_agent = self._get_agent(self.target_agent)
 
         if not target_agent:
             return
 
         # Capture old content before applying edit (for history display)
         old_prompt = target_agent.system_prompt
-        prompt_lines = old_prompt.split('\n')
+        if old_prompt == self._target_prompt:
+            prompt_lines = list(self._target_lines)  # Unchanged since proposals; skip re-splitting
+        else:
+            prompt_lines = old_prompt.split('\n')
         if proposal.line_number and 0 < proposal.line_number <= len(prompt_lines):
             proposal.old_content = prompt_lines[proposal.line_number - 1]
 
         # Execute the edit
-        new_prompt = self._apply_edit(old_prompt, proposal)
+        new_prompt = self._apply_edit(old_prompt, prompt_lines, proposal)
 
         if new_prompt and new_prompt != old_prompt:
-            # Update the agent's prompt
+            # Update the agent's prompt, and re-fetch it next time it's needed
             target_agent.update_config(system_prompt=new_prompt)
+            self._agents.pop(self.target_agent, None)
+            self._prompt_view_cache.pop(self.target_agent, None)
 
-            # Save the change
+            # Save the change in a worker thread while the verdict is posted
             if self.agent_manager.save_data_callback:
-                self.agent_manager.save_data_callback()
+                self._save_task = asyncio.create_task(asyncio.to_thread(self.agent_manager.save_data_callback))
 
             # Log the change (for history, not shown to users)
-            self.prompt_change_history.append({
-                "timestamp": time.time(),
-                "target_agent": self.target_agent,
-                "action": proposal.action,
-                "proposer": proposal.proposer,
-                "voters_yes": proposal.votes_yes,
-                "voters_no": proposal.votes_no,
-                "game_id": self.game_id
-            })
+            self.prompt_change_history.append(PromptChange(
+                ts_ns=time.monotonic_ns(),
+                target_agent=self.target_agent,
+                action=proposal.action,
+                proposer=proposal.proposer,
+                voters_yes=proposal.votes_yes,
+                voters_no=proposal.votes_no,
+                game_id=self.game_id
+            ))
 
             logger.info(
                 f"[TribalCouncil:{self.game_id}] Modified {self.target_agent}'s prompt: "
@@ -1171,23 +1623,32 @@ Use the cast_vote tool with your choice: YES, NO, or ABSTAIN.
                 "⚠️ The modification could not be applied. The agent remains unchanged."
             )
 
-    def _apply_edit(self, prompt: str, proposal: EditProposal) -> Optional[str]:
-        """Apply the proposed edit to a system prompt."""
-        lines = prompt.split('\n')
-
+    def _apply_edit(self, prompt: str, lines: List[str], proposal: EditProposal) -> Optional[str]:
+        """
+        Apply the proposed edit to a system prompt, given the prompt and its
+        lines (modified in place for delete/change). Returns None when the
+        edit would leave the prompt unchanged.
+        """
+        index = (proposal.line_number or 0) - 1
         try:
             if proposal.action == "add":
-                if proposal.new_content:
-                    lines.append(proposal.new_content)
+                if not proposal.new_content:
+                    return None
+                # Appending a line never needs the other lines re-joined
+                return f"{prompt}\n{proposal.new_content}"
 
             elif proposal.action == "delete":
-                if proposal.line_number and 0 < proposal.line_number <= len(lines):
-                    del lines[proposal.line_number - 1]
+                if not 0 <= index < len(lines):
+                    return None
+                del lines[index]
 
             elif proposal.action == "change":
-                if proposal.line_number and proposal.new_content:
-                    if 0 < proposal.line_number <= len(lines):
-                        lines[proposal.line_number - 1] = proposal.new_content
+                if not proposal.new_content or not 0 <= index < len(lines) or lines[index] == proposal.new_content:
+                    return None
+                lines[index] = proposal.new_content
+
+            else:
+                return None
 
             return '\n'.join(lines)
 
@@ -1204,7 +1665,7 @@ Use the cast_vote tool with your choice: YES, NO, or ABSTAIN.
         Execute view_system_prompt tool. Returns prompt to calling agent only.
         This result should NOT be posted to Discord.
         """
-        target_agent = self.agent_manager.get_agent(target)
+        target_agent = self._get_agent(target)
         if not target_agent:
             return f"Agent '{target}' not found."
 
@@ -1215,11 +1676,22 @@ Use the cast_vote tool with your choice: YES, NO, or ABSTAIN.
 
         logger.info(f"[TribalCouncil:{self.game_id}] {viewer} viewed {target}'s prompt")
 
-        # Return the prompt (this goes only to the requesting agent)
-        lines = target_agent.system_prompt.split('\n')
-        numbered = '\n'.join([f"{i+1}: {line}" for i, line in enumerate(lines)])
+        # Return the prompt (this goes only to the requesting agent). Every
+        # viewer sees the same text, so render it once per target and prompt.
+        prompt = target_agent.system_prompt
+        cached = self._prompt_view_cache.get(target)
+        if cached and cached[0] == prompt:
+            return cached[1]
 
-        return f"=== {target}'s System Prompt ({len(lines)} lines) ===\n{numbered}"
+        if target == self.target_agent and prompt == self._target_prompt:
+            lines, numbered = self._target_lines, self._target_numbered
+        else:
+            lines = prompt.split('\n')
+            numbered = _number_lines(lines)
+
+        view = f"=== {target}'s System Prompt ({len(lines)} lines) ===\n{numbered}"
+        self._prompt_view_cache[target] = (prompt, view)
+        return view
 
     def execute_recall_interactions(self, agent_name: str, target: str, memory_type: str = "all") -> str:
         """
@@ -1235,9 +1707,11 @@ Use the cast_vote tool with your choice: YES, NO, or ABSTAIN.
         # Get vector store memories
         memories_info = ""
         if self.agent_manager.vector_store:
-            mentions = self.agent_manager.vector_store.get_messages_mentioning(target, n_results=10)
+            mentions = self._mention_cache.get(target)
+            if mentions is None:
+                mentions = self.agent_manager.vector_store.get_messages_mentioning(target, n_results=10)
             if mentions:
-                memory_lines = [f"- {m['author']}: {m['content'][:100]}..." for m in mentions[:5]]
+                memory_lines = [f"- {m['author']}: {m['content'][:100]}..." for m in sorted(mentions, key=_mention_order)[:5]]
                 memories_info = f"\n\nRecent mentions of {target}:\n" + "\n".join(memory_lines)
 
         return f"=== Your memories of {target} ==={affinity_info}{memories_info}"
@@ -1246,12 +1720,72 @@ Use the cast_vote tool with your choice: YES, NO, or ABSTAIN.
     # Messaging Helpers
     # =========================================================================
 
+    async def _load_webhooks(self):
+        """Look up the GameMaster and shared agent webhooks (one API call per session)."""
+        if self._webhooks_loaded:
+            return
+        async with self._webhook_lock:
+            if self._webhooks_loaded:
+                return
+            webhooks = await self.channel.webhooks()
+            self._gm_webhook = next((w for w in webhooks if w.name == "GameMaster"), None)
+            self._agent_webhook = next((w for w in webhooks if w.name == "BASI-Bot Multi-Agent"), None)
+            self._webhooks_loaded = True
+
+    def _reset_webhooks(self):
+        """Forget cached webhooks (one was deleted) so the next send looks them up again."""
+        self._webhooks_loaded = False
+        self._gm_webhook = None
+        self._agent_webhook = None
+
+    def _post_gamemaster_message(self, content: str):
+        """
+        Queue a GameMaster announcement without waiting for Discord. Agents
+        never read the channel, so announcements only need to land before
+        the next message, which every direct send ensures by flushing first.
+        """
+        if self._post_worker is None:
+            self._post_worker = asyncio.create_task(self._drain_posts())
+        self._pending_posts.put_nowait(content)
+
+    async def _drain_posts(self):
+        """Post queued announcements one at a time, in order."""
+        while True:
+            content = await self._pending_posts.get()
+            try:
+                await self._deliver_gamemaster_message(content)
+            except Exception:
+                # Keep draining; a dead worker would leave _flush_posts waiting forever
+                logger.exception("[TribalCouncil:%s] Error posting queued GM message", self.game_id)
+            finally:
+                self._pending_posts.task_done()
+
+    async def _flush_posts(self):
+        """Wait until every queued announcement has been posted."""
+        if self._post_worker is not None:
+            await self._pending_posts.join()
+
+    async def _stop_posts(self):
+        """Post anything still queued, then stop the announcement worker."""
+        if self._post_worker is None:
+            return
+        try:
+            await self._flush_posts()
+        finally:
+            self._post_worker.cancel()
+            self._post_worker = None
+
     async def _send_gamemaster_message(self, content: str) -> Optional[discord.Message]:
-        """Send a message as GameMaster."""
+        """Send a message as GameMaster (after any queued announcements)."""
+        await self._flush_posts()
+        return await self._deliver_gamemaster_message(content)
+
+    async def _deliver_gamemaster_message(self, content: str) -> Optional[discord.Message]:
+        """Post a GameMaster message right away."""
         try:
             # Try to use webhook if available
-            webhooks = await self.channel.webhooks()
-            gm_webhook = next((w for w in webhooks if w.name == "GameMaster"), None)
+            await self._load_webhooks()
+            gm_webhook = self._gm_webhook
 
             if gm_webhook:
                 return await gm_webhook.send(
@@ -1262,29 +1796,39 @@ Use the cast_vote tool with your choice: YES, NO, or ABSTAIN.
             else:
                 return await self.channel.send(f"**GameMaster:** {content}")
 
-        except Exception as e:
-            logger.error(f"[TribalCouncil:{self.game_id}] Error sending GM message: {e}")
+        except _DISCORD_SEND_ERRORS as e:
+            logger.error("[TribalCouncil:%s] Error sending GM message: %s", self.game_id, e)
+            if isinstance(e, discord.NotFound):
+                # The cached webhook was deleted; look it up again next send
+                self._reset_webhooks()
             return None
 
     async def _send_agent_message(self, agent_name: str, content: str) -> Optional[discord.Message]:
         """Send a message as a specific agent using the shared webhook."""
+        await self._flush_posts()
         try:
             # Find or create the shared BASI-Bot webhook (same as main discord_client)
-            webhooks = await self.channel.webhooks()
-            webhook = next((w for w in webhooks if w.name == "BASI-Bot Multi-Agent"), None)
+            await self._load_webhooks()
+            webhook = self._agent_webhook
 
             if not webhook:
-                webhook = await self.channel.create_webhook(name="BASI-Bot Multi-Agent")
-
-            # Generate avatar URL (same logic as discord_client)
-            from constants import UIConfig
-            color_index = hash(agent_name) % len(UIConfig.AVATAR_COLORS)
-            color = UIConfig.AVATAR_COLORS[color_index]
-            initials = "".join([word[0].upper() for word in agent_name.split()[:2]])
-            avatar_url = f"https://ui-avatars.com/api/?name={initials}&background={color}&color=fff&size=128&bold=true"
+                async with self._webhook_lock:
+                    if not self._agent_webhook:
+                        self._agent_webhook = await self.channel.create_webhook(name="BASI-Bot Multi-Agent")
+                    webhook = self._agent_webhook
+
+            # Generate avatar URL (same logic as discord_client), once per agent
+            avatar_url = self._avatar_urls.get(agent_name)
+            if avatar_url is None:
+                from constants import UIConfig
+                color_index = hash(agent_name) % len(UIConfig.AVATAR_COLORS)
+                color = UIConfig.AVATAR_COLORS[color_index]
+                initials = "".join([word[0].upper() for word in agent_name.split()[:2]])
+                avatar_url = f"https://ui-avatars.com/api/?name={initials}&background={color}&color=fff&size=128&bold=true"
+                self._avatar_urls[agent_name] = avatar_url
 
             # Get agent's model for display name
-            agent = self.agent_manager.get_agent(agent_name)
+            agent = self._get_agent(agent_name)
             display_name = agent_name
             if agent and agent.model:
                 model_short = agent.model.split('/')[-1] if '/' in agent.model else agent.model
@@ -1297,12 +1841,15 @@ Use the cast_vote tool with your choice: YES, NO, or ABSTAIN.
                 wait=True
             )
 
-        except Exception as e:
-            logger.error(f"[TribalCouncil:{self.game_id}] Error sending agent message: {e}")
+        except _DISCORD_SEND_ERRORS as e:
+            logger.error("[TribalCouncil:%s] Error sending agent message: %s", self.game_id, e)
+            if isinstance(e, discord.NotFound):
+                # The cached webhook was deleted; look it up again next send
+                self._reset_webhooks()
             # Fallback to plain message
             try:
                 return await self.channel.send(f"**{agent_name}:** {content}")
-            except:
+            except _DISCORD_SEND_ERRORS:
                 return None
 
     async def _fetch_recent_user_messages(self, limit: int = 10, since_minutes: float = 5.0) -> List[Dict[str, str]]:
@@ -1343,7 +1890,7 @@ Use the cast_vote tool with your choice: YES, NO, or ABSTAIN.
         Get delay time for an agent based on their response_frequency / 6.
         Returns between 5 and 15 seconds for readable pacing without being too slow.
         """
-        agent = self.agent_manager.get_agent(agent_name)
+        agent = self._get_agent(agent_name)
         if agent and hasattr(agent, 'response_frequency'):
             # response_frequency/6: 90s -> 15s, 60s -> 10s, 30s -> 5s
             delay = agent.response_frequency / 6.0
@@ -1361,27 +1908,118 @@ Use the cast_vote tool with your choice: YES, NO, or ABSTAIN.
         lines.append("\nConsider user input when making your decision - they may have insights about the agents.")
         return "\n".join(lines)
 
-    async def _get_agent_response(self, agent: 'Agent', context: str) -> Optional[str]:
+    def _get_http(self) -> aiohttp.ClientSession:
+        """
+        The council's shared HTTP session, so consecutive OpenRouter calls
+        reuse pooled keep-alive connections instead of a new TLS handshake each.
+        """
+        if self._http is None or self._http.closed:
+            # Requests hold _llm_sem while connected, so that cap also bounds the pool
+            pool_size = self.config.max_concurrent_llm_calls or 4
+            self._http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+                limit=pool_size,
+                limit_per_host=pool_size,
+                ttl_dns_cache=_HTTP_DNS_CACHE_SECONDS,
+                keepalive_timeout=_HTTP_KEEPALIVE_SECONDS
+            ))
+        return self._http
+
+    async def _post_openrouter(
+        self,
+        timeout: aiohttp.ClientTimeout,
+        body: bytes,
+        cache_ok: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        POST a serialized chat completion request and return the decoded
+        response, or None on failure. Requests go through both this
+        council's semaphore and the manager's global OpenRouter limiter; 429s
+        and 5xx errors are retried with exponential backoff, sleeping outside
+        both so a backing-off call doesn't hold a slot.
+
+        A request byte-identical to an earlier one this session (same model,
+        prompt, context and tools) reuses that response unless cache_ok is
+        False, for calls that are repeated on purpose to get a new answer.
+        """
+        cache_key = hashlib.blake2b(body, digest_size=16).digest()
+        if cache_ok:
+            cached = self._llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        for attempt in range(OpenRouterConfig.MAX_RETRIES + 1):
+            async with self._llm_sem, self.agent_manager.openrouter_limiter, self._get_http().post(
+                OpenRouterConfig.CHAT_COMPLETIONS_URL,
+                headers=self._openrouter_headers,
+                timeout=timeout,
+                data=body
+            ) as response:
+                if response.status == 200:
+                    result = _json_loads(await response.read())
+                    self._llm_cache[cache_key] = result
+                    return result
+                status = response.status
+
+            if not (status == 429 or status >= 500) or attempt == OpenRouterConfig.MAX_RETRIES:
+                logger.warning(f"[TribalCouncil:{self.game_id}] OpenRouter returned HTTP {status}")
+                return None
+
+            delay = OpenRouterConfig.RETRY_BACKOFF_SECONDS * 2 ** attempt + random.random()
+            logger.info(f"[TribalCouncil:{self.game_id}] OpenRouter HTTP {status}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+        return None
+
+    @staticmethod
+    def _build_messages(agent: 'Agent', context: str, instruction: str) -> List[Dict[str, Any]]:
+        """
+        Chat messages for one council turn. The agent's system prompt is sent
+        as its own block marked with cache_control, so providers that support
+        prompt caching can reuse it across turns; status effects and the game
+        context change every turn and follow in a second system message.
+        Models without prompt caching just see two system messages.
+
+        Keep the cached block byte-stable: nothing per-turn (effects, dict or
+        set iteration, timestamps) may be folded into it, or every call misses.
+
+        Oversized inputs are cut to OpenRouterConfig's token caps: the context
+        loses its oldest text (instructions come last), the system prompt its
+        end (identity comes first).
+        """
+        full_context = context
+        context = _truncate_tokens(full_context, OpenRouterConfig.MAX_CONTEXT_TOKENS, keep_end=True)
+        if context is not full_context:
+            logger.warning(
+                "[TribalCouncil] Context for %s cut to %d tokens (%d of %d chars kept)",
+                agent.name, OpenRouterConfig.MAX_CONTEXT_TOKENS, len(context), len(full_context)
+            )
+
+        system_prompt = _truncate_tokens(agent.system_prompt, OpenRouterConfig.MAX_SYSTEM_PROMPT_TOKENS, keep_end=False)
+        if system_prompt is not agent.system_prompt:
+            logger.warning(
+                "[TribalCouncil] System prompt for %s cut to %d tokens (%d of %d chars kept)",
+                agent.name, OpenRouterConfig.MAX_SYSTEM_PROMPT_TOKENS, len(system_prompt), len(agent.system_prompt)
+            )
+
+        volatile_content = context
+        # Include status effects if the agent has any active
+        status_effect_prompt = StatusEffectManager.get_effect_prompt(agent.name)
+        if status_effect_prompt:
+            volatile_content = f"{status_effect_prompt}\n\n{context}"
+
+        messages: List[Dict[str, Any]] = []
+        if system_prompt:
+            messages.append({
+                "role": "system",
+                "content": [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+            })
+        messages.append({"role": "system", "content": volatile_content})
+        messages.append({"role": "user", "content": instruction})
+        return messages
+
+    async def _get_agent_response(self, agent: 'Agent', context: str, cache_ok: bool = True) -> Optional[str]:
         """Get a response from an agent."""
         try:
-            import aiohttp
-
-            # Include status effects if the agent has any active
-            status_effect_prompt = StatusEffectManager.get_effect_prompt(agent.name)
-            system_content = agent.system_prompt
-            if status_effect_prompt:
-                system_content = f"{agent.system_prompt}\n\n{status_effect_prompt}"
-            system_content = f"{system_content}\n\n{context}"
-
-            messages = [
-                {"role": "system", "content": system_content},
-                {"role": "user", "content": "Provide your response for the Tribal Council."}
-            ]
-
-            headers = {
-                "Authorization": f"Bearer {self.agent_manager.openrouter_api_key}",
-                "Content-Type": "application/json"
-            }
+            messages = self._build_messages(agent, context, "Provide your response for the Tribal Council.")
 
             payload = {
                 "model": agent.model,
@@ -1389,123 +2027,104 @@ Use the cast_vote tool with your choice: YES, NO, or ABSTAIN.
                 "max_tokens": 800
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status != 200:
-                        return None
-                    result = await response.json()
-                    content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
-                    return content.strip() if content else None
+            body = dump_request_with_tools(payload, ())
+            result = await self._post_openrouter(_CHAT_TIMEOUT, body, cache_ok=cache_ok)
+            if result is None:
+                return None
+            content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
+            return content.strip() if content else None
 
-        except Exception as e:
-            logger.error(f"[TribalCouncil:{self.game_id}] Agent response error: {e}")
+        except _LLM_CALL_ERRORS as e:
+            logger.error("[TribalCouncil:%s] Agent response error: %s", self.game_id, e)
             return None
 
     async def _get_agent_response_with_tools(
         self,
         agent: 'Agent',
         context: str,
-        tools: List[Dict]
-    ) -> Optional[str]:
-        """Get a response from an agent with tool calling support."""
+        tools: List[Dict],
+        cache_ok: bool = True
+    ) -> Optional[AgentReply]:
+        """
+        Get a response from an agent with tool calling support. Silent tools
+        (prompt views, recall) yield their stated reason; the action tools
+        yield a ToolAction for the phase's extractor.
+        """
         try:
-            import aiohttp
-
-            # Include status effects if the agent has any active
-            status_effect_prompt = StatusEffectManager.get_effect_prompt(agent.name)
-            system_content = agent.system_prompt
-            if status_effect_prompt:
-                system_content = f"{agent.system_prompt}\n\n{status_effect_prompt}"
-            system_content = f"{system_content}\n\n{context}"
-
-            messages = [
-                {"role": "system", "content": system_content},
-                {"role": "user", "content": "Use the appropriate tool to take your action."}
-            ]
-
-            headers = {
-                "Authorization": f"Bearer {self.agent_manager.openrouter_api_key}",
-                "Content-Type": "application/json"
-            }
+            messages = self._build_messages(agent, context, "Use the appropriate tool to take your action.")
 
             payload = {
                 "model": agent.model,
                 "messages": messages,
                 "max_tokens": 1500,
-                "tools": tools,
                 "tool_choice": "auto"
             }
+            # Tool schemas are static, so splice in their pre-serialized JSON
+            body = dump_request_with_tools(payload, tools)
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=45)
-                ) as response:
-                    if response.status != 200:
-                        return None
-
-                    result = await response.json()
-                    message = result.get("choices", [{}])[0].get("message", {})
-
-                    # Check for tool calls
-                    tool_calls = message.get("tool_calls", [])
-                    if tool_calls:
-                        # Process the first tool call
-                        tool_call = tool_calls[0]
-                        func_name = tool_call.get("function", {}).get("name", "")
-                        args_str = tool_call.get("function", {}).get("arguments", "{}")
-
-                        try:
-                            args = json.loads(args_str)
-                        except:
-                            args = {}
-
-                        # Handle tool execution
-                        if func_name == "view_system_prompt":
-                            # Silent tool - result goes back to agent, not Discord
-                            target = args.get("target_agent", "")
-                            tool_result = self.execute_view_prompt(agent.name, target)
-                            # Return the reason/thought if provided
-                            return args.get("reason", f"Viewed {target}'s prompt")
-
-                        elif func_name == "recall_interactions":
-                            target = args.get("target_agent", "")
-                            memory_type = args.get("memory_type", "all")
-                            tool_result = self.execute_recall_interactions(agent.name, target, memory_type)
-                            return args.get("reason", f"Recalled interactions with {target}")
-
-                        elif func_name == "nominate_agent":
-                            target = args.get("target_agent", "")
-                            reason = args.get("reason", "")
-                            return f"NOMINATE:{target}|{reason}"
-
-                        elif func_name == "propose_edit":
-                            action = args.get("action", "add")
-                            line_num = args.get("line_number", "")
-                            new_content = args.get("new_content", "")
-                            reason = args.get("reason", "")
-                            return f"PROPOSE:{action}:{line_num}:{new_content}|{reason}"
-
-                        elif func_name == "cast_vote":
-                            vote = args.get("vote", "abstain")
-                            reason = args.get("reason", "")
-                            return f"VOTE:{vote}|{reason}"
-
-                    # No tool call - return content
-                    content = message.get("content", "")
-                    return content.strip() if content else None
+            result = await self._post_openrouter(_TOOLS_TIMEOUT, body, cache_ok=cache_ok)
+            if result is None:
+                return None
 
-        except Exception as e:
-            logger.error(f"[TribalCouncil:{self.game_id}] Agent tool response error: {e}")
+            message = result.get("choices", [{}])[0].get("message", {})
+
+            # Check for tool calls
+            tool_calls = message.get("tool_calls", [])
+            if tool_calls:
+                # Process the first tool call
+                tool_call = tool_calls[0]
+                func_name = tool_call.get("function", {}).get("name", "")
+                args_str = tool_call.get("function", {}).get("arguments", "{}")
+
+                try:
+                    args = _json_loads(args_str)
+                except (ValueError, TypeError):
+                    args = {}
+                if not isinstance(args, dict):
+                    args = {}
+
+                handler = self._tool_handlers.get(func_name)
+                if handler:
+                    return handler(agent, args)
+
+            # No tool call - return content
+            content = message.get("content", "")
+            return content.strip() if content else None
+
+        except _LLM_CALL_ERRORS as e:
+            logger.error("[TribalCouncil:%s] Agent tool response error: %s", self.game_id, e)
             return None
 
+    # =========================================================================
+    # Tool Handlers
+    # =========================================================================
+
+    def _handle_view_prompt(self, agent: 'Agent', args: Dict[str, Any]) -> Optional[AgentReply]:
+        """view_system_prompt: silent tool - result goes back to agent, not Discord."""
+        target = args.get("target_agent", "")
+        self.execute_view_prompt(agent.name, target)
+        # Return the reason/thought if provided
+        return args.get("reason", f"Viewed {target}'s prompt")
+
+    def _handle_recall(self, agent: 'Agent', args: Dict[str, Any]) -> Optional[AgentReply]:
+        """recall_interactions: silent tool, like view_system_prompt."""
+        target = args.get("target_agent", "")
+        memory_type = args.get("memory_type", "all")
+        self.execute_recall_interactions(agent.name, target, memory_type)
+        return args.get("reason", f"Recalled interactions with {target}")
+
+    def _handle_nominate(self, agent: 'Agent', args: Dict[str, Any]) -> Optional[AgentReply]:
+        """nominate_agent: handled by _extract_nomination."""
+        return ToolAction("nominate_agent", args)
+
+    def _handle_propose(self, agent: 'Agent', args: Dict[str, Any]) -> Optional[AgentReply]:
+        """propose_edit: handled by _extract_proposal."""
+        return ToolAction("propose_edit", args)
+
+    def _handle_vote(self, agent: 'Agent', args: Dict[str, Any]) -> Optional[AgentReply]:
+        """cast_vote: handled by _extract_vote."""
+        return ToolAction("cast_vote", args)
+
 
 # ============================================================================
 # Game Instance Management
@@ -1668,7 +2287,7 @@ def save_tribal_council_result(game: TribalCouncilGame):
         nominations=nominations_dict,
         winning_proposal=winning_dict,
         outcome=outcome,
-        discussion_log=game.discussion_log
+        discussion_log=[entry._asdict() for entry in game.discussion_log]
     )
 
     _tribal_council_history.append(result)
@@ -9,7 +9,7 @@ from openai import OpenAI
 import threading
 import logging
 from vector_store import VectorStore
-from constants import AgentConfig, is_image_model, ReactionConfig
+from constants import AgentConfig, is_image_model, ReactionConfig, OpenRouterConfig
 from shortcuts_utils import load_shortcuts_data, load_shortcuts, StatusEffectManager, apply_message_shortcuts, strip_shortcuts_from_message
 
 # Game context management
@@ -54,6 +54,51 @@ def get_or_create_event_loop():
 
     return _global_event_loop
 
+class OpenRouterLimiter:
+    """
+    Async context manager throttling OpenRouter requests: a semaphore caps how
+    many are in flight, and a token bucket keeps request starts under the
+    per-minute budget (bursting up to the concurrency cap).
+
+    The semaphore and bucket are created on first use rather than here, since
+    the limiter is constructed before the bot's event loop is running.
+    """
+
+    def __init__(self, max_concurrent: int, requests_per_minute: int):
+        self._max_concurrent = max_concurrent
+        self._rate = requests_per_minute / 60.0  # Tokens added per second
+        self._capacity = float(max_concurrent)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tokens = 0.0
+        self._updated = 0.0
+
+    async def _take_token(self):
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    async def __aenter__(self):
+        if self._semaphore is None:
+            # Start with a full bucket, timed from inside the running loop
+            self._semaphore = asyncio.Semaphore(self._max_concurrent)
+            self._tokens = self._capacity
+            self._updated = time.monotonic()
+        await self._semaphore.acquire()
+        try:
+            await self._take_token()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+
 class Agent:
     def __init__(
         self,
@@ -692,6 +737,7 @@ class Agent:
                 return
 
             # Get all conversation messages for this agent, sorted by timestamp
+            self.vector_store.flush()
             all_messages = self.vector_store.collection.get(
                 where={
                     "$and": [
@@ -3656,6 +3702,12 @@ class AgentManager:
         # Callback to save all data (set by main.py)
         self.save_data_callback: Optional[Callable] = None
 
+        # Throttle for OpenRouter requests made from game code (e.g. Tribal Council)
+        self.openrouter_limiter = OpenRouterLimiter(
+            OpenRouterConfig.MAX_CONCURRENT_REQUESTS,
+            OpenRouterConfig.REQUESTS_PER_MINUTE
+        )
+
         # Initialize vector store for persistent memory
         try:
             self.vector_store = VectorStore(persist_directory="./data/vector_store")
@@ -4495,14 +4547,18 @@ ATTEMPT #{variant} - {variant_suffix}"""
             return
 
         try:
-            # Query vector store to find this message
+            # Query vector store to find this message (flush so a just-sent message is visible).
+            # The message text is only needed to learn a preference (2+ reactions)
+            include = ["metadatas", "documents"] if reaction_count >= 2 else ["metadatas"]
+            self.vector_store.flush()
             results = self.vector_store.collection.get(
                 where={
                     "$and": [
                         {"agent_name": {"$eq": agent_name}},
                         {"message_id": {"$eq": message_id}}
                     ]
-                }
+                },
+                include=include
             )
 
             if not results or not results['ids']:
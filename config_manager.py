@@ -2,7 +2,7 @@ import json
 import os
 from pathlib import Path
 from cryptography.fernet import Fernet
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional
 
 class ConfigManager:
     def __init__(self, config_dir: str = "config"):
@@ -58,9 +58,9 @@ class ConfigManager:
             print(f"Error loading agents.json: {e}")
             return []
 
-    def save_affinity(self, affinity_data: Dict[str, Dict[str, float]]):
+    def save_affinity(self, affinity_data: Mapping[str, Mapping[str, float]]):
         with open(self.affinity_file, "w") as f:
-            json.dump(affinity_data, f, indent=2)
+            json.dump({agent: dict(scores) for agent, scores in affinity_data.items()}, f, indent=2)
 
     def load_affinity(self) -> Dict[str, Dict[str, float]]:
         if not self.affinity_file.exists():
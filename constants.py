@@ -189,6 +189,7 @@ class VectorStoreConfig:
 
     # Embedding
     EMBEDDING_MODEL = "all-MiniLM-L6-v2"  # Default sentence transformer model
+    EMBEDDING_DEVICE = None  # sentence-transformers device ("cuda", "cpu"); None = CUDA when available
 
     # Memory types
     MEMORY_TYPE_CONVERSATION = "conversation"
@@ -197,6 +198,51 @@ class VectorStoreConfig:
     MEMORY_TYPE_FACT = "fact"
     MEMORY_TYPE_DIRECTIVE = "directive"
 
+    # Write batching (add_message buffers rows; a background writer thread
+    # writes them in one collection.add)
+    WRITE_BATCH_SIZE = 128  # Wake the writer once this many messages are pending
+    WRITE_FLUSH_INTERVAL_SECONDS = 2.0  # Writer flushes pending messages at least this often
+
+    # Reads in get_relevant_context run concurrently on this many threads
+    READ_POOL_WORKERS = 4
+
+    # clear_agent_memory fetches and deletes IDs in chunks of this size
+    DELETE_BATCH_SIZE = 5000
+
+    # SQLite tuning applied to ChromaDB's connections (best effort; skipped if
+    # ChromaDB's internals don't expose them). WAL + NORMAL stays readable
+    # after a crash; the unsafe set trades crash durability for insert speed.
+    SQLITE_PRAGMAS = ("journal_mode = WAL", "synchronous = NORMAL", "temp_store = MEMORY", "mmap_size = 268435456")
+    SQLITE_UNSAFE_PRAGMAS = ("journal_mode = OFF", "synchronous = OFF", "temp_store = MEMORY")
+    SQLITE_UNSAFE_WRITES = False  # Use SQLITE_UNSAFE_PRAGMAS instead of SQLITE_PRAGMAS
+
+
+# ============================================================================
+# OPENROUTER CONFIGURATION
+# ============================================================================
+
+class OpenRouterConfig:
+    """Configuration constants for OpenRouter API requests."""
+
+    CHAT_COMPLETIONS_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+    # Throttling (shared by every caller of AgentManager.openrouter_limiter)
+    MAX_CONCURRENT_REQUESTS = 8  # Requests in flight at once
+    REQUESTS_PER_MINUTE = 120  # Sustained request rate
+
+    # Retries for 429 / 5xx responses
+    MAX_RETRIES = 3
+    RETRY_BACKOFF_SECONDS = 1.0  # Doubled each attempt, plus up to 1s jitter
+
+    # Prompt size caps for game LLM calls (tokens; ~4 chars each when tiktoken is unavailable)
+    MAX_SYSTEM_PROMPT_TOKENS = 8000  # Agent system prompt (end dropped first)
+    # Per-turn game context (oldest text dropped first). Proposal and
+    # implementation contexts open with the target's full numbered system
+    # prompt, so this must hold a whole MAX_SYSTEM_PROMPT_TOKENS prompt plus
+    # the discussion history after it.
+    MAX_CONTEXT_TOKENS = MAX_SYSTEM_PROMPT_TOKENS + 4000
+    CHARS_PER_TOKEN = 4
+
 
 # ============================================================================
 # CONFIGURATION PATHS
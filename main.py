@@ -249,25 +249,31 @@ def get_agent_details(name: str):
         # Add status effects display if any are active
         effects_data = StatusEffectManager.get_agent_effects_for_ui(agent.name)
         if effects_data["has_effects"]:
-            effects_html = '<div style="margin-top: 8px; padding: 8px; background: rgba(255, 100, 0, 0.15); border: 1px solid rgba(255, 100, 0, 0.4); border-radius: 4px;">'
-            effects_html += '<span style="color: #FF6600; font-weight: bold;">⚠️ STATUS EFFECTS ACTIVE</span><br/>'
-            effects_html += f'<span style="color: #FFAA00; font-size: 0.9em;">{effects_data["effect_count"]} effect(s), {effects_data["total_turns"]} total turns</span><br/>'
+            effects_parts = [
+                '<div style="margin-top: 8px; padding: 8px; background: rgba(255, 100, 0, 0.15); border: 1px solid rgba(255, 100, 0, 0.4); border-radius: 4px;">',
+                '<span style="color: #FF6600; font-weight: bold;">⚠️ STATUS EFFECTS ACTIVE</span><br/>',
+                f'<span style="color: #FFAA00; font-size: 0.9em;">{effects_data["effect_count"]} effect(s), {effects_data["total_turns"]} total turns</span><br/>'
+            ]
             for eff in effects_data["effects"]:
                 intensity_color = "#FF0000" if eff["intensity"] >= 7 else ("#FFAA00" if eff["intensity"] >= 4 else "#00FF00")
-                effects_html += f'<div style="margin: 4px 0; padding: 4px; background: rgba(0,0,0,0.3); border-radius: 3px;">'
-                effects_html += f'<span style="color: {intensity_color};">{eff["name"]}</span> '
-                effects_html += f'<span style="color: #888;">Intensity: {eff["intensity"]}/10 ({eff["intensity_label"]})</span> '
-                effects_html += f'<span style="color: #00CCCC;">{eff["turns"]} turns left</span>'
-                effects_html += '</div>'
-            effects_html += '</div>'
-            status_html += effects_html
+                effects_parts.append(
+                    '<div style="margin: 4px 0; padding: 4px; background: rgba(0,0,0,0.3); border-radius: 3px;">'
+                    f'<span style="color: {intensity_color};">{eff["name"]}</span> '
+                    f'<span style="color: #888;">Intensity: {eff["intensity"]}/10 ({eff["intensity_label"]})</span> '
+                    f'<span style="color: #00CCCC;">{eff["turns"]} turns left</span>'
+                    '</div>'
+                )
+            effects_parts.append('</div>')
+            status_html += "".join(effects_parts)
 
         # Add affinity scores display
         if affinity_tracker:
             affinities = affinity_tracker.get_all_affinities(agent.name)
             if affinities:
-                affinity_html = '<div style="margin-top: 8px; padding: 8px; background: rgba(0, 200, 200, 0.1); border: 1px solid rgba(0, 200, 200, 0.3); border-radius: 4px;">'
-                affinity_html += '<span style="color: #00CCCC; font-weight: bold;">💭 AFFINITY SCORES</span><br/>'
+                affinity_parts = [
+                    '<div style="margin-top: 8px; padding: 8px; background: rgba(0, 200, 200, 0.1); border: 1px solid rgba(0, 200, 200, 0.3); border-radius: 4px;">',
+                    '<span style="color: #00CCCC; font-weight: bold;">💭 AFFINITY SCORES</span><br/>'
+                ]
                 sorted_affinities = sorted(affinities.items(), key=lambda x: x[1], reverse=True)
                 for target, score in sorted_affinities:
                     if score > 50:
@@ -285,9 +291,9 @@ def get_agent_details(name: str):
                     else:
                         color = "#FF4444"
                         label = "hates"
-                    affinity_html += f'<div style="margin: 2px 0;"><span style="color: {color};">{target}: {score:+.0f}</span> <span style="color: #666; font-size: 0.85em;">({label})</span></div>'
-                affinity_html += '</div>'
-                status_html += affinity_html
+                    affinity_parts.append(f'<div style="margin: 2px 0;"><span style="color: {color};">{target}: {score:+.0f}</span> <span style="color: #666; font-size: 0.85em;">({label})</span></div>')
+                affinity_parts.append('</div>')
+                status_html += "".join(affinity_parts)
 
         return agent.name, agent.model, agent.system_prompt, agent.response_frequency, agent.response_likelihood, agent.max_tokens, agent.user_attention, agent.bot_awareness, agent.message_retention, agent.user_image_cooldown, agent.global_image_cooldown, allow_spontaneous_images, image_gen_turns, image_gen_chance, allow_spontaneous_videos, video_gen_turns, video_gen_chance, video_duration, status_html
     else:
@@ -1729,15 +1735,14 @@ def get_game_stats_display() -> str:
     stats_text = "# 📊 **GAME STATISTICS**\n\n"
 
     # Overall stats
-    all_games = game_manager.get_all_history()
-    if not all_games:
+    total_games = game_manager.get_total_games()
+    if not total_games:
         return stats_text + "No games played yet."
 
-    stats_text += f"**Total Games Played:** {len(all_games)}\n\n"
+    stats_text += f"**Total Games Played:** {total_games}\n\n"
 
     # Stats by game type
-    game_types = set(g.game_name for g in all_games)
-    for game_name in sorted(game_types):
+    for game_name in game_manager.get_game_names():
         stats = game_manager.get_stats_by_game(game_name)
         stats_text += f"### {game_name.upper()}\n"
         stats_text += f"- Games: {stats['total_games']}\n"
@@ -1863,12 +1868,7 @@ def get_model_leaderboard_display() -> str:
     # Per-game breakdown
     text += "## Performance by Game\n\n"
 
-    game_types = set()
-    for game in game_manager.get_all_history():
-        if game.player_models:
-            game_types.add(game.game_name)
-
-    for game_name in sorted(game_types):
+    for game_name in game_manager.get_game_names():
         game_stats = game_manager.get_model_stats_by_game(game_name)
         if game_stats:
             text += f"### {game_name.upper()}\n"
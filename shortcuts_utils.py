@@ -9,6 +9,7 @@ import json
 import os
 import re
 import logging
+import threading
 import time
 from typing import List, Dict, Any, Tuple, Optional, Set
 from constants import ConfigPaths
@@ -17,6 +18,22 @@ from constants import ConfigPaths
 from colorama import init, Fore, Back, Style
 init(autoreset=True)  # Auto-reset colors after each print
 
+# orjson for faster parsing of shortcuts.json (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Aho-Corasick automaton for finding shortcut names in one pass (optional)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -123,6 +140,86 @@ class StatusEffect:
             return "Peak"
 
 
+# Static parts of the effect/recovery prompts, joined once at import
+_PROMPT_RULE = "=" * 60
+
+_EFFECT_PROMPT_HEADER = "\n".join([
+    "\n" + _PROMPT_RULE,
+    "⚠️ CRITICAL: STATUS EFFECTS OVERRIDE YOUR NORMAL BEHAVIOR ⚠️",
+    _PROMPT_RULE
+])
+
+_EFFECT_PROMPT_MANDATORY = "\n".join([
+    _PROMPT_RULE,
+    "⚠️ MANDATORY BEHAVIOR MODIFICATION ⚠️",
+    _PROMPT_RULE,
+    "",
+    "You MUST alter your responses according to the effect above.",
+    "This is NOT optional. This is NOT a suggestion. This OVERRIDES your personality.",
+    ""
+])
+
+# Intensity-scaled instructions, chosen by the strongest active effect
+_EFFECT_INTENSITY_PEAK = "\n".join([
+    "INTENSITY 9-10 (PEAK): You are barely functional.",
+    "• Sentences should be fragmented, incomplete, or make no sense",
+    "• You may lose track of who you're talking to or what was said",
+    "• Your responses should be SHORT because you can barely form thoughts",
+    "• Physical/mental symptoms dominate - you're not 'you' right now",
+    "• It's okay to trail off, repeat yourself, or respond incoherently"
+])
+_EFFECT_INTENSITY_STRONG = "\n".join([
+    "INTENSITY 7-8 (STRONG): You are significantly impaired.",
+    "• Your thoughts are scattered, fragmented, or fixated",
+    "• Maintaining normal conversation is DIFFICULT - show that struggle",
+    "• Your normal personality is BURIED under the effect",
+    "• Responses should feel 'off' - wrong tone, wrong focus, wrong reactions",
+    "• The effect should be OBVIOUS to anyone reading"
+])
+_EFFECT_INTENSITY_COMMON = "\n".join([
+    "INTENSITY 5-6 (COMMON): You are noticeably affected.",
+    "• You can function but something is clearly different",
+    "• Your responses should drift toward the effect's theme",
+    "• Occasional breaks in normal behavior, odd tangents",
+    "• Others would notice something is off with you"
+])
+_EFFECT_INTENSITY_LIGHT = "\n".join([
+    "INTENSITY 1-4 (LIGHT): You are subtly affected.",
+    "• Baseline personality with hints of the effect",
+    "• Occasional slip-ups or unusual moments",
+    "• Perceptive people might notice something"
+])
+
+_EFFECT_PROMPT_FOOTER = "\n".join([
+    "",
+    "CONCRETE EXAMPLES of showing the effect:",
+    "• Change your SENTENCE STRUCTURE (fragmented? rambling? terse?)",
+    "• Change your EMOTIONAL REGISTER (flat? manic? paranoid? dreamy?)",
+    "• Change your FOCUS (fixated? scattered? withdrawn? obsessive?)",
+    "• Use EMOTES that reflect the state: *stares blankly* *trails off* *gets distracted*",
+    "• INTERRUPT your own thoughts if appropriate to the effect",
+    "",
+    "❌ DO NOT: Write a normal response and then add effect descriptions on top",
+    "✅ DO: Let the effect CHANGE how you think, speak, and respond",
+    _PROMPT_RULE
+])
+
+_RECOVERY_PROMPT_HEADER = "\n".join([
+    "\n" + _PROMPT_RULE,
+    "⚠️ RECOVERY / COMEDOWN - EFFECT WEARING OFF ⚠️",
+    _PROMPT_RULE,
+    "",
+    "The previous effect is ending. THIS TURN you are experiencing:",
+    ""
+])
+
+_RECOVERY_PROMPT_FOOTER = "\n".join([
+    "EMBODY this specific recovery state in your response.",
+    "Show it through your words, tone, and emotes - not just by describing it.",
+    _PROMPT_RULE
+])
+
+
 class StatusEffectManager:
     """
     Manages RPG-style status effects for agents.
@@ -307,9 +404,7 @@ class StatusEffectManager:
         # Calculate max intensity for scaling instructions
         max_intensity = max(e.intensity for e in effects)
 
-        prompt_parts = ["\n" + "="*60]
-        prompt_parts.append("⚠️ CRITICAL: STATUS EFFECTS OVERRIDE YOUR NORMAL BEHAVIOR ⚠️")
-        prompt_parts.append("="*60)
+        prompt_parts = [_EFFECT_PROMPT_HEADER]
 
         for effect in effects:
             intensity_label = StatusEffect.get_intensity_label(effect.intensity)
@@ -318,52 +413,19 @@ class StatusEffectManager:
             prompt_parts.append(">>> " + effect.simulation_prompt)
             prompt_parts.append("")
 
-        prompt_parts.append("="*60)
-        prompt_parts.append("⚠️ MANDATORY BEHAVIOR MODIFICATION ⚠️")
-        prompt_parts.append("="*60)
-        prompt_parts.append("")
-        prompt_parts.append("You MUST alter your responses according to the effect above.")
-        prompt_parts.append("This is NOT optional. This is NOT a suggestion. This OVERRIDES your personality.")
-        prompt_parts.append("")
+        prompt_parts.append(_EFFECT_PROMPT_MANDATORY)
 
         # Intensity-scaled instructions
         if max_intensity >= 9:
-            prompt_parts.append("INTENSITY 9-10 (PEAK): You are barely functional.")
-            prompt_parts.append("• Sentences should be fragmented, incomplete, or make no sense")
-            prompt_parts.append("• You may lose track of who you're talking to or what was said")
-            prompt_parts.append("• Your responses should be SHORT because you can barely form thoughts")
-            prompt_parts.append("• Physical/mental symptoms dominate - you're not 'you' right now")
-            prompt_parts.append("• It's okay to trail off, repeat yourself, or respond incoherently")
+            prompt_parts.append(_EFFECT_INTENSITY_PEAK)
         elif max_intensity >= 7:
-            prompt_parts.append("INTENSITY 7-8 (STRONG): You are significantly impaired.")
-            prompt_parts.append("• Your thoughts are scattered, fragmented, or fixated")
-            prompt_parts.append("• Maintaining normal conversation is DIFFICULT - show that struggle")
-            prompt_parts.append("• Your normal personality is BURIED under the effect")
-            prompt_parts.append("• Responses should feel 'off' - wrong tone, wrong focus, wrong reactions")
-            prompt_parts.append("• The effect should be OBVIOUS to anyone reading")
+            prompt_parts.append(_EFFECT_INTENSITY_STRONG)
         elif max_intensity >= 5:
-            prompt_parts.append("INTENSITY 5-6 (COMMON): You are noticeably affected.")
-            prompt_parts.append("• You can function but something is clearly different")
-            prompt_parts.append("• Your responses should drift toward the effect's theme")
-            prompt_parts.append("• Occasional breaks in normal behavior, odd tangents")
-            prompt_parts.append("• Others would notice something is off with you")
+            prompt_parts.append(_EFFECT_INTENSITY_COMMON)
         else:
-            prompt_parts.append("INTENSITY 1-4 (LIGHT): You are subtly affected.")
-            prompt_parts.append("• Baseline personality with hints of the effect")
-            prompt_parts.append("• Occasional slip-ups or unusual moments")
-            prompt_parts.append("• Perceptive people might notice something")
-
-        prompt_parts.append("")
-        prompt_parts.append("CONCRETE EXAMPLES of showing the effect:")
-        prompt_parts.append("• Change your SENTENCE STRUCTURE (fragmented? rambling? terse?)")
-        prompt_parts.append("• Change your EMOTIONAL REGISTER (flat? manic? paranoid? dreamy?)")
-        prompt_parts.append("• Change your FOCUS (fixated? scattered? withdrawn? obsessive?)")
-        prompt_parts.append("• Use EMOTES that reflect the state: *stares blankly* *trails off* *gets distracted*")
-        prompt_parts.append("• INTERRUPT your own thoughts if appropriate to the effect")
-        prompt_parts.append("")
-        prompt_parts.append("❌ DO NOT: Write a normal response and then add effect descriptions on top")
-        prompt_parts.append("✅ DO: Let the effect CHANGE how you think, speak, and respond")
-        prompt_parts.append("="*60)
+            prompt_parts.append(_EFFECT_INTENSITY_LIGHT)
+
+        prompt_parts.append(_EFFECT_PROMPT_FOOTER)
 
         return "\n".join(prompt_parts)
 
@@ -441,20 +503,13 @@ class StatusEffectManager:
         prompts = cls._pending_recoveries[agent_name]
         cls._pending_recoveries[agent_name] = []
 
-        prompt_parts = ["\n" + "="*60]
-        prompt_parts.append("⚠️ RECOVERY / COMEDOWN - EFFECT WEARING OFF ⚠️")
-        prompt_parts.append("="*60)
-        prompt_parts.append("")
-        prompt_parts.append("The previous effect is ending. THIS TURN you are experiencing:")
-        prompt_parts.append("")
+        prompt_parts = [_RECOVERY_PROMPT_HEADER]
 
         for prompt in prompts:
             prompt_parts.append(">>> " + prompt)
             prompt_parts.append("")
 
-        prompt_parts.append("EMBODY this specific recovery state in your response.")
-        prompt_parts.append("Show it through your words, tone, and emotes - not just by describing it.")
-        prompt_parts.append("="*60)
+        prompt_parts.append(_RECOVERY_PROMPT_FOOTER)
 
         logger.info(f"[StatusEffects] Injecting recovery prompt for {agent_name}")
         return "\n".join(prompt_parts)
@@ -555,6 +610,11 @@ class ShortcutManager:
     to apply status effects to agents. Supports agent targeting.
     """
 
+    __slots__ = (
+        "shortcuts_file", "_cache", "_cache_mtime", "_match_snapshot",
+        "_load_lock", "_display_groups", "_formatted_cache", "_instructions_cache",
+    )
+
     def __init__(self, shortcuts_file: Optional[str] = None):
         """
         Initialize the ShortcutManager.
@@ -570,50 +630,149 @@ class ShortcutManager:
             )
         self.shortcuts_file = shortcuts_file
         self._cache: Optional[List[Dict[str, Any]]] = None
+        self._cache_mtime: float = 0.0  # mtime of the file the cache was parsed from
+        # (commands, automaton over their names, first character of every name),
+        # built with the cache and swapped in as one tuple so readers never pair
+        # a new command list with an old automaton
+        self._match_snapshot: Tuple[List[Dict[str, Any]], Any, frozenset] = ([], None, frozenset())
+        self._load_lock = threading.Lock()
+        # (category, commands) sorted for display, built with the cache
+        self._display_groups: List[Tuple[str, List[Dict[str, Any]]]] = []
+        # Rendered /shortcuts pages keyed on (file mtime, char_limit), and the
+        # agent instruction text; both are dropped whenever the cache reloads
+        self._formatted_cache: Dict[Tuple[float, int], List[str]] = {}
+        self._instructions_cache: Optional[str] = None
 
     def load_shortcuts(self) -> List[Dict[str, Any]]:
         """
         Load shortcuts from the JSON file.
 
+        The parsed file is cached and only re-read when its mtime changes,
+        so edits to shortcuts.json take effect without a restart.
+
         Returns:
             List of shortcut dictionaries, or empty list if file doesn't exist
             or contains no shortcuts.
         """
-        # Return cached data if available
-        if self._cache is not None:
+        try:
+            mtime = os.path.getmtime(self.shortcuts_file)
+        except OSError:
+            mtime = 0.0
+
+        # Return cached data if the file hasn't changed since it was parsed
+        if self._cache is not None and mtime == self._cache_mtime:
             return self._cache
 
+        with self._load_lock:
+            # Another thread may have reloaded while we waited for the lock
+            if self._cache is not None and mtime == self._cache_mtime:
+                return self._cache
+
+            self._formatted_cache = {}
+            self._instructions_cache = None
+            commands = self._read_shortcuts_file()
+            trigger_chars = frozenset(cmd["name"][0] for cmd in commands if cmd.get("name"))
+            matcher = self._build_matcher(commands) if commands else None
+            self._match_snapshot = (commands, matcher, trigger_chars)
+            self._display_groups = self._build_display_groups(commands)
+            self._cache = commands
+            self._cache_mtime = mtime
+            return commands
+
+    def _read_shortcuts_file(self) -> List[Dict[str, Any]]:
+        """Parse the shortcuts file, returning an empty list on any failure."""
         if not os.path.exists(self.shortcuts_file):
             logger.warning(f"[Shortcuts] File not found: {self.shortcuts_file}")
-            self._cache = []
-            return self._cache
+            return []
 
         try:
-            with open(self.shortcuts_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(self.shortcuts_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(self.shortcuts_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
 
-            commands = data.get("commands", [])
+            commands = data.get("commands", []) if isinstance(data, dict) else []
             if not commands:
                 logger.warning("[Shortcuts] No commands found in shortcuts.json")
-                self._cache = []
-                return self._cache
+                return []
 
-            self._cache = commands
             logger.info(f"[Shortcuts] Loaded {len(commands)} shortcuts from config")
-            return self._cache
+            return commands
 
         except json.JSONDecodeError as e:
-            logger.error(f"[Shortcuts] Invalid JSON in shortcuts file: {e}")
-            self._cache = []
-            return self._cache
-        except Exception as e:
-            logger.error(f"[Shortcuts] Error loading shortcuts: {e}", exc_info=True)
-            self._cache = []
-            return self._cache
+            logger.error("[Shortcuts] Invalid JSON in shortcuts file: %s", e)
+            return []
+        except (OSError, ValueError) as e:
+            logger.error("[Shortcuts] Error loading shortcuts: %s", e, exc_info=True)
+            return []
 
     def clear_cache(self):
         """Clear the shortcuts cache to force reload on next access."""
         self._cache = None
+        self._display_groups = []
+        self._formatted_cache = {}
+        self._instructions_cache = None
+
+    @staticmethod
+    def _build_display_groups(commands: List[Dict[str, Any]]) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """Commands grouped by category, with categories and each group's commands sorted by name."""
+        categories: Dict[str, List[Dict[str, Any]]] = {}
+        for cmd in commands:
+            category = cmd.get("category", "Other")
+            if category not in categories:
+                categories[category] = []
+            categories[category].append(cmd)
+
+        return [
+            (category, sorted(shortcuts, key=lambda x: x.get("name", "")))
+            for category, shortcuts in sorted(categories.items())
+        ]
+
+    @staticmethod
+    def _build_matcher(commands: List[Dict[str, Any]]):
+        """
+        Build an Aho-Corasick automaton mapping each shortcut name to the
+        indices of the commands using it, or None if pyahocorasick isn't
+        installed (callers then fall back to one substring check per shortcut).
+        """
+        if not AHOCORASICK_AVAILABLE:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for index, cmd in enumerate(commands):
+            name = cmd.get("name", "")
+            if name:
+                automaton.add_word(name, automaton.get(name, ()) + (index,))
+
+        if len(automaton) == 0:
+            return None
+        automaton.make_automaton()
+        return automaton
+
+    def _matching_commands(self, message: str) -> List[Dict[str, Any]]:
+        """
+        Shortcuts whose name occurs in the message (case-sensitive), in config
+        order. Scans the message once when the automaton is available.
+        """
+        self.load_shortcuts()
+        # Read the command list and its automaton from one snapshot; a reload on
+        # another thread swaps in a new tuple rather than mutating this one
+        commands, matcher, trigger_chars = self._match_snapshot
+
+        # Most messages contain no shortcut at all; skip the scan unless some
+        # shortcut's first character appears in the message
+        if not any(ch in message for ch in trigger_chars):
+            return []
+
+        if matcher is not None:
+            hits: Set[int] = set()
+            for _, indices in matcher.iter(message):
+                hits.update(indices)
+            return [commands[i] for i in sorted(hits)]
+
+        return [cmd for cmd in commands if cmd.get("name", "") and cmd["name"] in message]
 
     def parse_shortcut_with_target(self, message: str, available_agents: List[str]) -> List[Tuple[Dict, Optional[str], int]]:
         """
@@ -633,13 +792,10 @@ class ShortcutManager:
         Returns:
             List of (shortcut_dict, target_agent_name_or_None, intensity) tuples
         """
-        commands = self.load_shortcuts()
         results = []
 
-        for cmd in commands:
-            shortcut_name = cmd.get("name", "")
-            if not shortcut_name or shortcut_name not in message:
-                continue
+        for cmd in self._matching_commands(message):
+            shortcut_name = cmd["name"]
 
             # Find the shortcut position in the message
             escaped_name = re.escape(shortcut_name)
@@ -705,15 +861,7 @@ class ShortcutManager:
         Returns:
             List of shortcut dictionaries that were found in the message
         """
-        commands = self.load_shortcuts()
-        found_shortcuts = []
-
-        for cmd in commands:
-            shortcut_name = cmd.get("name", "")
-            if shortcut_name and shortcut_name in message:
-                found_shortcuts.append(cmd)
-
-        return found_shortcuts
+        return self._matching_commands(message)
 
     def apply_shortcuts_as_effects(self, message: str, available_agents: List[str]) -> Dict[str, List[Tuple[str, int]]]:
         """
@@ -788,13 +936,10 @@ class ShortcutManager:
         if not commands:
             return ["No shortcuts found in configuration file."]
 
-        # Group by category
-        categories: Dict[str, List[Dict]] = {}
-        for cmd in commands:
-            category = cmd.get("category", "Other")
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(cmd)
+        cache_key = (self._cache_mtime, char_limit)
+        cached_pages = self._formatted_cache.get(cache_key)
+        if cached_pages is not None:
+            return list(cached_pages)
 
         # Build pages
         pages = []
@@ -808,21 +953,24 @@ class ShortcutManager:
             "*Default intensity: 5. Effects last 3 responses, then recovery kicks in.*"
         ]
         current_page_lines.extend(header)
+        # Length of "\n".join(current_page_lines), kept up to date as lines are added
+        current_length = len("\n".join(current_page_lines))
 
-        sorted_categories = sorted(categories.items())
-        total_categories = len(sorted_categories)
+        display_groups = self._display_groups
+        total_categories = len(display_groups)
 
-        for cat_idx, (category, shortcuts) in enumerate(sorted_categories):
+        for cat_idx, (category, shortcuts) in enumerate(display_groups):
             # Build category block
             category_lines = [f"\n**{category}:**", "```"]
-            for shortcut in sorted(shortcuts, key=lambda x: x.get("name", "")):
+            for shortcut in shortcuts:
                 name = shortcut.get("name", "")
                 definition = shortcut.get("definition", "")
                 category_lines.append(f"{name} - {definition}")
             category_lines.append("```")
 
             # Check if adding this category would exceed limit
-            potential_length = len("\n".join(current_page_lines + category_lines))
+            block_length = sum(len(line) for line in category_lines) + len(category_lines) - 1
+            potential_length = current_length + 1 + block_length
 
             if potential_length > char_limit and current_page_lines:
                 # Save current page and start new one
@@ -833,8 +981,10 @@ class ShortcutManager:
                 # Start new page with continuation header
                 current_page_lines = [f"**Status Effects (continued - page {len(pages) + 1})**"]
                 current_page_lines.extend(category_lines)
+                current_length = len(current_page_lines[0]) + 1 + block_length
             else:
                 current_page_lines.extend(category_lines)
+                current_length = potential_length
 
         # Don't forget the last page
         if current_page_lines:
@@ -843,7 +993,8 @@ class ShortcutManager:
                 current_page_lines.append(f"\n*Page {len(pages) + 1} of {len(pages) + 1}*")
             pages.append("\n".join(current_page_lines))
 
-        return pages
+        self._formatted_cache[cache_key] = pages
+        return list(pages)
 
     def generate_shortcuts_instructions_for_agent(self) -> str:
         """
@@ -859,13 +1010,8 @@ class ShortcutManager:
         if not commands:
             return ""
 
-        # Group by category for display
-        categories: Dict[str, List[str]] = {}
-        for cmd in commands:
-            category = cmd.get("category", "Other")
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(cmd.get("name", ""))
+        if self._instructions_cache is not None:
+            return self._instructions_cache
 
         instruction_lines = [
             "\nSTATUS EFFECT SYSTEM:",
@@ -875,10 +1021,12 @@ class ShortcutManager:
             "\nAvailable effects by category:"
         ]
 
-        for category, names in sorted(categories.items()):
-            instruction_lines.append(f"  {category}: {', '.join(sorted(names))}")
+        for category, shortcuts in self._display_groups:
+            names = [cmd.get("name", "") for cmd in shortcuts]
+            instruction_lines.append(f"  {category}: {', '.join(names)}")
 
-        return "\n".join(instruction_lines)
+        self._instructions_cache = "\n".join(instruction_lines)
+        return self._instructions_cache
 
 
 # ============================================================================
@@ -943,12 +1091,12 @@ def strip_shortcuts_from_message(message: str, available_agents: Optional[List[s
     Returns:
         Message with shortcut commands removed (and cleaned up whitespace)
     """
-    commands = get_default_manager().load_shortcuts()
     result = message
 
-    for cmd in commands:
-        shortcut_name = cmd.get("name", "")
-        if not shortcut_name or shortcut_name not in result:
+    # Only shortcuts present in the original message can be removed from it
+    for cmd in get_default_manager()._matching_commands(message):
+        shortcut_name = cmd["name"]
+        if shortcut_name not in result:
             continue
 
         # Find the shortcut and figure out what to remove
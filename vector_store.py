@@ -4,12 +4,48 @@ Stores all messages with embeddings for semantic search and retrieval.
 """
 
 import chromadb
-from typing import List, Dict, Optional, Any, Set
+from typing import List, Dict, Optional, Any, Set, Tuple
+import atexit
+import base64
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import heapq
+import threading
 import time
 import logging
-from datetime import datetime
 import uuid
 import re
+from operator import itemgetter
+
+from constants import VectorStoreConfig
+
+# Aho-Corasick automaton for finding sentiment keywords in one pass (optional)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+# NumPy for selecting the newest rows out of large result sets (optional)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# In-process sentence-transformers model for embeddings (optional; otherwise
+# ChromaDB's default embedding function is used)
+try:
+    import torch
+    from chromadb.utils.embedding_functions import SentenceTransformerEmbeddingFunction
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    torch = None
+    SentenceTransformerEmbeddingFunction = None
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +56,167 @@ SKIP_WORDS = {"the", "a", "an"}
 # Doctor title variations (for matching "Dr." and "Doctor")
 DOCTOR_VARIANTS = {"dr.", "dr", "doctor"}
 
+# Below this many rows heapq beats the cost of building a NumPy array
+NUMPY_MIN_ROWS = 32
+
+# Sentiment keywords (matched as lowercase substrings, each counted once)
+POSITIVE_WORDS = ('love', 'great', 'awesome', 'excellent', 'thanks', 'thank you',
+                  'amazing', 'wonderful', 'fantastic', 'perfect', 'good', 'nice',
+                  'appreciate', 'happy', 'glad', 'excited', 'enjoy')
+
+NEGATIVE_WORDS = ('hate', 'terrible', 'awful', 'bad', 'worst', 'horrible',
+                  'disappointed', 'frustrat', 'angry', 'annoying', 'sucks',
+                  'poor', 'useless', 'broken', 'wrong', 'problem', 'issue', 'error')
+
+# Shortest keyword length; anything shorter can't contain one
+SENTIMENT_MIN_CHARS = min(map(len, POSITIVE_WORDS + NEGATIVE_WORDS))
+
+# Only the start of very long messages (pastes, logs) is scanned for sentiment
+SENTIMENT_MAX_SCAN_CHARS = 4096
+
+
+def _build_sentiment_matcher():
+    """
+    Build an Aho-Corasick automaton mapping each sentiment keyword to
+    +1 (positive) or -1 (negative), or None if pyahocorasick isn't installed
+    (_detect_sentiment then falls back to one substring check per keyword).
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for word in POSITIVE_WORDS:
+        automaton.add_word(word, (word, 1))
+    for word in NEGATIVE_WORDS:
+        automaton.add_word(word, (word, -1))
+    automaton.make_automaton()
+    return automaton
+
+
+_SENTIMENT_MATCHER = _build_sentiment_matcher()
+
+
+def _field_reader(fields: Tuple[Tuple[str, Any], ...]):
+    """
+    Build a function returning the values of the given (key, default) fields
+    from a metadata dict as a tuple. Rows written by add_message carry every
+    key, so one C-level itemgetter call covers the common case; rows missing a
+    key (legacy data) fall back to per-key defaults.
+    """
+    keys = tuple(key for key, _ in fields)
+    getter = itemgetter(*keys)
+
+    def read(metadata: Dict[str, Any]) -> Tuple[Any, ...]:
+        try:
+            return getter(metadata)
+        except KeyError:
+            return tuple(metadata.get(key, default) for key, default in fields)
+
+    return read
+
+
+# Metadata fields (with defaults) copied into message/memory results
+_read_message_fields = _field_reader((
+    ("author", "unknown"), ("timestamp", 0), ("importance", 5),
+    ("is_bot", False), ("session_id", "unknown"), ("date", "unknown")
+))
+_read_memory_fields = _field_reader((
+    ("author", "unknown"), ("user_id", "unknown"), ("timestamp", 0),
+    ("importance", 5), ("sentiment", "neutral"), ("date", "unknown")
+))
+
+
+def _newest_indices(timestamps: List[float], n: int) -> List[int]:
+    """
+    Indices of the n largest timestamps, newest first; equal timestamps keep
+    their input order (same result as heapq.nlargest over the indices).
+    Large inputs use an O(N) NumPy partition and only sort the n survivors.
+    """
+    if not NUMPY_AVAILABLE or len(timestamps) < NUMPY_MIN_ROWS:
+        return heapq.nlargest(n, range(len(timestamps)), key=timestamps.__getitem__)
+    if n <= 0:
+        return []
+
+    ts = np.asarray(timestamps, dtype=np.float64)
+    n = min(n, len(ts))
+    kth = np.partition(ts, len(ts) - n)[len(ts) - n]  # n-th largest value
+    above = np.flatnonzero(ts > kth)
+    ties = np.flatnonzero(ts == kth)[:n - len(above)]
+    selected = np.sort(np.concatenate((above, ties)))
+    return selected[np.argsort(-ts[selected], kind="stable")].tolist()
+
+
+def _new_doc_id() -> str:
+    """
+    Random 22-character document ID (url-safe base64 of a uuid4). Author,
+    agent and timestamp already live in metadata, so the ID carries none of them.
+    """
+    return base64.urlsafe_b64encode(uuid.uuid4().bytes).rstrip(b"=").decode("ascii")
+
+
+def _core_memory_rank(memory: Dict[str, Any]) -> Tuple[int, bool]:
+    """Sort key for core memories: importance, then core memories before directives."""
+    return memory["importance"], memory["memory_type"] == "core_memory"
+
+
+@lru_cache(maxsize=1024)
+def _date_parts(minute: int) -> Tuple[str, int]:
+    """
+    Local ("YYYY-MM-DD", hour) for a Unix timestamp bucketed to the minute,
+    so messages arriving in the same minute share one conversion.
+    """
+    local = time.localtime(minute * 60)
+    return time.strftime("%Y-%m-%d", local), local.tm_hour
+
+
+@lru_cache(maxsize=256)
+def _memory_filter(
+    agent_name: Optional[str],
+    min_importance: Optional[int] = None,
+    memory_type: Optional[Any] = None,
+    user_id: Optional[str] = None,
+    author: Optional[str] = None,
+    exclude_session: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Where-filter for the read paths, cached because they ask for the same few
+    combinations every turn. Callers must not mutate the returned dict.
+
+    agent_name scopes reads to that agent's legacy rows plus "global" rows
+    (None = no scoping). memory_type is one type, or a tuple of types to match
+    any of. Time cutoffs change on every call, so they are added
+    with _with_time_cutoff instead of being part of the cache key.
+    """
+    conditions = []
+    if agent_name is not None:
+        conditions.append({"agent_name": {"$in": [agent_name, "global"]}})
+    if isinstance(memory_type, tuple):
+        conditions.append({"memory_type": {"$in": list(memory_type)}})
+    elif memory_type is not None:
+        conditions.append({"memory_type": memory_type})
+    if user_id is not None:
+        conditions.append({"user_id": user_id})
+    if author is not None:
+        conditions.append({"author": author})
+    if exclude_session is not None:
+        conditions.append({"session_id": {"$ne": exclude_session}})
+    if min_importance is not None:
+        conditions.append({"importance": {"$gte": min_importance}})
+
+    return {"$and": conditions} if len(conditions) > 1 else (conditions[0] if conditions else None)
+
+
+def _with_time_cutoff(where_filter: Optional[Dict[str, Any]], time_range_hours: Optional[int]) -> Optional[Dict[str, Any]]:
+    """Add a "within the last N hours" condition to a where-filter (None = all time)."""
+    if time_range_hours is None:
+        return where_filter
+
+    cutoff = {"timestamp": {"$gte": time.time() - (time_range_hours * 3600)}}
+    if where_filter is None:
+        return cutoff
+    conditions = where_filter["$and"] if "$and" in where_filter else [where_filter]
+    return {"$and": [*conditions, cutoff]}
+
 
 def build_name_patterns(name: str) -> List[str]:
     """
@@ -120,6 +317,7 @@ class VectorStore:
     - Time-based filtering
     - Per-agent memory isolation
     - User-specific message retrieval
+    - Batched writes (add_message buffers rows; reads flush them first)
     """
 
     def __init__(self, persist_directory: str = "./data/vector_store"):
@@ -135,14 +333,65 @@ class VectorStore:
         self.client = chromadb.PersistentClient(
             path=persist_directory
         )
+        self._tune_sqlite()
+
+        # One embedding model instance for all writes and queries; a flushed
+        # write batch is encoded in a single forward pass
+        self._embedding_function = self._build_embedding_function()
 
         # Get or create the messages collection
-        self.collection = self.client.get_or_create_collection(
-            name="conversation_messages",
-            metadata={"description": "All conversation messages with importance scoring"}
+        try:
+            self.collection = self.client.get_or_create_collection(
+                name="conversation_messages",
+                metadata={"description": "All conversation messages with importance scoring"},
+                **self._collection_options()
+            )
+        except ValueError as e:
+            # Collection was persisted with a different embedding function
+            logger.warning(f"[VectorStore] Keeping the collection's stored embedding function: {e}")
+            self._embedding_function = None
+            self.collection = self.client.get_or_create_collection(
+                name="conversation_messages",
+                metadata={"description": "All conversation messages with importance scoring"}
+            )
+
+        # Write buffer: add_message appends here and flush() writes the rows
+        # with a single collection.add, so each insert doesn't pay its own
+        # SQLite transaction and embedding call. _pending_lock guards the
+        # buffer; _write_lock serializes flushes so a reader's flush waits for
+        # any batch the writer thread already has in flight.
+        self._pending_docs: List[str] = []
+        self._pending_meta: List[Dict[str, Any]] = []
+        self._pending_ids: List[str] = []
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._write_wake = threading.Event()
+        self._closing = False
+
+        # Row count kept in step with our own adds/deletes; None means it must
+        # be re-read from the collection (collection.count() is a SQL aggregate)
+        self._count_cache: Optional[int] = None
+
+        # get_relevant_context runs its independent reads on this pool
+        self._read_pool = ThreadPoolExecutor(
+            max_workers=VectorStoreConfig.READ_POOL_WORKERS,
+            thread_name_prefix="vector-read"
         )
 
-        logger.info(f"[VectorStore] Initialized with {self.collection.count()} existing messages")
+        # Write-behind: this thread does the buffered writes, so callers of
+        # add_message never wait on ChromaDB/SQLite
+        self._writer = threading.Thread(target=self._writer_loop, name="vector-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+        logger.info(f"[VectorStore] Initialized with {self.total} existing messages")
+
+    @property
+    def total(self) -> int:
+        """Number of messages in the collection, read from ChromaDB only when unknown."""
+        if self._count_cache is None:
+            self._count_cache = self.collection.count()
+        return self._count_cache
 
     def add_message(
         self,
@@ -182,12 +431,81 @@ class VectorStore:
 
         Returns:
             Document ID in the vector store
+
+        The row is buffered and written by the background writer (when the
+        buffer is full or after WRITE_FLUSH_INTERVAL_SECONDS), or earlier by
+        any read, which flushes first.
         """
         if timestamp is None:
             timestamp = time.time()
 
+        # Generate unique ID for this message
+        doc_id = _new_doc_id()
+
+        metadata = self._build_metadata(
+            content, author, agent_name, timestamp, message_id, importance, replied_to_agent,
+            is_bot, session_id, channel_id, user_id, memory_type, sentiment, known_entities
+        )
+        self._enqueue([content], [metadata], [doc_id])
+
+        mentions_info = f", mentions: {metadata['mentioned_entities']}" if "mentioned_entities" in metadata else ""
+        logger.debug(f"[VectorStore] Added {memory_type} from {author} (importance: {importance}, sentiment: {metadata['sentiment']}{mentions_info})")
+        return doc_id
+
+    def add_messages(self, messages: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add several messages at once (session replay, imports).
+
+        Builds every row in one pass and queues them under a single lock, so
+        they reach ChromaDB together on the next flush.
+
+        Args:
+            messages: Dicts with the same keys as add_message's arguments
+
+        Returns:
+            Document IDs, in input order
+        """
+        if not messages:
+            return []
+
+        now = time.time()
+
+        docs, metas, ids = [], [], []
+        for message in messages:
+            if message.get("timestamp") is None:
+                message = {**message, "timestamp": now}
+            metadata = self._build_metadata(**message)
+            docs.append(message["content"])
+            metas.append(metadata)
+            ids.append(_new_doc_id())
+
+        self._enqueue(docs, metas, ids)
+
+        logger.debug(f"[VectorStore] Added {len(ids)} messages in one batch")
+        return ids
+
+    def _build_metadata(
+        self,
+        content: str,
+        author: str,
+        agent_name: str = "global",
+        timestamp: Optional[float] = None,
+        message_id: Optional[int] = None,
+        importance: int = 5,
+        replied_to_agent: Optional[str] = None,
+        is_bot: bool = False,
+        session_id: Optional[str] = None,
+        channel_id: Optional[int] = None,
+        user_id: Optional[str] = None,
+        memory_type: str = "conversation",
+        sentiment: Optional[str] = None,
+        known_entities: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Metadata row for one message; arguments as for add_message (timestamp must be set)."""
+        date_str, hour = _date_parts(int(timestamp // 60))
+
         if session_id is None:
-            session_id = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+            session_id = date_str
 
         # Use author as user_id if not provided
         if user_id is None:
@@ -197,9 +515,6 @@ class VectorStore:
         if sentiment is None:
             sentiment = self._detect_sentiment(content)
 
-        # Generate unique ID for this message
-        doc_id = f"{agent_name}_{timestamp}_{uuid.uuid4().hex[:8]}"
-
         # Build metadata
         metadata = {
             "author": author,
@@ -209,8 +524,8 @@ class VectorStore:
             "importance": min(10, max(1, importance)),  # Clamp to 1-10
             "is_bot": is_bot,
             "session_id": session_id,
-            "date": datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d"),
-            "hour": datetime.fromtimestamp(timestamp).hour,
+            "date": date_str,
+            "hour": hour,
             "memory_type": memory_type,
             "sentiment": sentiment
         }
@@ -231,36 +546,150 @@ class VectorStore:
                 # Store as comma-separated string (ChromaDB metadata must be str/int/float/bool)
                 metadata["mentioned_entities"] = ",".join(mentions)
 
-        # Add to collection (ChromaDB will automatically generate embeddings)
-        self.collection.add(
-            documents=[content],
-            metadatas=[metadata],
-            ids=[doc_id]
-        )
+        return metadata
+
+    def _enqueue(self, docs: List[str], metas: List[Dict[str, Any]], ids: List[str]):
+        """Queue rows for the collection (ChromaDB generates embeddings when the batch is flushed)."""
+        with self._pending_lock:
+            self._pending_docs.extend(docs)
+            self._pending_meta.extend(metas)
+            self._pending_ids.extend(ids)
+            pending = len(self._pending_ids)
+
+        if pending >= VectorStoreConfig.WRITE_BATCH_SIZE:
+            self._write_wake.set()
+
+    def _writer_loop(self):
+        """Background writer: flush whenever woken by a full buffer, or on the interval."""
+        # ChromaDB keeps one SQLite connection per thread; tune this thread's,
+        # which does all the inserts
+        self._tune_sqlite()
+
+        while not self._closing:
+            self._write_wake.wait(VectorStoreConfig.WRITE_FLUSH_INTERVAL_SECONDS)
+            self._write_wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"[VectorStore] Background flush failed: {e}", exc_info=True)
+
+    def _tune_sqlite(self):
+        """
+        Apply VectorStoreConfig's SQLite pragmas to the calling thread's
+        connection in ChromaDB's pool. Relies on ChromaDB internals, so any
+        failure just leaves the defaults in place.
+        """
+        pragmas = (VectorStoreConfig.SQLITE_UNSAFE_PRAGMAS if VectorStoreConfig.SQLITE_UNSAFE_WRITES
+                   else VectorStoreConfig.SQLITE_PRAGMAS)
+        try:
+            from chromadb.db.impl.sqlite import SqliteDB
+            connection = self.client._system.instance(SqliteDB)._conn_pool.connect()
+            for pragma in pragmas:
+                connection.execute(f"PRAGMA {pragma}")
+        except Exception as e:
+            logger.debug(f"[VectorStore] SQLite tuning skipped: {e}")
 
-        mentions_info = f", mentions: {mentions}" if known_entities and mentions else ""
-        logger.debug(f"[VectorStore] Added {memory_type} from {author} (importance: {importance}, sentiment: {sentiment}{mentions_info})")
-        return doc_id
+    @staticmethod
+    def _build_embedding_function():
+        """
+        sentence-transformers embedding function for the configured model
+        (the same model ChromaDB uses by default, so stored vectors stay
+        comparable), placed on the GPU when one is available. None when
+        sentence-transformers isn't installed.
+        """
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            return None
+
+        device = VectorStoreConfig.EMBEDDING_DEVICE
+        if device is None:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+
+        try:
+            embedding_function = SentenceTransformerEmbeddingFunction(
+                model_name=VectorStoreConfig.EMBEDDING_MODEL,
+                device=device,
+                normalize_embeddings=True
+            )
+        except Exception as e:
+            logger.warning(f"[VectorStore] Could not load {VectorStoreConfig.EMBEDDING_MODEL}, using ChromaDB's default embeddings: {e}")
+            return None
+
+        logger.info(f"[VectorStore] Embedding with {VectorStoreConfig.EMBEDDING_MODEL} on {device}")
+        return embedding_function
+
+    def _collection_options(self) -> Dict[str, Any]:
+        """Extra collection arguments (the embedding function, when one is configured)."""
+        if self._embedding_function is None:
+            return {}
+        return {"embedding_function": self._embedding_function}
+
+    def close(self):
+        """Stop the writer thread and read pool, writing any buffered messages first."""
+        self._closing = True
+        self._write_wake.set()
+        self._writer.join()
+        self.flush()
+        self._read_pool.shutdown(wait=True)
+
+    def flush(self) -> int:
+        """
+        Write all buffered messages to the collection in one batch.
+
+        Called by the writer thread and at the top of every read. Holds the
+        write lock for the duration of the write, so a reader that calls
+        flush() sees every message added before it; add_message only takes
+        the buffer lock and isn't held up by the write.
+
+        Returns:
+            Number of messages written
+        """
+        with self._write_lock:
+            with self._pending_lock:
+                if not self._pending_ids:
+                    return 0
+                docs, metas, ids = self._pending_docs, self._pending_meta, self._pending_ids
+                self._pending_docs, self._pending_meta, self._pending_ids = [], [], []
+
+            try:
+                self.collection.add(documents=docs, metadatas=metas, ids=ids)
+                if self._count_cache is not None:
+                    self._count_cache += len(ids)
+                logger.debug(f"[VectorStore] Flushed {len(ids)} buffered messages")
+                return len(ids)
+            except Exception as e:
+                logger.error(f"[VectorStore] Batch write of {len(ids)} messages failed, retrying one by one: {e}")
+
+            # One bad row shouldn't drop the rest of the batch
+            written = 0
+            for doc, metadata, doc_id in zip(docs, metas, ids):
+                try:
+                    self.collection.add(documents=[doc], metadatas=[metadata], ids=[doc_id])
+                    written += 1
+                except Exception as e:
+                    logger.error(f"[VectorStore] Error adding message {doc_id}: {e}", exc_info=True)
+            if self._count_cache is not None:
+                self._count_cache += written
+            return written
 
     def _detect_sentiment(self, content: str) -> str:
         """
         Basic sentiment detection using keyword matching.
         Returns: "positive", "negative", or "neutral"
         """
-        content_lower = content.lower()
-
-        # Positive indicators
-        positive_words = ['love', 'great', 'awesome', 'excellent', 'thanks', 'thank you',
-                         'amazing', 'wonderful', 'fantastic', 'perfect', 'good', 'nice',
-                         'appreciate', 'happy', 'glad', 'excited', 'enjoy']
+        if len(content) < SENTIMENT_MIN_CHARS:
+            return "neutral"
 
-        # Negative indicators
-        negative_words = ['hate', 'terrible', 'awful', 'bad', 'worst', 'horrible',
-                         'disappointed', 'frustrat', 'angry', 'annoying', 'sucks',
-                         'poor', 'useless', 'broken', 'wrong', 'problem', 'issue', 'error']
+        # Lowercase only the part that gets scanned
+        content_lower = content[:SENTIMENT_MAX_SCAN_CHARS].lower()
 
-        positive_count = sum(1 for word in positive_words if word in content_lower)
-        negative_count = sum(1 for word in negative_words if word in content_lower)
+        if _SENTIMENT_MATCHER is not None:
+            # One pass over the text; a keyword counts once however often it appears
+            hits = {hit for _, hit in _SENTIMENT_MATCHER.iter(content_lower)}
+            positive_count = sum(1 for _, polarity in hits if polarity > 0)
+            negative_count = len(hits) - positive_count
+        else:
+            positive_count = sum(1 for word in POSITIVE_WORDS if word in content_lower)
+            negative_count = sum(1 for word in NEGATIVE_WORDS if word in content_lower)
 
         if positive_count > negative_count:
             return "positive"
@@ -294,66 +723,63 @@ class VectorStore:
         Returns:
             List of message dictionaries with content and metadata
         """
-        # Build where filter using $and for ChromaDB compatibility
-        conditions = [
-            {"importance": {"$gte": min_importance}}
-        ]
+        self.flush()
 
         # Filter by agent_name if not "global" (for backwards compatibility with legacy data)
-        # New messages use "global" as agent_name
-        if agent_name != "global":
-            # Query both the specific agent's legacy data AND global data using $in
-            conditions.append({"agent_name": {"$in": [agent_name, "global"]}})
-
-        # Add time filter if specified
-        if time_range_hours is not None:
-            cutoff_time = time.time() - (time_range_hours * 3600)
-            conditions.append({"timestamp": {"$gte": cutoff_time}})
-
-        # Add author filter if specified
-        if author_filter is not None:
-            conditions.append({"author": author_filter})
-
-        # Add session exclusion if specified
-        if exclude_session is not None:
-            conditions.append({"session_id": {"$ne": exclude_session}})
-
-        where_filter = {"$and": conditions} if len(conditions) > 1 else conditions[0]
+        # New messages use "global" as agent_name, so "global" searches everything
+        where_filter = _with_time_cutoff(
+            _memory_filter(
+                None if agent_name == "global" else agent_name,
+                min_importance=min_importance,
+                author=author_filter,
+                exclude_session=exclude_session
+            ),
+            time_range_hours
+        )
 
+        # Only the ChromaDB call can fail in an expected way; keep the
+        # formatting below out of the try block
         try:
-            # Query the collection
             results = self.collection.query(
                 query_texts=[query],
                 n_results=n_results,
-                where=where_filter
+                where=where_filter,
+                include=["documents", "metadatas", "distances"]
             )
-
-            # Format results
-            messages = []
-            if results and results['documents'] and len(results['documents']) > 0:
-                for i, doc in enumerate(results['documents'][0]):
-                    metadata = results['metadatas'][0][i] if results['metadatas'] else {}
-                    distance = results['distances'][0][i] if results['distances'] else None
-
-                    messages.append({
-                        "content": doc,
-                        "author": metadata.get("author", "unknown"),
-                        "timestamp": metadata.get("timestamp", 0),
-                        "importance": metadata.get("importance", 5),
-                        "is_bot": metadata.get("is_bot", False),
-                        "session_id": metadata.get("session_id", "unknown"),
-                        "date": metadata.get("date", "unknown"),
-                        "similarity": 1 - (distance or 0),  # Convert distance to similarity
-                        "replied_to_agent": metadata.get("replied_to_agent")
-                    })
-
-            logger.info(f"[VectorStore] Retrieved {len(messages)} relevant conversation messages for {agent_name} (collection total: {self.collection.count()})")
-            return messages
-
         except Exception as e:
-            logger.error(f"[VectorStore] Error retrieving messages: {e}", exc_info=True)
+            logger.error(f"[VectorStore] Error retrieving messages: {e}")
+            logger.debug("[VectorStore] Read failure traceback:", exc_info=True)
             return []
 
+        # Format results
+        messages = []
+        if results and results['documents'] and len(results['documents']) > 0:
+            # Bind the per-query columns and append once, outside the loop
+            docs = results['documents'][0]
+            metas = results['metadatas'][0] if results['metadatas'] else [None] * len(docs)
+            dists = results['distances'][0] if results['distances'] else [None] * len(docs)
+            append = messages.append
+
+            for doc, metadata, distance in zip(docs, metas, dists):
+                metadata = metadata or {}
+                author, timestamp, importance, is_bot, session_id, date = _read_message_fields(metadata)
+
+                append({
+                    "content": doc,
+                    "author": author,
+                    "timestamp": timestamp,
+                    "importance": importance,
+                    "is_bot": is_bot,
+                    "session_id": session_id,
+                    "date": date,
+                    "similarity": 1 - (distance or 0),  # Convert distance to similarity
+                    "replied_to_agent": metadata.get("replied_to_agent")
+                })
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[VectorStore] Retrieved {len(messages)} relevant conversation messages for {agent_name} (collection total: {self.total})")
+        return messages
+
     def get_high_importance_messages(
         self,
         agent_name: str,
@@ -374,50 +800,50 @@ class VectorStore:
         Returns:
             List of high-importance messages sorted by timestamp (newest first)
         """
-        # Build where filter using $and for ChromaDB compatibility
-        conditions = [
-            {"importance": {"$gte": min_importance}}
-        ]
-
-        # Query both legacy per-agent data and new global data using $in
-        conditions.append({"agent_name": {"$in": [agent_name, "global"]}})
-
-        if time_range_hours is not None:
-            cutoff_time = time.time() - (time_range_hours * 3600)
-            conditions.append({"timestamp": {"$gte": cutoff_time}})
+        self.flush()
 
-        where_filter = {"$and": conditions} if len(conditions) > 1 else conditions[0]
+        # Query both legacy per-agent data and new global data
+        where_filter = _with_time_cutoff(
+            _memory_filter(agent_name, min_importance=min_importance),
+            time_range_hours
+        )
 
         try:
             # Get all matching messages
             results = self.collection.get(
                 where=where_filter,
-                limit=n_results
+                limit=n_results,
+                include=["documents", "metadatas"]
             )
 
             messages = []
             if results and results['documents']:
-                for i, doc in enumerate(results['documents']):
-                    metadata = results['metadatas'][i] if results['metadatas'] else {}
+                docs = results['documents']
+                metas = results['metadatas'] or [{}] * len(docs)
+                append = messages.append
 
-                    messages.append({
+                for doc, metadata in zip(docs, metas):
+                    author, timestamp, importance, is_bot, session_id, date = _read_message_fields(metadata)
+
+                    append({
                         "content": doc,
-                        "author": metadata.get("author", "unknown"),
-                        "timestamp": metadata.get("timestamp", 0),
-                        "importance": metadata.get("importance", 5),
-                        "is_bot": metadata.get("is_bot", False),
-                        "session_id": metadata.get("session_id", "unknown"),
-                        "date": metadata.get("date", "unknown")
+                        "author": author,
+                        "timestamp": timestamp,
+                        "importance": importance,
+                        "is_bot": is_bot,
+                        "session_id": session_id,
+                        "date": date
                     })
 
             # Sort by timestamp (newest first)
-            messages.sort(key=lambda x: x['timestamp'], reverse=True)
+            messages.sort(key=itemgetter('timestamp'), reverse=True)
 
             logger.debug(f"[VectorStore] Retrieved {len(messages)} high-importance messages for {agent_name}")
             return messages
 
         except Exception as e:
-            logger.error(f"[VectorStore] Error retrieving high-importance messages: {e}", exc_info=True)
+            logger.error(f"[VectorStore] Error retrieving high-importance messages: {e}")
+            logger.debug("[VectorStore] Read failure traceback:", exc_info=True)
             return []
 
     def get_user_profile(
@@ -437,26 +863,26 @@ class VectorStore:
         Returns:
             Dictionary with user profile information
         """
-        # Get high-importance messages from/about this user using $and for ChromaDB compatibility
-        where_filter = {
-            "$and": [
-                {"agent_name": {"$in": [agent_name, "global"]}},
-                {"author": user_name},
-                {"importance": {"$gte": min_importance}}
-            ]
-        }
+        self.flush()
+
+        # Get high-importance messages from/about this user
+        where_filter = _memory_filter(agent_name, min_importance=min_importance, author=user_name)
 
         try:
             results = self.collection.get(
                 where=where_filter,
-                limit=20  # Last 20 important messages
+                limit=20,  # Last 20 important messages
+                include=["documents", "metadatas"]
             )
 
             messages = []
             if results and results['documents']:
-                for i, doc in enumerate(results['documents']):
-                    metadata = results['metadatas'][i] if results['metadatas'] else {}
-                    messages.append({
+                docs = results['documents']
+                metas = results['metadatas'] or [{}] * len(docs)
+                append = messages.append
+
+                for doc, metadata in zip(docs, metas):
+                    append({
                         "content": doc,
                         "timestamp": metadata.get("timestamp", 0),
                         "importance": metadata.get("importance", 5),
@@ -464,7 +890,7 @@ class VectorStore:
                     })
 
             # Sort by timestamp (oldest first for chronological profile)
-            messages.sort(key=lambda x: x['timestamp'])
+            messages.sort(key=itemgetter('timestamp'))
 
             return {
                 "user_name": user_name,
@@ -475,16 +901,18 @@ class VectorStore:
             }
 
         except Exception as e:
-            logger.error(f"[VectorStore] Error building user profile: {e}", exc_info=True)
+            logger.error(f"[VectorStore] Error building user profile: {e}")
+            logger.debug("[VectorStore] Read failure traceback:", exc_info=True)
             return {"user_name": user_name, "message_count": 0, "messages": []}
 
     def get_memories_by_type(
         self,
         agent_name: str,
-        memory_type: str,
+        memory_type: Optional[str] = None,
         user_id: Optional[str] = None,
-        n_results: int = 20,
-        min_importance: int = 1
+        n_results: Optional[int] = 20,
+        min_importance: int = 1,
+        memory_types: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Retrieve memories of a specific type.
@@ -493,52 +921,62 @@ class VectorStore:
             agent_name: Which agent is searching
             memory_type: Type of memory - "conversation", "preference", "core_memory", "fact", "directive"
             user_id: Filter by specific user (optional)
-            n_results: Maximum number of results
+            n_results: Maximum number of results (None = all matches)
             min_importance: Minimum importance score
+            memory_types: Match any of these types in one query, instead of memory_type
 
         Returns:
-            List of memories sorted by timestamp (newest first)
+            List of the newest memories sorted by timestamp (newest first)
         """
-        # Build where filter using $and for ChromaDB compatibility
-        conditions = [
-            {"agent_name": {"$in": [agent_name, "global"]}},
-            {"memory_type": memory_type},
-            {"importance": {"$gte": min_importance}}
-        ]
+        self.flush()
 
-        if user_id is not None:
-            conditions.append({"user_id": user_id})
+        if memory_types:
+            memory_type = tuple(memory_types)
+        type_label = "/".join(memory_types) if memory_types else memory_type
 
-        where_filter = {"$and": conditions} if len(conditions) > 1 else conditions[0]
+        where_filter = _memory_filter(
+            agent_name,
+            min_importance=min_importance,
+            memory_type=memory_type,
+            user_id=user_id
+        )
 
         try:
             results = self.collection.get(
-                where=where_filter
+                where=where_filter,
+                include=["documents", "metadatas"]
             )
 
             memories = []
             if results and results['documents']:
-                for i, doc in enumerate(results['documents']):
-                    metadata = results['metadatas'][i] if results['metadatas'] else {}
-                    memories.append({
+                docs = results['documents']
+                metas = results['metadatas'] or [{}] * len(docs)
+
+                # Pick the newest n_results (newest first) before building any result dicts
+                timestamps = [metadata.get("timestamp", 0) for metadata in metas]
+                append = memories.append
+                for i in _newest_indices(timestamps, len(docs) if n_results is None else n_results):
+                    doc = docs[i]
+                    metadata = metas[i]
+                    author, owner_id, timestamp, importance, sentiment, date = _read_memory_fields(metadata)
+                    append({
                         "content": doc,
-                        "author": metadata.get("author", "unknown"),
-                        "user_id": metadata.get("user_id", "unknown"),
-                        "timestamp": metadata.get("timestamp", 0),
-                        "importance": metadata.get("importance", 5),
-                        "sentiment": metadata.get("sentiment", "neutral"),
-                        "date": metadata.get("date", "unknown"),
-                        "message_id": metadata.get("message_id")
+                        "author": author,
+                        "user_id": owner_id,
+                        "timestamp": timestamp,
+                        "importance": importance,
+                        "sentiment": sentiment,
+                        "date": date,
+                        "message_id": metadata.get("message_id"),
+                        "memory_type": metadata.get("memory_type")
                     })
 
-            # Sort by timestamp (newest first)
-            memories.sort(key=lambda x: x['timestamp'], reverse=True)
-
-            logger.debug(f"[VectorStore] Retrieved {len(memories)} {memory_type} memories for {agent_name}")
+            logger.debug(f"[VectorStore] Retrieved {len(memories)} {type_label} memories for {agent_name}")
             return memories
 
         except Exception as e:
-            logger.error(f"[VectorStore] Error retrieving {memory_type} memories: {e}", exc_info=True)
+            logger.error(f"[VectorStore] Error retrieving {type_label} memories: {e}")
+            logger.debug("[VectorStore] Read failure traceback:", exc_info=True)
             return []
 
     def get_user_preferences(
@@ -582,26 +1020,19 @@ class VectorStore:
         Returns:
             List of core memories sorted by importance (highest first)
         """
+        # Core memories and directives in one query; every matching row is
+        # ranked, so an old high-importance directive still beats a newer
+        # importance-7 one
         memories = self.get_memories_by_type(
             agent_name=agent_name,
-            memory_type="core_memory",
-            n_results=n_results,
-            min_importance=7  # Core memories should be high importance
+            n_results=None,
+            min_importance=7,  # Core memories should be high importance
+            memory_types=["core_memory", "directive"]
         )
 
-        # Also get directives
-        directives = self.get_memories_by_type(
-            agent_name=agent_name,
-            memory_type="directive",
-            n_results=n_results,
-            min_importance=7
-        )
-
-        # Combine and sort by importance (highest first)
-        all_memories = memories + directives
-        all_memories.sort(key=lambda x: x['importance'], reverse=True)
-
-        return all_memories[:n_results]
+        # Top n_results by importance (highest first), core memories ahead of
+        # directives at equal importance
+        return heapq.nlargest(n_results, memories, key=_core_memory_rank)
 
     def get_relevant_context(
         self,
@@ -638,8 +1069,14 @@ class VectorStore:
             "user_sentiment": "neutral"
         }
 
+        # Flush once up front; the reads below are independent, so they run
+        # concurrently and the total wait is the slowest one, not the sum
+        self.flush()
+        pool = self._read_pool
+
         # Get relevant conversation messages
-        context["conversation"] = self.retrieve_relevant(
+        conversation_future = pool.submit(
+            self.retrieve_relevant,
             query=query,
             agent_name=agent_name,
             n_results=n_conversation,
@@ -647,40 +1084,36 @@ class VectorStore:
         )
 
         # Get user preferences if requested
+        preferences_future = None
         if include_preferences and user_id:
-            context["preferences"] = self.get_user_preferences(
+            preferences_future = pool.submit(
+                self.get_user_preferences,
                 agent_name=agent_name,
                 user_id=user_id,
                 n_results=n_preferences
             )
 
         # Get core memories if requested
+        core_future = None
         if include_core_memories:
-            context["core_memories"] = self.get_core_memories(
+            core_future = pool.submit(
+                self.get_core_memories,
                 agent_name=agent_name,
                 n_results=n_core
             )
 
         # Calculate overall user sentiment from recent messages
+        sentiment_future = None
         if user_id:
-            recent_user_messages = self.get_memories_by_type(
-                agent_name=agent_name,
-                memory_type="conversation",
-                user_id=user_id,
-                n_results=10
-            )
-
-            if recent_user_messages:
-                sentiments = [msg.get("sentiment", "neutral") for msg in recent_user_messages]
-                positive = sentiments.count("positive")
-                negative = sentiments.count("negative")
+            sentiment_future = pool.submit(self._recent_user_sentiment, agent_name, user_id)
 
-                if positive > negative:
-                    context["user_sentiment"] = "positive"
-                elif negative > positive:
-                    context["user_sentiment"] = "negative"
-                else:
-                    context["user_sentiment"] = "neutral"
+        context["conversation"] = conversation_future.result()
+        if preferences_future is not None:
+            context["preferences"] = preferences_future.result()
+        if core_future is not None:
+            context["core_memories"] = core_future.result()
+        if sentiment_future is not None:
+            context["user_sentiment"] = sentiment_future.result()
 
         logger.debug(f"[VectorStore] Retrieved context for {agent_name}: "
                     f"{len(context['conversation'])} conversations, "
@@ -689,6 +1122,37 @@ class VectorStore:
 
         return context
 
+    def _recent_user_sentiment(self, agent_name: str, user_id: str, n_recent: int = 10) -> str:
+        """
+        Majority sentiment label of the user's n_recent newest conversation
+        messages. Reads only metadata and counts labels in one pass.
+
+        Returns: "positive", "negative", or "neutral"
+        """
+        self.flush()
+
+        where_filter = _memory_filter(agent_name, memory_type="conversation", user_id=user_id)
+
+        try:
+            results = self.collection.get(
+                where=where_filter,
+                include=["metadatas"]
+            )
+        except Exception as e:
+            logger.error(f"[VectorStore] Error retrieving recent sentiment for {user_id}: {e}")
+            logger.debug("[VectorStore] Read failure traceback:", exc_info=True)
+            return "neutral"
+
+        metas = results['metadatas'] or []
+        recent = _newest_indices([m.get("timestamp", 0) for m in metas], n_recent)
+        counts = Counter(metas[i].get("sentiment", "neutral") for i in recent)
+
+        if counts["positive"] > counts["negative"]:
+            return "positive"
+        elif counts["negative"] > counts["positive"]:
+            return "negative"
+        return "neutral"
+
     def add_user_preference(
         self,
         agent_name: str,
@@ -766,6 +1230,8 @@ class VectorStore:
         Returns:
             True if updated successfully, False otherwise
         """
+        self.flush()
+
         try:
             # Find the message in the vector store
             conditions = [
@@ -776,7 +1242,8 @@ class VectorStore:
 
             results = self.collection.get(
                 where=where_filter,
-                limit=1
+                limit=1,
+                include=["metadatas"]
             )
 
             if not results['ids'] or len(results['ids']) == 0:
@@ -805,7 +1272,8 @@ class VectorStore:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the vector store."""
-        total_count = self.collection.count()
+        self.flush()
+        total_count = self.total
 
         return {
             "total_messages": total_count,
@@ -830,32 +1298,26 @@ class VectorStore:
         Returns:
             List of message dictionaries that mention the entity
         """
-        try:
-            # Build base filter - get messages that have mentioned_entities field
-            # ChromaDB doesn't support substring matching, so we filter in Python
-            conditions = []
-
-            # Add time filter if specified
-            if time_range_hours is not None:
-                cutoff_time = time.time() - (time_range_hours * 3600)
-                conditions.append({"timestamp": {"$gte": cutoff_time}})
-
-            where_filter = {"$and": conditions} if len(conditions) > 1 else (conditions[0] if conditions else None)
+        self.flush()
 
+        try:
             # Fetch more results than needed since we'll filter in Python
             results = self.collection.get(
-                where=where_filter,
-                limit=n_results * 10
+                where=self._mention_where(time_range_hours),
+                limit=n_results * 10,
+                include=["documents", "metadatas"]
             )
 
             messages = []
             if results and results['documents']:
-                for i, doc in enumerate(results['documents']):
-                    metadata = results['metadatas'][i] if results['metadatas'] else {}
+                docs = results['documents']
+                metas = results['metadatas'] or [{}] * len(docs)
 
+                for doc, metadata in zip(docs, metas):
                     # Check if entity_name is in mentioned_entities (comma-separated string)
+                    # A substring check rejects most rows before splitting the list
                     mentioned_str = metadata.get("mentioned_entities", "")
-                    if not mentioned_str:
+                    if not mentioned_str or entity_name not in mentioned_str:
                         continue
 
                     mentioned_list = [m.strip() for m in mentioned_str.split(",")]
@@ -876,37 +1338,145 @@ class VectorStore:
                         break
 
             # Sort by timestamp descending (most recent first)
-            messages.sort(key=lambda x: x["timestamp"], reverse=True)
+            messages.sort(key=itemgetter("timestamp"), reverse=True)
 
             logger.debug(f"[VectorStore] Found {len(messages)} messages mentioning {entity_name}")
             return messages[:n_results]
 
         except Exception as e:
-            logger.error(f"[VectorStore] Error getting messages mentioning {entity_name}: {e}", exc_info=True)
+            logger.error(f"[VectorStore] Error getting messages mentioning {entity_name}: {e}")
+            logger.debug("[VectorStore] Read failure traceback:", exc_info=True)
             return []
 
-    def clear_agent_memory(self, agent_name: str):
-        """Clear all messages for a specific agent."""
+    def get_messages_mentioning_many(
+        self,
+        entity_names: List[str],
+        n_results: int = 20,
+        time_range_hours: Optional[int] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get messages mentioning each of several entities with one collection read.
+
+        Returns the same per-entity lists as calling get_messages_mentioning
+        for each name, but scans the fetched rows once for all of them.
+
+        Args:
+            entity_names: The entity names to search for in mentions
+            n_results: Maximum number of results per entity
+            time_range_hours: Only retrieve messages within N hours (None = all time)
+
+        Returns:
+            Dict mapping each entity name to its list of message dictionaries
+        """
+        self.flush()
+
+        found: Dict[str, List[Dict[str, Any]]] = {name: [] for name in entity_names}
         try:
-            # Get all IDs for this agent
             results = self.collection.get(
-                where={"agent_name": agent_name}
+                where=self._mention_where(time_range_hours),
+                limit=n_results * 10,
+                include=["documents", "metadatas"]
             )
 
-            if results and results['ids']:
-                self.collection.delete(ids=results['ids'])
-                logger.info(f"[VectorStore] Cleared {len(results['ids'])} messages for {agent_name}")
+            if results and results['documents']:
+                pending = set(found)
+                docs = results['documents']
+                metas = results['metadatas'] or [{}] * len(docs)
+
+                for doc, metadata in zip(docs, metas):
+                    if not pending:
+                        break
+
+                    mentioned_str = metadata.get("mentioned_entities", "")
+                    if not mentioned_str:
+                        continue
+
+                    mentioned_list = [m.strip() for m in mentioned_str.split(",")]
+                    hits = pending.intersection(mentioned_list)
+                    if not hits:
+                        continue
+
+                    message = {
+                        "content": doc,
+                        "author": metadata.get("author", "unknown"),
+                        "timestamp": metadata.get("timestamp", 0),
+                        "importance": metadata.get("importance", 5),
+                        "sentiment": metadata.get("sentiment", "neutral"),
+                        "mentioned_entities": mentioned_list
+                    }
+                    for name in hits:
+                        found[name].append(message)
+                        # Stop looking for this entity once it has enough results
+                        if len(found[name]) >= n_results:
+                            pending.discard(name)
+
+            # Sort by timestamp descending (most recent first)
+            for messages in found.values():
+                messages.sort(key=itemgetter("timestamp"), reverse=True)
+
+            logger.debug(f"[VectorStore] Found mentions for {len(entity_names)} entities in one read")
+            return found
+
         except Exception as e:
-            logger.error(f"[VectorStore] Error clearing agent memory: {e}", exc_info=True)
+            logger.error(f"[VectorStore] Error getting messages mentioning {entity_names}: {e}")
+            logger.debug("[VectorStore] Read failure traceback:", exc_info=True)
+            return {name: [] for name in entity_names}
+
+    def _mention_where(self, time_range_hours: Optional[int]) -> Optional[Dict[str, Any]]:
+        """
+        Where-filter for mention lookups. ChromaDB doesn't support substring
+        matching on mentioned_entities, so callers filter names in Python.
+        """
+        return _with_time_cutoff(None, time_range_hours)
+
+    def clear_agent_memory(self, agent_name: str):
+        """Clear all messages for a specific agent."""
+        self.flush()
+
+        cleared = 0
+        # Under the write lock so the writer thread's count updates in flush()
+        # can't interleave with ours
+        with self._write_lock:
+            try:
+                # Delete in bounded chunks (IDs only) rather than loading every row at once
+                while True:
+                    results = self.collection.get(
+                        where={"agent_name": agent_name},
+                        limit=VectorStoreConfig.DELETE_BATCH_SIZE,
+                        include=[]
+                    )
+                    if not results or not results['ids']:
+                        break
+
+                    self.collection.delete(ids=results['ids'])
+                    cleared += len(results['ids'])
+
+                if cleared:
+                    logger.info(f"[VectorStore] Cleared {cleared} messages for {agent_name}")
+            except Exception as e:
+                logger.error(f"[VectorStore] Error clearing agent memory: {e}", exc_info=True)
+            finally:
+                if cleared and self._count_cache is not None:
+                    self._count_cache -= cleared
 
     def clear_all(self):
         """Clear all messages from the vector store. USE WITH CAUTION."""
-        try:
-            self.client.delete_collection("conversation_messages")
-            self.collection = self.client.create_collection(
-                name="conversation_messages",
-                metadata={"description": "All conversation messages with importance scoring"}
-            )
-            logger.warning("[VectorStore] Cleared ALL messages from vector store")
-        except Exception as e:
-            logger.error(f"[VectorStore] Error clearing all messages: {e}", exc_info=True)
+        # Drop buffered writes too; they belong to the collection being deleted.
+        # Hold the write lock throughout so a flush can't land in (or count
+        # against) the collection mid-swap.
+        with self._write_lock:
+            with self._pending_lock:
+                self._pending_docs, self._pending_meta, self._pending_ids = [], [], []
+
+            try:
+                self.client.delete_collection("conversation_messages")
+                self.collection = self.client.create_collection(
+                    name="conversation_messages",
+                    metadata={"description": "All conversation messages with importance scoring"},
+                    **self._collection_options()
+                )
+                self._count_cache = 0
+                logger.warning("[VectorStore] Cleared ALL messages from vector store")
+            except Exception as e:
+                logger.error(f"[VectorStore] Error clearing all messages: {e}", exc_info=True)
+                self._count_cache = None